@@ -0,0 +1,17 @@
+from batch_mod.journal import ResultsJournal
+
+from batch_mod.batch import play_game
+from batch_mod.batch import play_games
+from batch_mod.batch import run_batch
+
+from batch_mod.events import TurnEventsListener
+from batch_mod.sqlite_export import SqliteExporter
+from batch_mod.analytics import BuildingWinAggregator
+from batch_mod.sweep import run_sweep
+from batch_mod.compare import Sprt
+from batch_mod.compare import compare_ais
+from batch_mod.paired import run_paired_games
+from batch_mod.rating import GlickoRatings
+from batch_mod.watchdog import MemoryWatchdog
+from batch_mod.metrics_server import BatchMetrics
+from batch_mod.metrics_server import MetricsServer
@@ -0,0 +1,113 @@
+#!/usr/bin/python
+import math
+
+
+def wilson_interval(n_successes: int, n_trials: int, z: float = 1.96):  # -> Tuple[float, float]
+    """Get the Wilson score confidence interval of a proportion (95% by default)."""
+    if n_trials == 0:
+        return 0.0, 1.0
+    p = n_successes / n_trials  # type: float
+    denominator = 1 + z * z / n_trials  # type: float
+    center = (p + z * z / (2 * n_trials)) / denominator  # type: float
+    half_width = z * math.sqrt(p * (1 - p) / n_trials + z * z / (4 * n_trials * n_trials)) / denominator  # type: float
+    return max(0.0, center - half_width), min(1.0, center + half_width)
+
+
+class RunningStats:
+    """Running mean and variance of a stream of values (Welford's algorithm), mergeable."""
+
+    def __init__(self):
+        """Initialization without value."""
+        self.n = 0  # type: int
+        self.mean = 0.0  # type: float
+        self.m2 = 0.0  # type: float # Sum of the squares of the differences with the mean.
+
+    def add(self, value: float) -> None:
+        """Add a value."""
+        self.n += 1
+        delta = value - self.mean  # type: float
+        self.mean += delta / self.n
+        self.m2 += delta * (value - self.mean)
+
+    def merge(self, other) -> None:
+        """Merge the values of another running statistics into this one."""
+        n = self.n + other.n  # type: int
+        if n == 0:
+            return
+        delta = other.mean - self.mean  # type: float
+        self.mean += delta * other.n / n
+        self.m2 += other.m2 + delta * delta * self.n * other.n / n
+        self.n = n
+
+    def get_variance(self) -> float:
+        """Get the (unbiased) variance of the values."""
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    def get_standard_error(self) -> float:
+        """Get the standard error of the mean."""
+        return math.sqrt(self.get_variance() / self.n) if self.n > 0 else 0.0
+
+
+class BuildingWinAggregator:
+    """Streaming aggregator of the win rates of the players owning a building at the end of a game."""
+    """
+    The counts are kept per version, number of players and building: the number of players owning the building at the
+    end of a game and the number of them who won. Players are also counted without condition (building '') in order to
+    compare a win rate with the mean one. The memory only depends on the number of buildings and the aggregators of
+    several processes can be merged.
+    """
+
+    ALL_BUILDINGS = ''  # type: str # Name of the pseudo building owned by all the players.
+
+    def __init__(self):
+        """Initialization of the aggregator without game."""
+        self.counts = dict()  # type: Dict[Tuple[str, int, str], List[int]] # (version, number of players, building) -> [number of players owning it, number of winners among them].
+
+    def add(self, game_summary) -> None:
+        """Add the summary of a game (with its buildings)."""
+        # :param game_summary: # type: Dict[str, Any] # E.g. read from a journal.
+        version_name = game_summary['version']  # type: str
+        n_players = len(game_summary['seats'])  # type: int
+        winners = set(game_summary['winners'])  # type: Set[str]
+        building_names_players = {color_player_name: {BuildingWinAggregator.ALL_BUILDINGS}
+                                  for color_player_name, ai_name in game_summary['seats']}  # type: Dict[str, Set[str]]
+        for color_player_name, building_name in game_summary['buildings']:
+            building_names_players[color_player_name].add(building_name)  # A building is counted once per player.
+        for color_player_name, building_names in building_names_players.items():
+            is_winner = int(color_player_name in winners)  # type: int
+            for building_name in building_names:
+                counts = self.counts.setdefault((version_name, n_players, building_name), [0, 0])  # type: List[int]
+                counts[0] += 1
+                counts[1] += is_winner
+
+    def merge(self, other) -> None:
+        """Merge the counts of another aggregator (e.g. of another process) into this one."""
+        for key, (n_players_owning, n_winners) in other.counts.items():
+            counts = self.counts.setdefault(key, [0, 0])  # type: List[int]
+            counts[0] += n_players_owning
+            counts[1] += n_winners
+
+    def to_dict(self) -> dict:
+        """Get the counts as a JSON serializable dictionary (e.g. to send them to another process)."""
+        return {'counts': [[version_name, n_players, building_name, n_players_owning, n_winners]
+                           for (version_name, n_players, building_name), (n_players_owning, n_winners)
+                           in self.counts.items()]}
+
+    @staticmethod
+    def from_dict(aggregator_dict: dict):  # -> BuildingWinAggregator
+        """Get an aggregator from its dictionary."""
+        aggregator = BuildingWinAggregator()  # type: BuildingWinAggregator
+        for version_name, n_players, building_name, n_players_owning, n_winners in aggregator_dict['counts']:
+            aggregator.counts[(version_name, n_players, building_name)] = [n_players_owning, n_winners]
+        return aggregator
+
+    def get_win_rates(self):  # -> List[Tuple[str, int, str, int, float, float, float, float]]
+        """Get the win rates: version, number of players, building, number of players owning it, win rate, confidence interval and difference with the mean win rate."""
+        win_rates = list()  # type: List[Tuple[str, int, str, int, float, float, float, float]]
+        for (version_name, n_players, building_name), (n_players_owning, n_winners) in sorted(self.counts.items()):
+            n_all_players, n_all_winners = self.counts[(version_name, n_players, BuildingWinAggregator.ALL_BUILDINGS)]
+            win_rate = n_winners / n_players_owning  # type: float
+            ci_low, ci_high = wilson_interval(n_winners, n_players_owning)
+            win_rates.append((version_name, n_players, building_name, n_players_owning, win_rate, ci_low, ci_high,
+                              win_rate - n_all_winners / n_all_players))
+        return win_rates
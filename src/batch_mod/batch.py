@@ -0,0 +1,221 @@
+#!/usr/bin/python
+import collections
+import concurrent.futures
+import concurrent.futures.process
+import os
+import time
+
+from game_mod import *
+from buildings_mod import *
+
+from game_mod.utils import no_display
+from game_mod.timing import GameTimer
+from game_mod.metrics import MetricsRegistry
+from batch_mod.events import TurnEventsListener
+from batch_mod.journal import ResultsJournal
+from batch_mod.metrics_server import BatchMetrics
+from batch_mod.watchdog import MemoryWatchdog
+from batch_mod.watchdog import get_memory_usage
+
+
+loaded_game_elements = dict()  # type: Dict[str, GameElement] # Elements of the game loaded by this process (at most 1 since they are registered in classes).
+
+
+def get_game_element(xml_file_path: str, version_name: str, seats):  # -> GameElement
+    """Get the elements of the game of an XML file, loaded once per process (without display)."""
+    # The elements are loaded again if other elements were loaded since (they are registered in classes e.g. Building).
+    if xml_file_path not in loaded_game_elements or Building.game_element is not loaded_game_elements[xml_file_path]:
+        loaded_game_elements.clear()
+        with no_display():
+            loaded_game_elements[xml_file_path] = GameElement(['batch', xml_file_path, version_name] +
+                                                              get_player_args(seats))
+    return loaded_game_elements[xml_file_path]
+
+
+def get_player_args(seats):  # -> List[str]
+    """Get the arguments of the command for the players from the seats (color and AI name) e.g. ['red=Basic', 'green']."""
+    return [color_player_name + ('=' + ai_name if ai_name else '') for color_player_name, ai_name in seats]
+
+
+def get_game_summary(game) -> dict:
+    """Get the summary of an ended game (JSON serializable)."""
+    return {'seed': game.seed,
+            'version': game.version.name,
+            'seats': [[player.color_player.name, '' if player.is_human() else player.ai_name]
+                      for player in game.players],
+            'tot_n_prestige_pts': game.get_tot_n_prestige_pts_players(),
+            'n_turns': game.n_turns,
+            'winners': [winner.color_player.name for winner in game.winner_players],
+            'buildings': get_owned_building_names(game)}
+
+
+def get_owned_building_names(game):  # -> List[List[str]]
+    """Get the buildings owned by the players at the end of a game: [color of the player, name of the building]."""
+    """
+    They are the buildings along the road owned by a player and, for the beginner version, the prestige buildings.
+    """
+    owned_building_names = [[player.color_player.name, building.name] for player in game.players
+                            for i_road, building in game.road.get_i_road_buildings_of_color_player(player.color_player)]
+    if game.version.is_beginner():
+        owned_building_names.extend([prestige_building.color_player.name, prestige_building.name]
+                                    for prestige_building in game.current_buildings
+                                    if prestige_building.get_building_type() == BuildingType.PRESTIGE
+                                    and prestige_building.color_player is not None)
+    return owned_building_names
+
+
+def play_game(game_task, with_timings: bool = False, with_metrics: bool = False) -> dict:
+    """Play a game of AIs (without display) and get its summary (with the events of each turn, the timings and the metrics if asked)."""
+    # :param game_task: # type: Tuple[str, str, List[Tuple[str, str]], int, bool] # XML file, version, seats, seed and with events.
+    xml_file_path, version_name, seats, seed, with_events = game_task
+    game_element = get_game_element(xml_file_path, version_name, seats)  # type: GameElement
+    version = [version for version in game_element.versions if version.name == version_name][0]  # type: Version
+    color_players = {color_player.name: color_player
+                     for color_player in game_element.color_players}  # type: Dict[str, ColorPlayer]
+    game = Game(game_element, version, [game_element.create_player(color_players[color_player_name], ai_name)
+                                        for color_player_name, ai_name in seats])  # type: Game
+    game_element.game = game  # The buildings (e.g. lawyer, church) refer to the game of the elements.
+    turn_events_listener = TurnEventsListener()  # type: TurnEventsListener
+    if with_events:
+        game.listeners.append(turn_events_listener)
+    game_timer = GameTimer()  # type: GameTimer
+    if with_timings:
+        game_timer.attach(game)
+    metrics_registry = MetricsRegistry()  # type: MetricsRegistry
+    if with_metrics:
+        game.listeners.append(metrics_registry)
+    with no_display():
+        game.setup(seed)
+        game.play()
+    game_summary = get_game_summary(game)  # type: Dict
+    if with_events:
+        game_summary['events'] = turn_events_listener.events
+    if with_timings:
+        game_summary['timings'] = game_timer.to_dict()
+    if with_metrics:
+        game_summary['metrics'] = metrics_registry.snapshot()
+    return game_summary
+
+
+def play_game_in_worker(game_task, with_timings: bool = False,
+                        with_metrics: bool = False):  # -> Tuple[Dict, int, int, float]
+    """Play a game of AIs in a process and get its summary with the memory (bytes), the id and the busy time (seconds) of the process."""
+    time_begin = time.perf_counter()  # type: float
+    game_summary = play_game(game_task, with_timings, with_metrics)  # type: Dict
+    return game_summary, get_memory_usage(), os.getpid(), time.perf_counter() - time_begin
+
+
+def play_games(game_tasks, n_processes: int = None, max_worker_memory: int = None, batch_metrics: BatchMetrics = None,
+               with_timings: bool = False, with_metrics: bool = False):  # -> Iterator[Tuple[Tuple, Dict]]
+    """Play games of AIs over a pool of processes and get their tasks and summaries as soon as they are finished (in any order)."""
+    """
+    The number of games submitted but not finished is bounded, so the memory does not depend on the number of games.
+    Without process (n_processes = 0), the games are played one after the other in this process.
+    Once a process exceeds the memory ceiling (bytes), no more game is submitted to the pool: the games submitted are
+    finished, then the pool is replaced by a new one for the next games. The games lost by a broken pool (e.g. a
+    process killed because out of memory) are suspects: they are played again by the new pool, alone one after the
+    other, before the next games. Only a game breaking a pool while alone is retried (up to twice) then given up.
+    The live metrics of the batch (e.g. to be served) are updated with each game submitted and finished.
+    The summaries have the timings and the metrics of the games if asked (see play_game).
+    """
+    batch_metrics = BatchMetrics() if batch_metrics is None else batch_metrics
+    if n_processes == 0:
+        for game_task in game_tasks:
+            batch_metrics.game_submitted()
+            game_summary, _worker_memory, worker_id, busy_time = play_game_in_worker(game_task, with_timings,
+                                                                                          with_metrics)
+            batch_metrics.game_completed(game_summary, worker_id, busy_time)
+            yield game_task, game_summary
+        return
+    n_processes = os.cpu_count() if n_processes is None else n_processes
+    game_tasks = iter(game_tasks)  # type: Iterator[Tuple]
+    suspect_game_tasks = collections.deque()  # type: Deque[Tuple[Tuple, int]] # Games lost with their numbers of retries.
+    are_game_tasks_exhausted = False  # type: bool
+    while not are_game_tasks_exhausted or suspect_game_tasks:
+        is_pool_retired = False  # type: bool # No more game is submitted to a retired pool.
+        with concurrent.futures.ProcessPoolExecutor(n_processes) as executor:
+            game_task_futures = dict()  # type: Dict[concurrent.futures.Future, Tuple[Tuple, int, bool]] # Games, retries and alone.
+            while True:
+                while not is_pool_retired:
+                    if suspect_game_tasks:
+                        if game_task_futures:
+                            break  # A suspect is played alone.
+                        (game_task, n_retries), is_alone = suspect_game_tasks.popleft(), True
+                    elif len(game_task_futures) < 4 * n_processes:
+                        game_task, n_retries, is_alone = next(game_tasks, None), 0, False
+                        if game_task is None:
+                            are_game_tasks_exhausted = True
+                            break
+                    else:
+                        break
+                    try:
+                        game_task_future = executor.submit(play_game_in_worker, game_task, with_timings,
+                                                           with_metrics)  # type: concurrent.futures.Future
+                        game_task_futures[game_task_future] = game_task, n_retries, is_alone
+                        batch_metrics.game_submitted()
+                    except concurrent.futures.process.BrokenProcessPool:
+                        suspect_game_tasks.append((game_task, n_retries))
+                        is_pool_retired = True
+                if not game_task_futures:
+                    break
+                done_futures, _futures = concurrent.futures.wait(game_task_futures,
+                                                                 return_when=concurrent.futures.FIRST_COMPLETED)
+                for done_future in done_futures:
+                    game_task, n_retries, is_alone = game_task_futures.pop(done_future)
+                    try:
+                        game_summary, worker_memory, worker_id, busy_time = done_future.result()
+                    except concurrent.futures.process.BrokenProcessPool:
+                        batch_metrics.game_lost()
+                        if is_alone:
+                            # The game broke the pool by itself (the other games lost with a pool are not blamed).
+                            if n_retries >= 2:
+                                raise
+                            n_retries += 1
+                        suspect_game_tasks.append((game_task, n_retries))
+                        is_pool_retired = True
+                        continue
+                    batch_metrics.game_completed(game_summary, worker_id, busy_time)
+                    if max_worker_memory is not None and worker_memory > max_worker_memory:
+                        is_pool_retired = True
+                    yield game_task, game_summary
+
+
+def get_seeds_done(journal_file_path: str, first_seed: int, n_games: int) -> bytearray:
+    """Get the seeds of a batch already in a journal (a bit per seed)."""
+    seeds_done = bytearray((n_games + 7) // 8)  # type: bytearray
+    for game_summary in ResultsJournal.read(journal_file_path):
+        i_game = game_summary['seed'] - first_seed  # type: int
+        if 0 <= i_game < n_games:
+            seeds_done[i_game // 8] |= 1 << (i_game % 8)
+    return seeds_done
+
+
+def run_batch(journal_file_path: str, xml_file_path: str, version_name: str, seats, first_seed: int, n_games: int,
+              n_processes: int = None, with_events: bool = False, game_timer: GameTimer = None,
+              with_metrics: bool = False, memory_watchdog: MemoryWatchdog = None,
+              max_worker_memory: int = None, batch_metrics: BatchMetrics = None) -> int:
+    """Play a batch of games of AIs (a game per seed) and write their summaries in a journal; return the number of games played."""
+    """
+    The seeds already in the journal (e.g. before a crash) are skipped, so a batch can be run again to complete it.
+    With a timer, the durations of the phases and of the decisions of all the games are merged into it (they are not
+    written in the journal); the metrics of each game (e.g. its number of candidate actions per decision) are.
+    The memory watchdog is notified of each game; the pool of processes is recycled past the memory ceiling (bytes).
+    The live metrics of the batch (e.g. served by a metrics server) are updated along the batch, all its games queued.
+    """
+    seeds_done = get_seeds_done(journal_file_path, first_seed, n_games)  # type: bytearray
+    batch_metrics = BatchMetrics() if batch_metrics is None else batch_metrics
+    batch_metrics.games_queued(n_games - sum(bin(seeds_byte).count('1') for seeds_byte in seeds_done))
+    game_tasks = ((xml_file_path, version_name, seats, first_seed + i_game, with_events)
+                  for i_game in range(n_games)
+                  if not seeds_done[i_game // 8] & (1 << (i_game % 8)))  # type: Iterator[Tuple]
+    n_games_played = 0  # type: int
+    with ResultsJournal(journal_file_path) as journal:
+        for _game_task, game_summary in play_games(game_tasks, n_processes, max_worker_memory, batch_metrics,
+                                                   with_timings=game_timer is not None, with_metrics=with_metrics):
+            if game_timer is not None:
+                game_timer.merge_dict(game_summary.pop('timings'))
+            journal.write(game_summary)
+            n_games_played += 1
+            if memory_watchdog is not None:
+                memory_watchdog.game_done()
+    return n_games_played
@@ -0,0 +1,90 @@
+#!/usr/bin/python
+import math
+
+from batch_mod.batch import play_games
+
+
+class Sprt:
+    """Two-sided sequential probability ratio test on the score (win: 1, tie: 0.5, loss: 0) of an AI against another one."""
+    """
+    H0: the expected score is p0 (e.g. 0.5, no difference). Two one-sided SPRTs (each with half the error rate alpha)
+    test H0 against a better AI (score p1, e.g. 0.55) and against a worse one (score p0 - (p1 - p0), e.g. 0.45). Their
+    log-likelihood ratios are updated after each game; a side stops as soon as its ratio crosses a bound. The test stops
+    as soon as a side finds the difference significant (the AI is better or worse), or once both sides rule it out.
+    """
+
+    H0 = 'H0'  # type: str # The difference is ruled out.
+    BETTER = 'better'  # type: str # The AI is significantly better.
+    WORSE = 'worse'  # type: str # The AI is significantly worse.
+
+    def __init__(self, p0: float = 0.5, p1: float = 0.55, alpha: float = 0.05, beta: float = 0.05):
+        """Initialization of the test without game."""
+        p1s = [p1, 2 * p0 - p1]  # type: List[float] # Scores of H1 for the better and for the worse AI.
+        if not all(0 < p < 1 for p in [p0] + p1s) or p1 == p0:
+            raise ValueError('Scores p0 and p1 (not equal) with 0 < p0 ± (p1 - p0) < 1 are expected.')
+        self.llr_wins = [math.log(p / p0) for p in p1s]  # type: List[float]
+        self.llr_losses = [math.log((1 - p) / (1 - p0)) for p in p1s]  # type: List[float]
+        self.llr_lower_bound = math.log(beta / (1 - alpha / 2))  # type: float
+        self.llr_upper_bound = math.log((1 - beta) / (alpha / 2))  # type: float
+        self.llrs = [0.0, 0.0]  # type: List[float] # Log-likelihood ratios of the better and of the worse AI.
+        self.are_h1s = [None, None]  # type: List[Optional[bool]] # Whether each side accepted H1 (None while it goes on).
+
+    def add(self, score: float) -> None:
+        """Add the score of a game (a tie counts as half a win and half a loss)."""
+        for i_side in range(2):
+            if self.are_h1s[i_side] is None:
+                self.llrs[i_side] += score * self.llr_wins[i_side] + (1 - score) * self.llr_losses[i_side]
+                if self.llrs[i_side] >= self.llr_upper_bound:
+                    self.are_h1s[i_side] = True
+                elif self.llrs[i_side] <= self.llr_lower_bound:
+                    self.are_h1s[i_side] = False
+
+    def get_decision(self):  # -> Optional[str]
+        """Get the decision: the AI is better or worse, the difference is ruled out or None while the test goes on."""
+        if self.are_h1s[0]:
+            return Sprt.BETTER
+        elif self.are_h1s[1]:
+            return Sprt.WORSE
+        elif self.are_h1s == [False, False]:
+            return Sprt.H0
+        return None
+
+
+def get_score(game_summary, color_player_name: str) -> float:
+    """Get the score of the player of a color in a game: 1 for a win, 0.5 for a tie of 2 players and 0 for a loss."""
+    if color_player_name not in game_summary['winners']:
+        return 0.0
+    return 1 / len(game_summary['winners'])
+
+
+def compare_ais(xml_file_path: str, version_name: str, ai_name: str, other_ai_name: str, max_n_games: int,
+                first_seed: int = 0, color_player_names=('red', 'green'), sprt: Sprt = None,
+                n_processes: int = None) -> dict:
+    """Compare an AI with another one over games of 2 players until the SPRT decides (or the maximum number of games)."""
+    """
+    The AIs swap their seats from a game to the next one. The games are played over a pool of processes; since the
+    length of a game depends on its outcome, the scores are added to the test in the order of the seeds (not in the
+    order the games are finished) so that stopping early does not favour the short games.
+    """
+    if max_n_games < 1:
+        raise ValueError('At least one game is expected.')
+    sprt = Sprt() if sprt is None else sprt
+    game_tasks = ((xml_file_path, version_name,
+                   list(zip(color_player_names, [ai_name, other_ai_name] if i_game % 2 == 0
+                            else [other_ai_name, ai_name])),
+                   first_seed + i_game, False) for i_game in range(max_n_games))  # type: Iterator[Tuple]
+    n_games = 0  # type: int # Games added to the test: the first ones of the seeds.
+    tot_score = 0.0  # type: float
+    scores = dict()  # type: Dict[int, float] # Scores of the games finished but not yet added, indexed by the games.
+    for _game_task, game_summary in play_games(game_tasks, n_processes):
+        i_game = game_summary['seed'] - first_seed  # type: int
+        scores[i_game] = get_score(game_summary, color_player_names[i_game % 2])  # Color of the AI for this game.
+        while n_games in scores and sprt.get_decision() is None:
+            score = scores.pop(n_games)  # type: float
+            sprt.add(score)
+            n_games += 1
+            tot_score += score
+        if sprt.get_decision() is not None:
+            break
+    return {'ai_name': ai_name, 'other_ai_name': other_ai_name, 'n_games': n_games, 'score': tot_score / n_games,
+            'llrs': list(sprt.llrs), 'decision': sprt.get_decision()}
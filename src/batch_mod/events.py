@@ -0,0 +1,39 @@
+#!/usr/bin/python
+
+from game_mod import *
+
+
+class TurnEventsListener(GameListener):
+    """Listener of the events of each turn of a game: placements of workers and constructions of buildings."""
+    """
+    An event is [number of the turn, color of the player, 'worker' or 'construct', name of the building].
+    """
+
+    WORKER = 'worker'  # type: str # A worker of the player is placed on the building.
+    CONSTRUCT = 'construct'  # type: str # The building is constructed by the player (along the road or not).
+
+    def __init__(self):
+        """Initialization of the listener without event."""
+        self.events = list()  # type: List[List]
+        self.road_buildings = None  # type: List[Building] # Buildings along the road at the beginning of the turn.
+        self.available_prestige_buildings = None  # type: List[PrestigeBuilding] # At the beginning of the turn.
+
+    def turn_begin(self, game) -> None:
+        self.road_buildings = game.road.get_buildings()
+        self.available_prestige_buildings = game.get_available_prestige_buildings()
+
+    def phase_end(self, game, phase_numero: int) -> None:
+        if phase_numero == 2:  # End of the actions: the workers are placed.
+            for i_road in game.road.get_i_occupied_slots():
+                self.events.append([game.n_turns, game.road.get_worker(i_road).color_player.name,
+                                    TurnEventsListener.WORKER, game.road.get_effect_building(i_road).name])
+        elif phase_numero == 6:  # End of the turn: the buildings constructed along the road or not (prestige buildings).
+            for i_road, building in enumerate(game.road.get_buildings()):
+                if i_road >= len(self.road_buildings) or building is not self.road_buildings[i_road]:
+                    self.events.append([game.n_turns, building.color_player.name, TurnEventsListener.CONSTRUCT,
+                                        building.name])
+            if game.version.is_beginner():
+                for prestige_building in self.available_prestige_buildings:
+                    if prestige_building.color_player is not None:
+                        self.events.append([game.n_turns, prestige_building.color_player.name,
+                                            TurnEventsListener.CONSTRUCT, prestige_building.name])
@@ -0,0 +1,72 @@
+#!/usr/bin/python
+import json
+import os
+
+
+class ResultsJournal:
+    """Append-only journal of the summaries of the games (one JSON line per game) synchronized periodically on disk."""
+    """
+    A line is written as soon as a game is finished; the journal is synchronized on disk (fsync) every some games, so a
+    crash loses at most these last games. A line truncated by a crash is removed when the journal is reopened.
+    """
+
+    def __init__(self, file_path: str, n_games_between_syncs: int = 100):
+        """Initialization of the journal (opened for appending)."""
+        self.file_path = file_path  # type: str
+        self.n_games_between_syncs = n_games_between_syncs  # type: int
+        self.n_games_not_synced = 0  # type: int
+        self.repair()
+        self.journal_file = open(file_path, 'a', encoding='utf-8')  # type: TextIO
+
+    def repair(self) -> None:
+        """Remove the last line if it is truncated (e.g. by a crash)."""
+        if not os.path.isfile(self.file_path):
+            return
+        with open(self.file_path, 'rb+') as journal_file:
+            n_bytes = journal_file.seek(0, os.SEEK_END)  # type: int
+            i_byte = n_bytes  # type: int # Index just after the last end of line (searched block by block).
+            while i_byte > 0:
+                i_block = max(0, i_byte - 4096)  # type: int
+                journal_file.seek(i_block)
+                i_end_line = journal_file.read(i_byte - i_block).rfind(b'\n')  # type: int
+                if i_end_line >= 0:
+                    i_byte = i_block + i_end_line + 1
+                    break
+                i_byte = i_block
+            if i_byte < n_bytes:
+                journal_file.truncate(i_byte)
+
+    def write(self, game_summary) -> None:
+        """Write the summary of a game at the end of the journal."""
+        # :param game_summary: # type: Dict[str, Any] # JSON serializable.
+        self.journal_file.write(json.dumps(game_summary, separators=(',', ':')) + '\n')
+        self.n_games_not_synced += 1
+        if self.n_games_not_synced >= self.n_games_between_syncs:
+            self.sync()
+
+    def sync(self) -> None:
+        """Synchronize the journal on disk."""
+        self.journal_file.flush()
+        os.fsync(self.journal_file.fileno())
+        self.n_games_not_synced = 0
+
+    def close(self) -> None:
+        """Synchronize and close the journal."""
+        self.sync()
+        self.journal_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @staticmethod
+    def read(file_path: str):  # -> Iterator[Dict[str, Any]]
+        """Read the summaries of the games of a journal one by one (a truncated last line is ignored)."""
+        if not os.path.isfile(file_path):
+            return
+        with open(file_path, 'r', encoding='utf-8') as journal_file:
+            for line in journal_file:
+                if line.endswith('\n'):
+                    yield json.loads(line)
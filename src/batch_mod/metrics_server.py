@@ -0,0 +1,114 @@
+#!/usr/bin/python
+import http.server
+import threading
+import time
+
+
+class BatchMetrics:
+    """Live metrics of a batch (games completed, games per second, mean turns, busy time of the workers, queue depth)."""
+    """
+    The batch updates them (from its thread) while the metrics server reads them (from another thread).
+    The queue depth counts the games of the batch not finished: the games pending (queued but not yet submitted, since
+    only a few games per worker are submitted at once) and the games in flight (submitted but not finished).
+    """
+
+    def __init__(self):
+        """Initialization without game."""
+        self.lock = threading.Lock()  # type: threading.Lock
+        self.time_begin = time.perf_counter()  # type: float
+        self.n_games_completed = 0  # type: int
+        self.n_games_lost = 0  # type: int # Games lost (e.g. by a broken pool) and submitted again.
+        self.tot_n_turns = 0  # type: int
+        self.n_games_pending = 0  # type: int # Games queued but not yet submitted.
+        self.n_games_in_flight = 0  # type: int # Games submitted but not finished.
+        self.worker_busy_times = dict()  # type: Dict[int, float] # Seconds playing games indexed by the process ids of the workers.
+
+    def games_queued(self, n_games: int) -> None:
+        """Notification of games queued to be submitted to the workers (e.g. all the games of a batch)."""
+        with self.lock:
+            self.n_games_pending += n_games
+
+    def game_submitted(self) -> None:
+        """Notification of a game submitted to the workers (queued before or not)."""
+        with self.lock:
+            self.n_games_pending = max(0, self.n_games_pending - 1)
+            self.n_games_in_flight += 1
+
+    def game_completed(self, game_summary: dict, worker_id: int, busy_time: float) -> None:
+        """Notification of a game finished by a worker in some time (seconds)."""
+        with self.lock:
+            self.n_games_in_flight -= 1
+            self.n_games_completed += 1
+            self.tot_n_turns += game_summary['n_turns']
+            self.worker_busy_times[worker_id] = self.worker_busy_times.get(worker_id, 0.0) + busy_time
+
+    def game_lost(self) -> None:
+        """Notification of a game submitted but lost (e.g. by a broken pool of processes); it is submitted again."""
+        with self.lock:
+            self.n_games_in_flight -= 1
+            self.n_games_pending += 1
+            self.n_games_lost += 1
+
+    def txt_prometheus(self) -> str:
+        """Get the text of the metrics (Prometheus text exposition format)."""
+        with self.lock:
+            elapsed_time = time.perf_counter() - self.time_begin  # type: float
+            metrics = [('caylus_games_completed_total', 'counter', 'Games completed.', [('', self.n_games_completed)]),
+                       ('caylus_games_lost_total', 'counter', 'Games lost by a broken pool of workers.',
+                        [('', self.n_games_lost)]),
+                       ('caylus_games_per_second', 'gauge', 'Games completed per second since the beginning.',
+                        [('', self.n_games_completed / elapsed_time if elapsed_time > 0 else 0.0)]),
+                       ('caylus_turns_per_game_mean', 'gauge', 'Mean number of turns of the games completed.',
+                        [('', self.tot_n_turns / self.n_games_completed if self.n_games_completed else 0.0)]),
+                       ('caylus_queue_depth', 'gauge', 'Games not finished: pending or in flight.',
+                        [('', self.n_games_pending + self.n_games_in_flight)]),
+                       ('caylus_games_in_flight', 'gauge', 'Games submitted to the workers but not finished.',
+                        [('', self.n_games_in_flight)]),
+                       ('caylus_worker_busy_seconds_total', 'counter', 'Time spent playing games by each worker.',
+                        [('{worker="' + str(worker_id) + '"}', busy_time)
+                         for worker_id, busy_time in sorted(self.worker_busy_times.items())])
+                       ]  # type: List[Tuple[str, str, str, List[Tuple[str, float]]]]
+        lines = list()  # type: List[str]
+        for name, metric_type, txt_help, samples in metrics:
+            lines.append('# HELP ' + name + ' ' + txt_help)
+            lines.append('# TYPE ' + name + ' ' + metric_type)
+            for labels, value in samples:
+                lines.append(name + labels + ' ' + repr(float(value) if isinstance(value, float) else value))
+        return '\n'.join(lines) + '\n'
+
+
+class MetricsServer:
+    """Local HTTP server of the metrics of a batch (GET /metrics), running in a thread."""
+
+    def __init__(self, batch_metrics: BatchMetrics, port: int = 0, host: str = '127.0.0.1'):
+        """Initialization of the server (not started) listening on a port of the host (0 for any free port)."""
+        class MetricsRequestHandler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = batch_metrics.txt_prometheus().encode('utf-8')  # type: bytes
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass  # No log for each scrape.
+
+        self.http_server = http.server.ThreadingHTTPServer((host, port), MetricsRequestHandler)  # type: http.server.ThreadingHTTPServer
+        self.port = self.http_server.server_address[1]  # type: int
+        self.thread = None  # type: Optional[threading.Thread]
+
+    def __enter__(self):
+        """Start serving the metrics."""
+        self.thread = threading.Thread(target=self.http_server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Stop serving the metrics."""
+        self.http_server.shutdown()
+        self.http_server.server_close()
+        self.thread.join()
@@ -0,0 +1,59 @@
+#!/usr/bin/python
+import itertools
+
+from batch_mod.analytics import RunningStats
+from batch_mod.batch import play_games
+
+
+def get_seat_permutations(ai_names):  # -> List[Tuple[str]]
+    """Get all the distinct assignments of the AIs to the seats (the same AI may be several times)."""
+    return list(dict.fromkeys(itertools.permutations(ai_names)))
+
+
+def get_ai_scores(game_summary):  # -> Dict[str, float]
+    """Get the score of each AI in a game (mean over its seats): 1 / number of winners for a win, 0 for a loss."""
+    seat_scores = dict()  # type: Dict[str, List[float]]
+    for color_player_name, ai_name in game_summary['seats']:
+        seat_scores.setdefault(ai_name, []).append(1 / len(game_summary['winners'])
+                                                   if color_player_name in game_summary['winners'] else 0.0)
+    return {ai_name: sum(scores) / len(scores) for ai_name, scores in seat_scores.items()}
+
+
+def run_paired_games(xml_file_path: str, version_name: str, ai_names, color_player_names, n_groups: int,
+                     first_seed: int = 0, n_processes: int = None):  # -> Dict[str, Dict[str, float]]
+    """Compare AIs with groups of paired games (common random numbers and seat mirroring); return the statistics per AI."""
+    """
+    The games of a group share the same seed, so the same road of neutral buildings and the same initial hands per
+    seat, while the AIs are rotated through all the permutations of the seats (the color follows the seat). The score
+    of an AI for a group is its mean score over the games of the group: the luck of the setup and of the seats cancels
+    out, so the standard error of the paired estimator is compared with the one of the same games seen as independent.
+    """
+    seat_permutations = get_seat_permutations(ai_names)  # type: List[Tuple[str]]
+    game_tasks = ((xml_file_path, version_name, list(zip(color_player_names, seat_permutation)), first_seed + i_group,
+                   False) for i_group in range(n_groups)
+                  for seat_permutation in seat_permutations)  # type: Iterator[Tuple]
+    distinct_ai_names = list(dict.fromkeys(ai_names))  # type: List[str]
+    group_stats = {ai_name: RunningStats() for ai_name in distinct_ai_names}  # type: Dict[str, RunningStats]
+    game_stats = {ai_name: RunningStats() for ai_name in distinct_ai_names}  # type: Dict[str, RunningStats]
+    group_scores = dict()  # type: Dict[int, List[Dict[str, float]]] # Seed -> scores of the games finished of the group (the groups not finished are few).
+    for _game_task, game_summary in play_games(game_tasks, n_processes):
+        ai_scores = get_ai_scores(game_summary)  # type: Dict[str, float]
+        for ai_name, score in ai_scores.items():
+            game_stats[ai_name].add(score)
+        scores = group_scores.setdefault(game_summary['seed'], [])  # type: List[Dict[str, float]]
+        scores.append(ai_scores)
+        if len(scores) == len(seat_permutations):
+            del group_scores[game_summary['seed']]
+            for ai_name in distinct_ai_names:
+                group_stats[ai_name].add(sum(ai_scores[ai_name] for ai_scores in scores) / len(scores))
+    ai_stats = dict()  # type: Dict[str, Dict[str, float]]
+    for ai_name in distinct_ai_names:
+        paired_standard_error = group_stats[ai_name].get_standard_error()  # type: float
+        unpaired_standard_error = game_stats[ai_name].get_standard_error()  # type: float # As if the games were independent.
+        ai_stats[ai_name] = {'n_games': game_stats[ai_name].n,
+                             'score': group_stats[ai_name].mean,
+                             'paired_standard_error': paired_standard_error,
+                             'unpaired_standard_error': unpaired_standard_error,
+                             'variance_reduction': (unpaired_standard_error / paired_standard_error) ** 2
+                             if paired_standard_error > 0 else None}
+    return ai_stats
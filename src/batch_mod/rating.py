@@ -0,0 +1,120 @@
+#!/usr/bin/python
+import itertools
+import json
+import math
+import os
+
+
+class GlickoRatings:
+    """Glicko ratings of AIs updated game by game; a game of several players counts as a game against each opponent."""
+    """
+    Each AI has a rating and a rating deviation (RD, its uncertainty). After a game, each pair of players whose AIs
+    differ is a win, a loss or a draw according to their prestige points; the updates of a game are computed from the
+    ratings before it. The ratings keep the offset of each journal already read, so they are updated incrementally.
+    """
+
+    Q = math.log(10) / 400  # type: float
+    INITIAL_RATING = 1500.0  # type: float
+    INITIAL_RD = 350.0  # type: float
+    MIN_RD = 30.0  # type: float # The uncertainty never vanishes (the AIs or the rules may change).
+
+    def __init__(self):
+        """Initialization without AI."""
+        self.ratings = dict()  # type: Dict[str, List[float]] # AI name -> [rating, RD, number of games].
+        self.journal_offsets = dict()  # type: Dict[str, int] # Journal file -> number of bytes already read.
+
+    def get_rating(self, ai_name: str):  # -> List[float]
+        """Get the rating, the RD and the number of games of an AI (a new AI has the initial rating)."""
+        return self.ratings.setdefault(ai_name, [GlickoRatings.INITIAL_RATING, GlickoRatings.INITIAL_RD, 0])
+
+    @staticmethod
+    def g(rd: float) -> float:
+        """Attenuation of the impact of an opponent according to his/her RD."""
+        return 1 / math.sqrt(1 + 3 * (GlickoRatings.Q * rd / math.pi) ** 2)
+
+    @staticmethod
+    def expected_score(rating: float, other_rating: float, other_rd: float) -> float:
+        """Expected score against an opponent."""
+        return 1 / (1 + 10 ** (-GlickoRatings.g(other_rd) * (rating - other_rating) / 400))
+
+    def update(self, game_summary) -> None:
+        """Update the ratings of the AIs of a game."""
+        # :param game_summary: # type: Dict[str, Any] # E.g. read from a journal.
+        seats = game_summary['seats']  # type: List[List[str]]
+        tot_n_prestige_pts = game_summary['tot_n_prestige_pts']  # type: List[int]
+        sums = dict()  # type: Dict[str, List[float]] # AI name -> [sum of g * (score - expected), sum of g^2 * E * (1 - E)].
+        for i_seat, (_color_player_name, ai_name) in enumerate(seats):
+            rating, rd, _n_games = self.get_rating(ai_name)
+            for i_other_seat, (_other_color_player_name, other_ai_name) in enumerate(seats):
+                if other_ai_name == ai_name:
+                    continue  # An AI against itself gives no information.
+                other_rating, other_rd, _other_n_games = self.get_rating(other_ai_name)
+                score = 1.0 if tot_n_prestige_pts[i_seat] > tot_n_prestige_pts[i_other_seat] else \
+                    0.5 if tot_n_prestige_pts[i_seat] == tot_n_prestige_pts[i_other_seat] else 0.0  # type: float
+                expected_score = GlickoRatings.expected_score(rating, other_rating, other_rd)  # type: float
+                g = GlickoRatings.g(other_rd)  # type: float
+                ai_sums = sums.setdefault(ai_name, [0.0, 0.0])  # type: List[float]
+                ai_sums[0] += g * (score - expected_score)
+                ai_sums[1] += g * g * expected_score * (1 - expected_score)
+        for ai_name, (sum_score_diffs, sum_informations) in sums.items():
+            rating_ai = self.get_rating(ai_name)  # type: List[float]
+            inv_new_rd2 = 1 / rating_ai[1] ** 2 + GlickoRatings.Q ** 2 * sum_informations  # type: float
+            rating_ai[0] += GlickoRatings.Q / inv_new_rd2 * sum_score_diffs
+            rating_ai[1] = max(GlickoRatings.MIN_RD, math.sqrt(1 / inv_new_rd2))
+            rating_ai[2] += 1
+
+    def update_from_journal(self, journal_file_path: str) -> int:
+        """Update the ratings with the games of a journal not read yet; return the number of games read."""
+        n_games = 0  # type: int
+        if not os.path.isfile(journal_file_path):
+            return n_games
+        journal_offset = self.journal_offsets.get(journal_file_path, 0)  # type: int
+        with open(journal_file_path, 'rb') as journal_file:
+            journal_file.seek(journal_offset)
+            for line in journal_file:
+                if not line.endswith(b'\n'):
+                    break  # A game being written: it will be read the next time.
+                self.update(json.loads(line))
+                journal_offset += len(line)
+                n_games += 1
+        self.journal_offsets[journal_file_path] = journal_offset
+        return n_games
+
+    def get_information_gain(self, ai_names) -> float:
+        """Get the expected reduction of the variances (RD^2) of the ratings of the AIs after a game between them."""
+        information_gain = 0.0  # type: float
+        for ai_name in ai_names:
+            rating, rd, _n_games = self.get_rating(ai_name)
+            sum_informations = 0.0  # type: float
+            for other_ai_name in ai_names:
+                if other_ai_name != ai_name:
+                    other_rating, other_rd, _other_n_games = self.get_rating(other_ai_name)
+                    expected_score = GlickoRatings.expected_score(rating, other_rating, other_rd)  # type: float
+                    sum_informations += GlickoRatings.g(other_rd) ** 2 * expected_score * (1 - expected_score)
+            new_rd2 = max(GlickoRatings.MIN_RD ** 2, 1 / (1 / rd ** 2 + GlickoRatings.Q ** 2 * sum_informations))
+            information_gain += rd ** 2 - new_rd2
+        return information_gain
+
+    def propose_matchups(self, ai_names, n_players: int, n_matchups: int = 1):  # -> List[Tuple[str]]
+        """Propose the matchups (sets of distinct AIs) whose next game would reduce the uncertainty the most."""
+        matchups = list(itertools.combinations(sorted(set(ai_names)), n_players))  # type: List[Tuple[str]]
+        matchups.sort(key=lambda matchup: -self.get_information_gain(matchup))
+        return matchups[:n_matchups]
+
+    def save(self, file_path: str) -> None:
+        """Save the ratings into a file (atomically)."""
+        tmp_file_path = file_path + '.tmp'  # type: str
+        with open(tmp_file_path, 'w', encoding='utf-8') as ratings_file:
+            json.dump({'ratings': self.ratings, 'journal_offsets': self.journal_offsets}, ratings_file, indent=1)
+        os.replace(tmp_file_path, file_path)
+
+    @staticmethod
+    def load(file_path: str):  # -> GlickoRatings
+        """Load the ratings from a file (no rating if there is no file)."""
+        ratings = GlickoRatings()  # type: GlickoRatings
+        if os.path.isfile(file_path):
+            with open(file_path, 'r', encoding='utf-8') as ratings_file:
+                ratings_dict = json.load(ratings_file)  # type: Dict
+            ratings.ratings = ratings_dict['ratings']
+            ratings.journal_offsets = ratings_dict['journal_offsets']
+        return ratings
@@ -0,0 +1,88 @@
+#!/usr/bin/python
+import sqlite3
+
+
+class SqliteExporter:
+    """Exporter of the summaries of the games (and the events of their turns) into a SQLite database."""
+    """
+    The rows are buffered and inserted by chunks of games: one transaction per chunk with executemany per table, in WAL
+    mode, so that the exporter keeps up with a batch played over all the cores.
+    Tables: games (one row per game), seats (one row per player of a game) and events (one row per event of a turn).
+    """
+
+    SCHEMA = '''
+        CREATE TABLE IF NOT EXISTS games (
+            id INTEGER PRIMARY KEY, seed INTEGER NOT NULL, version TEXT NOT NULL, n_players INTEGER NOT NULL,
+            n_turns INTEGER NOT NULL);
+        CREATE TABLE IF NOT EXISTS seats (
+            game_id INTEGER NOT NULL REFERENCES games(id), i_seat INTEGER NOT NULL, color TEXT NOT NULL,
+            ai_name TEXT NOT NULL, tot_n_prestige_pts INTEGER NOT NULL, is_winner INTEGER NOT NULL);
+        CREATE TABLE IF NOT EXISTS events (
+            game_id INTEGER NOT NULL REFERENCES games(id), n_turns INTEGER NOT NULL, color TEXT NOT NULL,
+            event TEXT NOT NULL, building TEXT NOT NULL);
+    '''  # type: str
+    INDEXES = '''
+        CREATE INDEX IF NOT EXISTS games_seed ON games(seed);
+        CREATE INDEX IF NOT EXISTS seats_game_id ON seats(game_id);
+        CREATE INDEX IF NOT EXISTS seats_color ON seats(color);
+        CREATE INDEX IF NOT EXISTS seats_ai_name ON seats(ai_name);
+        CREATE INDEX IF NOT EXISTS events_game_id ON events(game_id);
+        CREATE INDEX IF NOT EXISTS events_building ON events(building);
+    '''  # type: str
+
+    def __init__(self, db_file_path: str, n_games_per_chunk: int = 1000):
+        """Initialization of the exporter (the database and its tables are created if needed)."""
+        self.n_games_per_chunk = n_games_per_chunk  # type: int
+        self.connection = sqlite3.connect(db_file_path, isolation_level=None)  # type: sqlite3.Connection # Transactions are explicit.
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.executescript(SqliteExporter.SCHEMA)
+        self.next_game_id = self.connection.execute('SELECT COALESCE(MAX(id), 0) + 1 FROM games').fetchone()[0]  # type: int
+        self.game_rows = list()  # type: List[Tuple]
+        self.seat_rows = list()  # type: List[Tuple]
+        self.event_rows = list()  # type: List[Tuple]
+
+    def export(self, game_summary) -> None:
+        """Export the summary of a game (it is inserted with the chunk)."""
+        # :param game_summary: # type: Dict[str, Any] # E.g. read from a journal.
+        game_id = self.next_game_id  # type: int
+        self.next_game_id += 1
+        self.game_rows.append((game_id, game_summary['seed'], game_summary['version'], len(game_summary['seats']),
+                               game_summary['n_turns']))
+        for i_seat, ((color_player_name, ai_name), tot_n_prestige_pts) in enumerate(
+                zip(game_summary['seats'], game_summary['tot_n_prestige_pts'])):
+            self.seat_rows.append((game_id, i_seat, color_player_name, ai_name, tot_n_prestige_pts,
+                                   int(color_player_name in game_summary['winners'])))
+        for n_turns, color_player_name, event, building_name in game_summary.get('events', []):
+            self.event_rows.append((game_id, n_turns, color_player_name, event, building_name))
+        if len(self.game_rows) >= self.n_games_per_chunk:
+            self.flush()
+
+    def flush(self) -> None:
+        """Insert the buffered chunk in a single transaction."""
+        if not self.game_rows:
+            return
+        self.connection.execute('BEGIN')
+        try:
+            self.connection.executemany('INSERT INTO games VALUES (?, ?, ?, ?, ?)', self.game_rows)
+            self.connection.executemany('INSERT INTO seats VALUES (?, ?, ?, ?, ?, ?)', self.seat_rows)
+            self.connection.executemany('INSERT INTO events VALUES (?, ?, ?, ?, ?)', self.event_rows)
+            self.connection.execute('COMMIT')
+        except BaseException:
+            self.connection.execute('ROLLBACK')
+            raise
+        self.game_rows.clear()
+        self.seat_rows.clear()
+        self.event_rows.clear()
+
+    def close(self) -> None:
+        """Insert the last chunk, create the indexes (cheaper once the rows are inserted) and close the database."""
+        self.flush()
+        self.connection.executescript(SqliteExporter.INDEXES)
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
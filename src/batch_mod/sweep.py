@@ -0,0 +1,130 @@
+#!/usr/bin/python
+import hashlib
+import itertools
+import json
+import math
+import os
+import xml.etree.ElementTree as ET
+
+from batch_mod.batch import play_games
+
+
+def get_grid_variants(grid):  # -> List[Dict[str, str]]
+    """Get all the variants (overrides) of a grid: the cartesian product of the values of the paths."""
+    # :param grid: # type: Dict[str, List[str]] # Path of an element of the XML file (ElementTree syntax) -> values.
+    paths = sorted(grid)  # type: List[str]
+    return [dict(zip(paths, values)) for values in itertools.product(*(grid[path] for path in paths))]
+
+
+def compile_variant(base_xml_file_path: str, overrides, cache_dir_path: str) -> str:
+    """Compile a variant of the XML file (written once in the cache, named by the hash of its content); return its path."""
+    # :param overrides: # type: Dict[str, str] # Path of an element of the XML file (ElementTree syntax) -> new text.
+    # E.g. 'setup/setup_player/n_cards_in_hand', 'phase_income/gain/n_deniers', ".//player_building[name='Lawyer']/cost/n_food_cubes".
+    xml_tree = ET.parse(base_xml_file_path)  # type: ET.ElementTree
+    for path, value in overrides.items():
+        elements = xml_tree.getroot().findall(path)  # type: List[ET.Element]
+        if not elements:
+            raise Exception('The path ' + path + ' of the override is not in the XML file ' + base_xml_file_path + '.')
+        for element in elements:
+            element.text = str(value)
+    xml_bytes = ET.tostring(xml_tree.getroot(), encoding='utf-8')  # type: bytes
+    xml_file_path = os.path.join(cache_dir_path, hashlib.sha256(xml_bytes).hexdigest()[:16] + '.xml')  # type: str
+    if not os.path.isfile(xml_file_path):
+        with open(xml_file_path, 'wb') as xml_file:
+            xml_file.write(xml_bytes)
+    return xml_file_path
+
+
+def get_variant_hash(xml_file_path: str, version_name: str, seats, first_seed: int, n_games: int) -> str:
+    """Get the hash of the simulation of a variant: its XML file (named by its content) and the games to play."""
+    return hashlib.sha256(repr((os.path.basename(xml_file_path), version_name, [tuple(seat) for seat in seats],
+                                first_seed, n_games)).encode()).hexdigest()[:16]
+
+
+class ScoreLengthStats:
+    """Distributions of the scores (prestige points) and of the lengths (turns) of games, and wins per seat."""
+
+    def __init__(self, n_seats: int):
+        """Initialization of the distributions without game."""
+        self.n_games = 0  # type: int
+        self.n_scores = dict()  # type: Dict[int, int] # Prestige points of a player -> number of players.
+        self.n_winner_scores = dict()  # type: Dict[int, int] # Prestige points of a winner -> number of games.
+        self.n_lengths = dict()  # type: Dict[int, int] # Number of turns -> number of games.
+        self.n_wins_seats = [0] * n_seats  # type: List[int]
+
+    def add(self, game_summary) -> None:
+        """Add the summary of a game."""
+        self.n_games += 1
+        for tot_n_prestige_pts in game_summary['tot_n_prestige_pts']:
+            self.n_scores[tot_n_prestige_pts] = self.n_scores.get(tot_n_prestige_pts, 0) + 1
+        max_tot_n_prestige_pts = max(game_summary['tot_n_prestige_pts'])  # type: int
+        self.n_winner_scores[max_tot_n_prestige_pts] = self.n_winner_scores.get(max_tot_n_prestige_pts, 0) + 1
+        self.n_lengths[game_summary['n_turns']] = self.n_lengths.get(game_summary['n_turns'], 0) + 1
+        for i_seat, (color_player_name, ai_name) in enumerate(game_summary['seats']):
+            if color_player_name in game_summary['winners']:
+                self.n_wins_seats[i_seat] += 1
+
+    def to_dict(self) -> dict:
+        """Get the distributions and their statistics as a JSON serializable dictionary."""
+        return {'n_games': self.n_games,
+                'scores': ScoreLengthStats.describe(self.n_scores),
+                'winner_scores': ScoreLengthStats.describe(self.n_winner_scores),
+                'lengths': ScoreLengthStats.describe(self.n_lengths),
+                'win_rates_seats': [n_wins / self.n_games if self.n_games else 0.0 for n_wins in self.n_wins_seats]}
+
+    @staticmethod
+    def describe(n_values) -> dict:
+        """Get the statistics (mean, standard deviation, min, median, max) and the histogram of a distribution."""
+        # :param n_values: # type: Dict[int, int] # Value -> number of occurrences.
+        n = sum(n_values.values())  # type: int
+        if n == 0:
+            return {'n': 0}
+        mean = sum(value * n_value for value, n_value in n_values.items()) / n  # type: float
+        variance = sum(n_value * (value - mean) ** 2 for value, n_value in n_values.items()) / n  # type: float
+        values = sorted(n_values)  # type: List[int]
+        n_cumulated = 0  # type: int
+        median = None  # type: int
+        for value in values:
+            n_cumulated += n_values[value]
+            if 2 * n_cumulated >= n:
+                median = value
+                break
+        return {'n': n, 'mean': mean, 'stdev': math.sqrt(variance), 'min': values[0], 'median': median,
+                'max': values[-1], 'histogram': {str(value): n_values[value] for value in values}}
+
+
+def run_sweep(base_xml_file_path: str, grid, version_name: str, seats, n_games: int, cache_dir_path: str,
+              first_seed: int = 0, n_processes: int = None):  # -> List[Tuple[Dict[str, str], Dict]]
+    """Play the games of all the variants of a grid over a pool of processes; return the overrides and the statistics of each variant."""
+    """
+    The statistics of a variant are cached (by the hash of the variant and of its games), so only the variants which
+    changed are simulated again. The games of all the variants share the same pool of processes.
+    """
+    os.makedirs(cache_dir_path, exist_ok=True)
+    variants = get_grid_variants(grid)  # type: List[Dict[str, str]]
+    variant_hashes = list()  # type: List[str]
+    variant_stats = dict()  # type: Dict[str, Dict]
+    xml_file_paths = dict()  # type: Dict[str, str] # Variant hash -> XML file of the variants to simulate.
+    for overrides in variants:
+        xml_file_path = compile_variant(base_xml_file_path, overrides, cache_dir_path)  # type: str
+        variant_hash = get_variant_hash(xml_file_path, version_name, seats, first_seed, n_games)  # type: str
+        variant_hashes.append(variant_hash)
+        stats_file_path = os.path.join(cache_dir_path, variant_hash + '.json')  # type: str
+        if os.path.isfile(stats_file_path):
+            with open(stats_file_path, 'r', encoding='utf-8') as stats_file:
+                variant_stats[variant_hash] = json.load(stats_file)
+        else:
+            xml_file_paths[variant_hash] = xml_file_path
+    # The games are submitted variant by variant so that a process rarely loads another XML file.
+    game_tasks = ((xml_file_path, version_name, seats, first_seed + i_game, False)
+                  for xml_file_path in dict.fromkeys(xml_file_paths.values())
+                  for i_game in range(n_games))  # type: Iterator[Tuple]
+    stats = {xml_file_path: ScoreLengthStats(len(seats))
+             for xml_file_path in xml_file_paths.values()}  # type: Dict[str, ScoreLengthStats]
+    for game_task, game_summary in play_games(game_tasks, n_processes):
+        stats[game_task[0]].add(game_summary)
+    for variant_hash, xml_file_path in xml_file_paths.items():
+        variant_stats[variant_hash] = stats[xml_file_path].to_dict()
+        with open(os.path.join(cache_dir_path, variant_hash + '.json'), 'w', encoding='utf-8') as stats_file:
+            json.dump(variant_stats[variant_hash], stats_file)
+    return [(overrides, variant_stats[variant_hash]) for overrides, variant_hash in zip(variants, variant_hashes)]
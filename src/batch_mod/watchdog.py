@@ -0,0 +1,81 @@
+#!/usr/bin/python
+import os
+import tracemalloc
+
+
+def get_memory_usage() -> int:
+    """Get the memory used by this process (bytes): its resident set size, or its peak if unknown, or 0 if unknown."""
+    try:
+        with open('/proc/self/statm') as statm_file:
+            return int(statm_file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:  # E.g. Windows.
+        return 0
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss  # Bytes on macOS.
+
+
+class MemoryWatchdog:
+    """Watchdog of the memory of a batch: snapshots of tracemalloc taken periodically and compared with the first one."""
+    """
+    The sites (file and line) where the most memory was allocated since the beginning and is still held are reported,
+    e.g. a registry of a class growing with each game. The games have to be played in the process of the watchdog.
+    """
+
+    def __init__(self, n_games_between_snapshots: int = 100, n_top_sites: int = 10, n_frames: int = 1):
+        """Initialization of a watchdog (not started)."""
+        self.n_games_between_snapshots = n_games_between_snapshots  # type: int
+        self.n_top_sites = n_top_sites  # type: int
+        self.n_frames = n_frames  # type: int # Number of frames of the traceback of each allocation.
+        self.n_games = 0  # type: int
+        self.first_snapshot = None  # type: Optional[tracemalloc.Snapshot]
+        self.reports = list()  # type: List[Tuple[int, int, List[tracemalloc.StatisticDiff]]] # Number of games, traced memory and top growth sites.
+        self.is_tracing_started = False  # type: bool # Whether tracemalloc was started by this watchdog.
+
+    def __enter__(self):
+        """Start tracing the allocations (if not already) and take the first snapshot."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.n_frames)
+            self.is_tracing_started = True
+        self.first_snapshot = self.take_snapshot()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Stop tracing the allocations (if started by this watchdog)."""
+        if self.is_tracing_started:
+            tracemalloc.stop()
+            self.is_tracing_started = False
+
+    @staticmethod
+    def take_snapshot():  # -> tracemalloc.Snapshot
+        """Take a snapshot of the allocations (except the ones of tracemalloc and of the imports)."""
+        return tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, tracemalloc.__file__),
+                                                          tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+                                                          tracemalloc.Filter(False, '<unknown>')])
+
+    def game_done(self) -> None:
+        """Notification of a game played; a snapshot is compared with the first one every so many games."""
+        self.n_games += 1
+        if self.n_games % self.n_games_between_snapshots == 0:
+            self.report()
+
+    def report(self) -> None:
+        """Compare a snapshot with the first one and keep the top growth sites."""
+        statistic_diffs = self.take_snapshot().compare_to(self.first_snapshot, 'lineno')  # type: List[tracemalloc.StatisticDiff]
+        self.reports.append((self.n_games, tracemalloc.get_traced_memory()[0],
+                             [statistic_diff for statistic_diff in statistic_diffs
+                              if statistic_diff.size_diff > 0][:self.n_top_sites]))
+
+    def txt_reports(self) -> str:
+        """Get the text of the reports: the traced memory and the top growth sites after each number of games."""
+        lines = list()  # type: List[str]
+        for n_games, traced_memory, statistic_diffs in self.reports:
+            lines.append('After ' + str(n_games) + ' game(s): ' + str(traced_memory // 1024) + ' KiB traced.')
+            for statistic_diff in statistic_diffs:
+                frame = statistic_diff.traceback[0]  # type: tracemalloc.Frame
+                lines.append('  {}:{}: {:+} KiB ({:+} blocks)'.format(frame.filename, frame.lineno,
+                                                                    statistic_diff.size_diff // 1024,
+                                                                    statistic_diff.count_diff))
+        return '\n'.join(lines)
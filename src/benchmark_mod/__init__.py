@@ -0,0 +1,5 @@
+from benchmark_mod.benchmark import run_benchmarks
+from benchmark_mod.benchmark import time_function
+from benchmark_mod.regression import compare_benchmarks
+from benchmark_mod.regression import txt_comparison
+from benchmark_mod.sampling import SamplingProfiler
@@ -0,0 +1,157 @@
+#!/usr/bin/python
+import platform
+import random
+import statistics
+import sys
+import time
+import xml.etree.ElementTree as ET
+from os import path
+
+from game_mod import *
+from batch_mod import *
+
+from game_mod.utils import no_display
+from batch_mod.batch import get_player_args
+
+
+XML_FILE = path.join(path.dirname(path.abspath(__file__)), '..', '..', 'res',
+                     'game_elements-CaylusMagnaCarta.xml')  # type: str
+SEATS = [('red', 'Basic'), ('green', 'Advanced'), ('orange', 'Basic'), ('blue', 'Advanced')]  # type: List[Tuple[str, str]]
+SEED = 2024  # type: int
+N_TURNS = 5  # type: int # Number of the turn of the mid-game state.
+CALIBRATION = 'calibration'  # type: str # Name of the benchmark of the speed of the machine.
+CALIBRATION_XML = '<elements>' + ''.join('<element name="e{0}" n="{1}"><cost money="{2}"/><cost food="{3}"/></element>'
+                                         .format(i, i % 7, i % 3, i % 5) for i in range(40)) + '</elements>'  # type: str
+
+
+def time_function(function, n_loops: int, n_repeats: int, setup=None):  # -> List[float]
+    """Time a function: the mean time of a call (seconds) over some loops, for each repeat."""
+    # :param setup: # type: Callable[[], None] # Called (untimed) before each call, e.g. to restore a state.
+    times = list()  # type: List[float]
+    for _i_repeat in range(n_repeats):
+        tot_time = 0.0  # type: float
+        for _i_loop in range(n_loops):
+            if setup is not None:
+                setup()
+            time_begin = time.perf_counter()  # type: float
+            function()
+            tot_time += time.perf_counter() - time_begin
+        times.append(tot_time / n_loops)
+    return times
+
+
+class CalibrationElement:
+    """Element (e.g. a building) of the calibration: a name, a number and costs (resource name: quantity)."""
+
+    def __init__(self, name: str, n: int, costs: dict):
+        self.name = name  # type: str
+        self.n = n  # type: int
+        self.costs = costs  # type: Dict[str, int]
+
+    def can_pay(self, resources: dict) -> bool:
+        return all(resources.get(resource_name, 0) >= qty for resource_name, qty in self.costs.items())
+
+    def pay(self, resources: dict) -> None:
+        for resource_name, qty in self.costs.items():
+            resources[resource_name] -= qty
+
+
+def calibrate() -> int:
+    """Fixed work (independent of the game) timed to take the speed of the machine into account."""
+    """
+    It mixes the kinds of work of the game (parsing of XML, objects, attributes, method calls, dictionaries, lists and
+    random draws) so that its time follows the ones of the benchmarks when the speed of the machine changes.
+    """
+    elements = [CalibrationElement(element.get('name'), int(element.get('n')),
+                                   dict((resource_name, int(qty)) for cost in element for resource_name, qty
+                                        in cost.items()))
+                for element in ET.fromstring(CALIBRATION_XML)]  # type: List[CalibrationElement]
+    generator = random.Random(0)  # type: random.Random
+    resources = {'money': 0, 'food': 0}  # type: Dict[str, int]
+    n_paid = 0  # type: int
+    for _i_draw in range(400):
+        element = generator.choice(elements)  # type: CalibrationElement
+        if element.can_pay(resources):
+            element.pay(resources)
+            n_paid += element.n
+        else:
+            resources[generator.choice(['money', 'food'])] += 1
+    return n_paid + len(sorted(elements, key=lambda element: (element.n, element.name)))
+
+
+def load_game_element(version_name: str):  # -> GameElement
+    """Load the elements of the game (without display)."""
+    with no_display():
+        return GameElement(['benchmark', XML_FILE, version_name] + get_player_args(SEATS))
+
+
+def get_mid_game(version_name: str, phase_numero: int):  # -> Game
+    """Get a game of AIs (fixed seed) at the beginning of a phase of a turn of the mid-game."""
+    game = load_game_element(version_name).game  # type: Game
+    with no_display():
+        game.setup(SEED)
+        for _i_turn in range(N_TURNS - 1):
+            game.begin_turn()
+            game.play_phases()
+        game.begin_turn()
+        game.play_phases(1, phase_numero - 1)
+    return game
+
+
+def run_benchmarks(version_name: str = 'Standard', n_repeats: int = 5, scale: float = 1.0) -> dict:
+    """Run all the benchmarks of the hot paths and get their times (seconds per call for each repeat)."""
+    """
+    The scale multiplies the number of loops of each benchmark (e.g. 0.01 for a quick check).
+    """
+    def n_loops(n: int) -> int:
+        return max(1, int(n * scale))
+
+    benchmarks = {CALIBRATION: list()}  # type: Dict[str, List[float]]
+
+    def time_benchmark(name: str, function, n: int, setup=None) -> None:
+        # The calibration is timed before each benchmark so that it samples the speed of the machine all along the run.
+        benchmarks[CALIBRATION].extend(time_function(calibrate, n_loops(10), n_repeats))
+        benchmarks[name] = time_function(function, n_loops(n), n_repeats, setup)
+
+    # Actions phase: possible actions, payments and batches of each player.
+    game = get_mid_game(version_name, 2)  # type: Game
+    actions_phase = game.game_element.phases[2]  # type: Phase
+    castle_phase = game.game_element.phases[5]  # type: Phase
+    player_buildings = [player_building for player in game.players
+                        for player_building in player.deck]  # type: List[PlayerBuilding]
+
+    def possible_actions() -> None:
+        for player in game.players:
+            game.possible_actions(actions_phase, player)
+
+    def resource_all_payments() -> None:
+        for player in game.players:
+            for player_building in player_buildings:
+                player.resource_all_payments(player_building.resource_costs)
+
+    def n_max_batches_to_castle() -> None:
+        for player in game.players:
+            player.n_max_batches_to_castle(castle_phase)
+
+    time_benchmark('Game.possible_actions', possible_actions, 200)
+    time_benchmark('Player.resource_all_payments', resource_all_payments, 20)
+    time_benchmark('Player.n_max_batches_to_castle', n_max_batches_to_castle, 2000)
+    time_benchmark('Game.txt_road', lambda: game.txt_road(True), 200)
+    # Effects phase from the same state (restored before each call).
+    game = get_mid_game(version_name, 4)
+    snapshot = GameSnapshot.take(game)  # type: GameSnapshot
+
+    def play_phase_building_effects() -> None:
+        with no_display():
+            game.play_phase_building_effects()
+
+    time_benchmark('Game.play_phase_building_effects', play_phase_building_effects, 200, lambda: snapshot.restore(game))
+    # Loading of the XML file and full game.
+    time_benchmark('GameElement', lambda: load_game_element(version_name), 10)
+    time_benchmark('full_game', lambda: play_game((XML_FILE, version_name, SEATS, SEED, False)), 5)
+    return {'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'version': version_name,
+            'seed': SEED,
+            'benchmarks': {name: {'times': times, 'min': min(times), 'median': statistics.median(times)}
+                           for name, times in benchmarks.items()}}
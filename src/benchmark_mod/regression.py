@@ -0,0 +1,76 @@
+#!/usr/bin/python
+import functools
+
+from benchmark_mod.benchmark import CALIBRATION
+
+
+THRESHOLD = 0.25  # type: float # Default growth of the median time beyond which a benchmark may regress (25 %).
+
+
+@functools.lru_cache(maxsize=None)
+def get_n_u_statistics(n_xs: int, n_ys: int):  # -> Tuple[int, ...]
+    """Get the numbers of orderings of two samples (without tie) giving each value of the U statistic of Mann-Whitney."""
+    # The U statistic counts the pairs (x, y) where x > y; the largest x is either above all the ys or not.
+    if n_xs == 0 or n_ys == 0:
+        return (1,)
+    ns = [0] * (n_xs * n_ys + 1)  # type: List[int]
+    for u, n in enumerate(get_n_u_statistics(n_xs - 1, n_ys)):
+        ns[u + n_ys] += n
+    for u, n in enumerate(get_n_u_statistics(n_xs, n_ys - 1)):
+        ns[u] += n
+    return tuple(ns)
+
+
+def mann_whitney_p_value(xs, ys) -> float:
+    """Get the (exact, one-sided) p-value of the test of Mann-Whitney that the xs are greater than the ys."""
+    # :param xs: # type: List[float] # E.g. the current times.
+    # :param ys: # type: List[float] # E.g. the times of the baseline.
+    # A tie counts for a half pair; the exact distribution is the one without tie (the times are rarely equal).
+    u = sum(1.0 if x > y else 0.5 if x == y else 0.0 for x in xs for y in ys)  # type: float
+    ns = get_n_u_statistics(len(xs), len(ys))  # type: Tuple[int, ...]
+    return sum(ns[int(u + 0.5):]) / sum(ns)
+
+
+def compare_benchmarks(baseline_results: dict, results: dict, threshold: float = THRESHOLD, alpha: float = 0.05):
+    """Compare the results of the benchmarks with the ones of a baseline; get a row per benchmark."""
+    """
+    A benchmark regresses if its median time grows by more than the threshold (e.g. 0.25 for 25 %) and if its times
+    are significantly greater than the ones of the baseline (test of Mann-Whitney over the repeats).
+    The times are first scaled by the ratio of the calibration medians so that a slower (or busier) machine than the
+    one of the baseline does not look like a regression of every benchmark.
+    A row is (name, median time of the baseline (None if new), median time, ratio, p-value, regresses).
+    """
+    rows = list()  # type: List[Tuple[str, Optional[float], float, Optional[float], Optional[float], bool]]
+    speed = 1.0  # type: float # Speed of the machine relatively to the one of the baseline.
+    if CALIBRATION in results['benchmarks'] and CALIBRATION in baseline_results['benchmarks']:
+        speed = baseline_results['benchmarks'][CALIBRATION]['median'] / results['benchmarks'][CALIBRATION]['median']
+    for name, benchmark in results['benchmarks'].items():
+        baseline_benchmark = baseline_results['benchmarks'].get(name)  # type: Optional[Dict]
+        if name == CALIBRATION:
+            continue
+        if baseline_benchmark is None:
+            rows.append((name, None, benchmark['median'] * speed, None, None, False))
+        else:
+            ratio = benchmark['median'] * speed / baseline_benchmark['median']  # type: float
+            p_value = mann_whitney_p_value([time * speed for time in benchmark['times']],
+                                           baseline_benchmark['times'])  # type: float
+            rows.append((name, baseline_benchmark['median'], benchmark['median'] * speed, ratio, p_value,
+                         ratio > 1 + threshold and p_value < alpha))
+    return rows
+
+
+def txt_comparison(rows) -> str:
+    """Get the text of the report of a comparison of the benchmarks with a baseline."""
+    # The current times are the ones scaled to the speed of the machine of the baseline.
+    lines = ['{:35} {:>14} {:>14} {:>8} {:>8}'.format('Benchmark', 'Baseline (µs)', 'Current (µs)', 'Ratio',
+                                                     'p-value')]  # type: List[str]
+    for name, baseline_median, median, ratio, p_value, regresses in rows:
+        if baseline_median is None:
+            lines.append('{:35} {:>14} {:14.3f} {:>8} {:>8}  new'.format(name, '-', median * 1e6, '-', '-'))
+        else:
+            lines.append('{:35} {:14.3f} {:14.3f} {:8.3f} {:8.4f}{}'.format(name, baseline_median * 1e6, median * 1e6,
+                                                                           ratio, p_value,
+                                                                           '  REGRESSION' if regresses else ''))
+    n_regressions = sum(row[5] for row in rows)  # type: int
+    lines.append('{} regression(s).'.format(n_regressions) if n_regressions else 'No regression.')
+    return '\n'.join(lines)
@@ -0,0 +1,88 @@
+#!/usr/bin/python
+import collections
+import os
+import sys
+import threading
+
+
+class SamplingProfiler:
+    """Profiler sampling the stack of a thread at regular intervals (from another thread) into collapsed stacks."""
+    """
+    Unlike cProfile, the profiled code is not instrumented, so the times of the small functions are not distorted; the
+    stacks are counted as collapsed stacks (e.g. 'main.py:<module>;game.py:play;game.py:play_phases 12') which the
+    flamegraph tools read.
+    """
+
+    def __init__(self, interval: float = 0.001):
+        """Initialization without sample."""
+        # :param interval: # type: float # Seconds between two samples.
+        self.interval = interval  # type: float
+        self.stack_counts = collections.Counter()  # type: Counter[Tuple[str, ...]] # Numbers of samples indexed by the stacks (root first).
+        self.thread_id = None  # type: Optional[int] # Identifier of the profiled thread.
+        self.stop_event = threading.Event()  # type: threading.Event
+        self.sampling_thread = None  # type: Optional[threading.Thread]
+        self.switch_interval = None  # type: Optional[float] # Switch interval of the threads before profiling.
+
+    def __enter__(self):
+        """Start sampling the current thread."""
+        self.thread_id = threading.get_ident()
+        self.stop_event.clear()
+        # The sampling thread has to get the GIL at each interval (5 ms by default) to take a sample.
+        self.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self.switch_interval, self.interval))
+        self.sampling_thread = threading.Thread(target=self.sample_until_stopped, daemon=True)
+        self.sampling_thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Stop sampling."""
+        self.stop_event.set()
+        self.sampling_thread.join()
+        sys.setswitchinterval(self.switch_interval)
+
+    def sample_until_stopped(self) -> None:
+        """Sample the stack of the profiled thread until the profiler is stopped."""
+        while not self.stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stack_counts[self.get_stack(frame)] += 1
+
+    @staticmethod
+    def get_stack(frame):  # -> Tuple[str, ...]
+        """Get the names of the functions of the stack of a frame (root first) e.g. 'game.py:play'."""
+        stack = list()  # type: List[str]
+        while frame is not None:
+            stack.append(os.path.basename(frame.f_code.co_filename) + ':' + frame.f_code.co_name)
+            frame = frame.f_back
+        return tuple(reversed(stack))
+
+    def get_n_samples(self) -> int:
+        """Get the number of samples."""
+        return sum(self.stack_counts.values())
+
+    def txt_collapsed_stacks(self) -> str:
+        """Get the text of the collapsed stacks (a line per stack with its number of samples)."""
+        return ''.join(';'.join(stack) + ' ' + str(n) + '\n' for stack, n in sorted(self.stack_counts.items()))
+
+    def get_function_counts(self):  # -> Dict[str, Tuple[int, int]]
+        """Get the numbers of samples (self, total) indexed by the functions."""
+        self_counts = collections.Counter()  # type: Counter[str] # Samples where the function is running.
+        tot_counts = collections.Counter()  # type: Counter[str] # Samples where the function is in the stack (once even if recursive).
+        for stack, n in self.stack_counts.items():
+            self_counts[stack[-1]] += n
+            for function_name in set(stack):
+                tot_counts[function_name] += n
+        return {function_name: (self_counts[function_name], tot_count)
+                for function_name, tot_count in tot_counts.items()}
+
+    def txt_hot_functions(self, n_functions: int = 30) -> str:
+        """Get the text of a table of the hottest functions (by number of samples where they are running)."""
+        n_samples = max(1, self.get_n_samples())  # type: int
+        function_counts = sorted(self.get_function_counts().items(),
+                                 key=lambda item: item[1], reverse=True)  # type: List[Tuple[str, Tuple[int, int]]]
+        lines = ['{:>8} {:>7} {:>8} {:>7}  {}'.format('Self', 'Self %', 'Total', 'Total %',
+                                                     'Function')]  # type: List[str]
+        for function_name, (self_count, tot_count) in function_counts[:n_functions]:
+            lines.append('{:8} {:7.1f} {:8} {:7.1f}  {}'.format(self_count, 100 * self_count / n_samples, tot_count,
+                                                               100 * tot_count / n_samples, function_name))
+        return '\n'.join(lines)
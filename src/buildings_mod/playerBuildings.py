@@ -13,6 +13,7 @@ from game_mod import *
 from game_mod.utils import indent
 from game_mod.utils import TXT_SEPARATOR
 from game_mod.utils import Location
+from game_mod.utils import ordinal_number
 
 def ColorPlayer():
     pass
@@ -149,12 +150,13 @@ class LawyerPlayerBuilding(PlayerBuilding):
                   ' and can\'t apply the effect because he/she doesn\'t have enough resource as ' +
                   str(qty_cost) + ' ' + resource_cost.name + '(s) required (even by considering wild resource).')
         else:
-            i_road_buildings_on_road = [(i_road, building_worker[0])
-                                        for (i_road, building_worker) in enumerate(self.game_element.game.road)
-                                        if building_worker[0].get_building_type() == BuildingType.PLAYER
-                                        and building_worker[0].color_player.player == player and
-                                        building_worker[0].can_be_a_residential_building
-                                        ]  # type: List[Tuple[PlayerBuilding]]
+            i_road_buildings_on_road = [(i_road, building_on_road)
+                                        for (i_road, building_on_road) in
+                                        self.game_element.game.road.get_i_road_buildings_of_color_player(
+                                            player.color_player)
+                                        if building_on_road.get_building_type() == BuildingType.PLAYER
+                                        and building_on_road.can_be_a_residential_building
+                                        ]  # type: List[Tuple[int, PlayerBuilding]]
             if not i_road_buildings_on_road:
                 print(indent(4) + player.txt_name_money_resources_workers_PPs_deck(True, True, False, False, False) +
                       ' and can\'t apply the effect because he/she has no building to be constructed as a residential building along the road.')
@@ -186,10 +188,8 @@ class LawyerPlayerBuilding(PlayerBuilding):
                           ' building along the road) as a residential building.')
                     for (resource_cost, qty_cost) in resource_costs:
                         player.current_money_resources[resource_cost] += qty_cost
-                    if self.game_element.game.road[i_road][1] is not None:
-                        # Remark: building_to_construct_as_residence is equals to self.game_element.game.road[i_road][0].
-                        self.game_element.game.road[i_road].append(building_to_construct_as_residence)
-                    self.game_element.game.road[i_road][0] = player.get_residence_building()
+                    # Remark: if there is a worker, building_to_construct_as_residence is kept for its effects.
+                    self.game_element.game.road.replace_building(i_road, player.get_residence_building())
                     player.deck[building_to_construct_as_residence] = Location.REPLACED
                     print(indent(4) + 'The road consists in: ' + self.game_element.game.txt_road(False) + '.')
                     print(indent(4) +
@@ -2,6 +2,17 @@ from game_mod.game import Game
 from game_mod.game import GameElement
 from game_mod.game import Version
 
+from game_mod.road import Road
+from game_mod.listener import GameListener
+from game_mod.snapshot import GameSnapshot
+from game_mod.checkpoint import Checkpoint
+from game_mod.checkpoint import Checkpointer
+from game_mod.checkpoint import resume_game
+from game_mod.timing import GameTimer
+from game_mod.trace import ChromeTracer
+from game_mod.metrics import MetricsRegistry
+from game_mod.shared_state import SharedGameState
+
 from game_mod.utils import Location
 from game_mod.utils import ordinal_number
 from game_mod.utils import indent
@@ -0,0 +1,114 @@
+#!/usr/bin/python
+import os
+
+from game_mod.game import Game
+from game_mod.listener import GameListener
+from game_mod.snapshot import GameSnapshot
+from game_mod.utils import read_txt
+from game_mod.utils import read_varint
+from game_mod.utils import write_txt
+from game_mod.utils import write_varint
+
+
+class Checkpoint:
+    """Compact checkpoint of a game between two turns: version, seed, seats and snapshot of the game."""
+    """
+    The snapshot covers the road (buildings, workers), the Provost, the castle, the decks, the money and resources,
+    the passing markers and the first player. The random number generators are reseeded from the seed at the beginning of
+    each turn, so the seed and the number of the turn are their state: a resumed game goes on exactly as the original one.
+    """
+
+    MAGIC = b'CMCK'  # type: bytes
+    FORMAT_VERSION = 1  # type: int
+
+    def __init__(self, version_name: str, seed: int, seats, snapshot: GameSnapshot):
+        """Initialization of a checkpoint."""
+        self.version_name = version_name  # type: str
+        self.seed = seed  # type: int
+        self.seats = seats  # type: List[Tuple[str, str]] # Color and AI name (empty for a human) of each player in the order of the game.
+        self.snapshot = snapshot  # type: GameSnapshot
+
+    @staticmethod
+    def take(game):  # -> Checkpoint
+        """Take a checkpoint of a game (between two turns)."""
+        return Checkpoint(game.version.name, game.seed,
+                          [(player.color_player.name, '' if player.is_human() else player.ai_name)
+                           for player in game.players], GameSnapshot.take(game))
+
+    def to_bytes(self) -> bytes:
+        """Get the binary form of the checkpoint."""
+        buffer = bytearray(Checkpoint.MAGIC)  # type: bytearray
+        write_varint(buffer, Checkpoint.FORMAT_VERSION)
+        write_txt(buffer, self.version_name)
+        write_varint(buffer, self.seed)
+        write_varint(buffer, len(self.seats))
+        for color_player_name, ai_name in self.seats:
+            write_txt(buffer, color_player_name)
+            write_txt(buffer, ai_name)
+        buffer.extend(self.snapshot.to_bytes())
+        return bytes(buffer)
+
+    @staticmethod
+    def from_bytes(data: bytes):  # -> Checkpoint
+        """Get a checkpoint from its binary form."""
+        if data[:len(Checkpoint.MAGIC)] != Checkpoint.MAGIC:
+            raise Exception('The data is not a checkpoint of a game.')
+        format_version, i_data = read_varint(data, len(Checkpoint.MAGIC))
+        if format_version != Checkpoint.FORMAT_VERSION:
+            raise Exception('The format version ' + str(format_version) + ' of the checkpoint is not supported.')
+        version_name, i_data = read_txt(data, i_data)
+        seed, i_data = read_varint(data, i_data)
+        n_seats, i_data = read_varint(data, i_data)
+        seats = list()  # type: List[Tuple[str, str]]
+        for _i_seat in range(n_seats):
+            color_player_name, i_data = read_txt(data, i_data)
+            ai_name, i_data = read_txt(data, i_data)
+            seats.append((color_player_name, ai_name))
+        return Checkpoint(version_name, seed, seats, GameSnapshot.from_bytes(data[i_data:]))
+
+    def save(self, file_path: str) -> None:
+        """Save the checkpoint into a file (atomically: a crash keeps the previous checkpoint)."""
+        tmp_file_path = file_path + '.tmp'  # type: str
+        with open(tmp_file_path, 'wb') as checkpoint_file:
+            checkpoint_file.write(self.to_bytes())
+        os.replace(tmp_file_path, file_path)
+
+    @staticmethod
+    def load(file_path: str):  # -> Checkpoint
+        """Load a checkpoint from a file."""
+        with open(file_path, 'rb') as checkpoint_file:
+            return Checkpoint.from_bytes(checkpoint_file.read())
+
+
+class Checkpointer(GameListener):
+    """Listener saving a checkpoint of a game into a file at its beginning and at the end of each turn."""
+    """The file is deleted at the end of the game, so that a finished game is not resumed (a new game is started)."""
+
+    def __init__(self, file_path: str):
+        """Initialization of the checkpointer."""
+        self.file_path = file_path  # type: str
+
+    def game_begin(self, game) -> None:
+        Checkpoint.take(game).save(self.file_path)
+
+    def phase_end(self, game, phase_numero: int) -> None:
+        if phase_numero == 6:  # End of the turn.
+            Checkpoint.take(game).save(self.file_path)
+
+    def game_end(self, game) -> None:
+        if os.path.isfile(self.file_path):
+            os.remove(self.file_path)
+
+
+def resume_game(game_element, checkpoint: Checkpoint):  # -> Game
+    """Create the game of a checkpoint and set it up from the checkpoint (it is ready to play)."""
+    version = [version for version in game_element.versions
+               if version.name == checkpoint.version_name][0]  # type: Version
+    color_players = {color_player.name: color_player
+                     for color_player in game_element.color_players}  # type: Dict[str, ColorPlayer]
+    players = [game_element.create_player(color_players[color_player_name], ai_name)
+               for color_player_name, ai_name in checkpoint.seats]  # type: List[Player]
+    game = Game(game_element, version, players)  # type: Game
+    game_element.game = game  # The buildings (e.g. lawyer, church) refer to the game of the elements.
+    game.setup(checkpoint.seed, checkpoint.snapshot)
+    return game
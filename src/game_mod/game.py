@@ -17,6 +17,9 @@ from game_mod.utils import indent
 from game_mod.utils import Location
 from game_mod.utils import TXT_SEPARATOR
 from game_mod.utils import ordinal_number
+from game_mod.utils import derive_seed
+from game_mod.road import Road
+from game_mod.listener import GameListener
 
 
 
@@ -49,15 +52,27 @@ class Game:
         self.version = version  # type: Version
         self.players = players  # type: List[Player]
         # Attributes to play a game.
+        self.seed = None  # type: int # Master seed of the game: all the random draws of the game and of the AIs derive from it.
+        self.random = None  # type: random.Random # Random number generator of the game (e.g. to shuffle the buildings).
         self.n_players = None  # type: int
         self.current_buildings = None  # type: List[Building]  # Buildings used for the game.
-        self.road = None  # type: List[List[Building, Optional[Player], Optional[Building]]] # Remark: Tuple becomes List because it does not support item assignment. # Buildings and workers on the road. # Remark. : the optional building corresponds to the case there is a worker on a player building which becomes a résidence player buiding (and perhaps a prestige building during the same round or later); in such case, the primary and secondary effects have to be applied on the player building.
+        self.road = None  # type: Road # Buildings and workers on the road.
         self.i_provost = None  # type: int # Index of the Provost in the road; None (instead of -1) for the standard version.
         self.passing_marker_players = None  # type: List[Player]
         self.i_first_player = None  # type: int # Index of the first player among the players.
+        self.n_turns = None  # type: int # Number of the current turn (0 before the first turn).
+        self.listeners = list()  # type: List[GameListener] # Listeners notified of the progress of the game.
+        self.winner_players = None  # type: List[Player] # Winners once the game is ended.
 
-    def setup(self) -> None:
-        """Setup of the game."""
+    def setup(self, seed: int = None, snapshot=None) -> None:
+        """Setup of the game; the same seed gives the same game (for the same decisions of the human players)."""
+        """
+        With a snapshot (taken between two turns of a game set up with the same seed), the game is resumed from it:
+        no player is asked to discard his/her hand.
+        """
+        # Setup the random number generator of the game.
+        self.seed = random.SystemRandom().getrandbits(64) if seed is None else seed
+        self.random = random.Random(derive_seed(self.seed, 'game'))
         # Setup the number of players.
         self.n_players = len(self.players)
         # Reinitialize the color of the player for all the prestige buildings.
@@ -81,13 +96,13 @@ class Game:
                             if neutral_buiding != self.game_element.last_neutral_building
                             and (neutral_buiding.belongs_to_beginner_version or not self.version.is_beginner())
                             ]  # type: List[NeutralBuilding]
-        random.shuffle(neutral_buidings)
-        self.road = [[neutral_building, None] for neutral_building in
-                     neutral_buidings[:self.game_element.n_all_except_last_neutral_buildings[self.n_players]]] + \
-                    [[self.game_element.last_neutral_building, None]]
-        self.current_buildings.extend(building_worker[0] for building_worker in self.road)
+        self.random.shuffle(neutral_buidings)
+        self.road = Road(self.game_element, self.players,
+                         neutral_buidings[:self.game_element.n_all_except_last_neutral_buildings[self.n_players]] +
+                         [self.game_element.last_neutral_building])
+        self.current_buildings.extend(self.road.get_buildings())
         # Setup the Provost.
-        self.i_provost = ([building_worker[0] for building_worker in self.road].index(self.game_element.place_provost)
+        self.i_provost = (self.road.get_buildings().index(self.game_element.place_provost)
                           if not self.version.is_beginner() else None)
         # Setup the castle.
         for castle_part in self.game_element.castle:
@@ -97,13 +112,17 @@ class Game:
         # Reinitialize the player for each color of the players.
         for color_player in ColorPlayer.colors_players.values():
             color_player.player = None
-        # Setup the first player.
+        # Setup the first player and the turns.
         self.i_first_player = 0
+        self.n_turns = 0
+        self.winner_players = None
         # Setup the players (excepted their decks).
         for player in self.players:
-            player.setup()
+            player.setup(random.Random(derive_seed(self.seed, 'player', player.color_player.name)))
         # Setup the decks (cards into: pile, hand, discard) of the players and the buildings.
-        for player in self.players:
+        for i_player, player in enumerate(self.players):
+            # The initial hands of a seat only depend on the seed (e.g. for games with the same setup but other players).
+            deck_random = random.Random(derive_seed(self.seed, 'deck', i_player))  # type: random.Random
             # Initialize the deck with all player buildings.
             player.deck = {player_building: Location.PILE for player_building in self.game_element.buildings
                            if player_building.get_building_type() == BuildingType.PLAYER
@@ -116,43 +135,75 @@ class Game:
             # Add the deck to buildings.
             self.current_buildings.extend(player.deck.keys())
             # Set the hand. The player can discard the hand for a new one.
-            self.setup_player_buildings_from_pile_to_hand(player, self.game_element.n_cards_in_hand)
+            self.setup_player_buildings_from_pile_to_hand(player, self.game_element.n_cards_in_hand, deck_random)
             n_possibilities_to_discard_cards = self.game_element.n_possibilities_to_discard_cards  # type: int
-            while n_possibilities_to_discard_cards > 0 and player.choose_discard_hand_for_new():
+            while snapshot is None and n_possibilities_to_discard_cards > 0 and player.choose_discard_hand_for_new():
                 player.move_all_buildings_from_to_location(Location.HAND, Location.DISCARD)
-                self.setup_player_buildings_from_pile_to_hand(player, self.game_element.n_cards_in_hand)
+                self.setup_player_buildings_from_pile_to_hand(player, self.game_element.n_cards_in_hand, deck_random)
                 n_possibilities_to_discard_cards -= 1
-        # Display the deck of the human player just before the start of the game.
-        [player for player in self.players if player.is_human()][0].print_buildings_by_location(0)
+        # Resume the game from the snapshot.
+        if snapshot is not None:
+            snapshot.restore(self)
+        # Display the deck of the human player (if any) just before the start of the game.
+        for player in self.players:
+            if player.is_human():
+                player.print_buildings_by_location(0)
         # End of the setup for a game.
         print('Setup for a game: ' +
               'version "' + self.version.name + '", ' +
+              'seed ' + str(self.seed) + ', ' +
               str(len(self.current_buildings)) + ' buildings for the game, ' +
               str(len(self.road)) + ' buildings on the road, ' +
               str(len(self.players)) + ' players.')
 
-    def setup_player_buildings_from_pile_to_hand(self, player: Player, n_cards_pile_to_hand: int) -> None:
-        """Setup of the game for the player buildings of a player moving from the pile to the hand."""
+    def setup_player_buildings_from_pile_to_hand(self, player: Player, n_cards_pile_to_hand: int,
+                                                 random_generator: random.Random = None) -> None:
+        """Setup of the game for the player buildings of a player moving from the pile to the hand (shuffled by the random number generator of the game by default)."""
         player_buildings_pile = player.get_player_buildings_by_location(Location.PILE)  # type: List[PlayerBuilding]
-        random.shuffle(player_buildings_pile)
+        (self.random if random_generator is None else random_generator).shuffle(player_buildings_pile)
         for player_building in player_buildings_pile[:n_cards_pile_to_hand]:
             player.deck[player_building] = Location.HAND
 
     def play(self) -> None:
         """Play one game."""
         print('The game starts.')
-        n_turns = 0  # type: int # Number of turns.
+        for listener in self.listeners:
+            listener.game_begin(self)
         while not self.game_ended():
-            n_turns += 1
-            self.print_turn_begin(n_turns)
-            self.play_phase_income()
-            self.play_phase_actions()
-            self.play_phase_provost_movements()
-            self.play_phase_building_effects()
-            self.play_phase_castle()
-            self.play_phase_end_turn()
-        self.winners()
-        self.ask_for_replay()
+            self.begin_turn()
+            self.play_phases()
+        self.winner_players = self.winners()
+        for listener in self.listeners:
+            listener.game_end(self)
+        if any(player.is_human() for player in self.players):
+            self.ask_for_replay()
+
+    def begin_turn(self) -> None:
+        """Begin a new turn: the random number generators are reseeded for this turn."""
+        self.n_turns += 1
+        self.reseed()
+        self.print_turn_begin(self.n_turns)
+        for listener in self.listeners:
+            listener.turn_begin(self)
+
+    def reseed(self) -> None:
+        """Reseed the random number generators of the game and of the players for the current turn."""
+        # A turn only depends on the seed, on its number and on the state of the game at its beginning (e.g. for a snapshot).
+        self.random.seed(derive_seed(self.seed, 'game', self.n_turns))
+        for player in self.players:
+            player.random.seed(derive_seed(self.seed, 'player', player.color_player.name, self.n_turns))
+
+    def play_phases(self, first_phase_numero: int = 1, last_phase_numero: int = 6) -> None:
+        """Play the phases of the current turn (all the phases by default)."""
+        play_phase_methods = [self.play_phase_income, self.play_phase_actions, self.play_phase_provost_movements,
+                              self.play_phase_building_effects, self.play_phase_castle,
+                              self.play_phase_end_turn]  # type: List[Callable[[], None]] # Indexed by the numero of the phase - 1.
+        for phase_numero in range(first_phase_numero, last_phase_numero + 1):
+            for listener in self.listeners:
+                listener.phase_begin(self, phase_numero)
+            play_phase_methods[phase_numero - 1]()
+            for listener in self.listeners:
+                listener.phase_end(self, phase_numero)
     
 
     
@@ -190,8 +241,8 @@ class Game:
             # Deniers for residential player buildings and hotel prestige building on the road.
             print(indent(2) + 'The road consists in: ' + self.txt_road(False) + '.')
             if not self.version.is_beginner():
-                for building_worker in self.road:
-                    building_worker[0].income_effect(income_phase)
+                for building in self.road.get_buildings():
+                    building.income_effect(income_phase)
             # Display the players.
             print(indent(2) + 'Players (according to the order in the game):')
             for player in self.players:
@@ -275,6 +326,13 @@ class Game:
                     else:
                         i_current_turn_players += 1
 
+    def building_all_payments(self, player: Player, building):  # -> List[Dict[Resource, int]]
+        """Get all possible payments of resources of a player to construct a building (measured if the player is)."""
+        resource_all_payments = player.resource_all_payments(building.resource_costs)  # type: List[Dict[Resource, int]]
+        if player.metrics is not None:
+            player.metrics.observe_payment_alternatives(building.name, len(resource_all_payments))
+        return resource_all_payments
+
     def possible_actions(self, actions_phase: Phase, player: Player):  # -> List[[Action, str, "parameters"]]
         """List all the possible actions of the player. The list must contain passing action."""
         possible_actions = [[Action.PASSING, Action.PASSING.txt + '.']]  # type: List[List[Action, str, ...]]
@@ -294,16 +352,15 @@ class Game:
         # Action: Place a worker on a building.
         if player.current_money_resources[Money.money] + actions_phase.n_deniers_to_place_a_worker >= 0 \
                 and player.current_n_workers + actions_phase.n_workers >= 0:
-            for i_road, building_worker in enumerate(self.road):
-                if building_worker[0].allows_to_place_a_worker and building_worker[1] is None:
-                    possible_actions.append([Action.PLACE_WORKER_ON_BUILDING,
-                                             Action.PLACE_WORKER_ON_BUILDING.txt + ' namely a ' +
-                                             building_worker[0].txt_name_owner(True) + ' which is the ' +
-                                             ordinal_number(i_road + 1) + ' building along the road.',
-                                             i_road])
+            for i_road in self.road.i_free_slots:
+                possible_actions.append([Action.PLACE_WORKER_ON_BUILDING,
+                                         Action.PLACE_WORKER_ON_BUILDING.txt + ' namely a ' +
+                                         self.road.get_building(i_road).txt_name_owner(True) + ' which is the ' +
+                                         ordinal_number(i_road + 1) + ' building along the road.',
+                                         i_road])
         # Action: Construct a building from your hand.
         for player_building in player.get_player_buildings_by_location(Location.HAND):
-            for resource_payments in player.resource_all_payments(player_building.resource_costs):
+            for resource_payments in self.building_all_payments(player, player_building):
                 possible_actions.append([Action.CONSTRUCT_BUILDING_FROM_HAND,
                                          Action.CONSTRUCT_BUILDING_FROM_HAND.txt + ' namely a ' +
                                          player_building.name + ' added at the end of the road by consuming ' +
@@ -315,7 +372,7 @@ class Game:
         # Action: Construct a prestige building.
         if self.version.is_beginner():
             for prestige_building in self.get_available_prestige_buildings():
-                for resource_payments in player.resource_all_payments(prestige_building.resource_costs):
+                for resource_payments in self.building_all_payments(player, prestige_building):
                     possible_actions.append([Action.CONSTRUCT_PRESTIGE_BUILDING_BEGINNER,
                                              Action.CONSTRUCT_PRESTIGE_BUILDING_BEGINNER.txt + ' namely a ' +
                                              prestige_building.name + ' by consuming ' +
@@ -326,14 +383,13 @@ class Game:
                                              prestige_building,
                                              resource_payments])
         else:
-            for i_road, building_worker in enumerate(self.road):
-                # Is it a background player building (that is a residential building, the only buildings which can be a prestige building) and is it owned by the player?
-                if building_worker[0].can_be_a_prestige_building \
-                        and building_worker[0].color_player == player.color_player:
+            for i_road, building in self.road.get_i_road_buildings_of_color_player(player.color_player):
+                # Is it a background player building (that is a residential building, the only buildings which can be a prestige building) owned by the player?
+                if building.can_be_a_prestige_building:
                     # The player chooses a prestige building among those that are still available.
                     for prestige_building in self.get_available_prestige_buildings():
                         # The player pays the cost of the prestige building.
-                        for resource_payments in player.resource_all_payments(prestige_building.resource_costs):
+                        for resource_payments in self.building_all_payments(player, prestige_building):
                             possible_actions.append([Action.CONSTRUCT_PRESTIGE_BUILDING_STANDARD,
                                                      Action.CONSTRUCT_PRESTIGE_BUILDING_STANDARD.txt + ' namely a ' +
                                                      prestige_building.name +
@@ -383,13 +439,13 @@ class Game:
             player.current_money_resources[Money.money] += actions_phase.n_deniers_to_place_a_worker
             player.current_n_workers += actions_phase.n_workers
             i_road = player_action_chosen[2]  # type: int
-            self.road[i_road][1] = player
+            self.road.place_worker(i_road, player)
             print(indent(3) + 'The new road consists in: ' + self.txt_road(False) + '.')
         elif action_chosen == Action.CONSTRUCT_BUILDING_FROM_HAND:
             # Action: Construct a building from your hand.
             player_building = player_action_chosen[2]  # type: PlayerBuilding
             player.deck[player_building] = Location.ROAD
-            self.road.append([player_building, None])
+            self.road.append_building(player_building)
             resource_payments = player_action_chosen[3]  # type: Dict[Resource, int]
             for resource, qty in resource_payments.items():
                 player.current_money_resources[resource] += qty
@@ -411,7 +467,7 @@ class Game:
             i_road = player_action_chosen[2]  # type: int
             prestige_building = player_action_chosen[3]  # type: PrestigeBuilding
             prestige_building.color_player = player.color_player
-            self.road[i_road][0] = prestige_building  # Replace the residential building by the prestige building.
+            self.road.replace_building(i_road, prestige_building)  # Replace the residential building by the prestige building.
             resource_payments = player_action_chosen[4]  # type: Dict[Resource, int]
             for resource, qty in resource_payments.items():
                 player.current_money_resources[resource] += qty
@@ -475,6 +531,16 @@ class Game:
                             player.current_money_resources[Money.money] += abs(n_provost_movement) * \
                                                                            provost_movement_phase.n_deniers_per_a_provost_movement
 
+    def notify_effect_begin(self, building: Building, effect_method_name: str) -> None:
+        """Notify the listeners of the beginning of the application of an effect of a building."""
+        for listener in self.listeners:
+            listener.effect_begin(self, building, effect_method_name)
+
+    def notify_effect_end(self, building: Building, effect_method_name: str) -> None:
+        """Notify the listeners of the end of the application of an effect of a building."""
+        for listener in self.listeners:
+            listener.effect_end(self, building, effect_method_name)
+
     def play_phase_building_effects(self) -> None:
         """
         [Standard version] Buildings are activated in order, starting at the beginning of the road, up to and including the building card the Provost is now occupying.
@@ -496,37 +562,39 @@ class Game:
         if effects_building_phase.belongs_to_beginner_version or not self.version.is_beginner():
             if not self.version.is_beginner():
                 print(indent(2) + self.txt_provost_owner_building() + '.')
-            for i_road, building_worker in enumerate(self.road):
+            # Only the slots where there is a worker are considered, up to and including the Provost for the effects.
+            i_road_last_effect = len(self.road) - 1 if self.version.is_beginner() else self.i_provost  # type: int
+            for i_road in self.road.get_i_occupied_slots(i_road_last_effect):
                 # Retrieve the worker of a player.
-                worker = building_worker[1]  # type: Player
+                worker = self.road.get_worker(i_road)  # type: Player
                 # Display the building to apply along the road.
                 print(indent(2) + 'Apply the ' + ordinal_number(i_road + 1) + ' building along the road: ' +
-                      self.txt_one_building_worker_road(self.road[i_road], False) + '.')
-                # Retrieve the building.
-                building = None  # type: Building
-                if len(building_worker) == 2:
-                    # building_worker := Tuple[(neutral or player) building, worker]
-                    building = building_worker[0]
-                else:
-                    # building_worker := Tuple[(background player or prestige) building, worker, (neutral or player) building]
-                    building = building_worker[2]
-                    self.road[i_road] = self.road[i_road][:2]  # Remove (the 3rd that is) the last element.
+                      self.txt_one_building_worker_road(i_road, False) + '.')
+                # Retrieve the building: the (neutral or player) building, or the replaced one if it became a residential building.
+                building = self.road.get_effect_building(i_road)  # type: Building
                 # Apply eventually the effect(s).
-                if worker is not None:
-                    if self.version.is_beginner() or i_road <= self.i_provost:
-                        building.apply_primary_effect(worker)
-                        if building.get_building_type() == BuildingType.PLAYER:
-                            if worker != building.color_player.player:
-                                building.apply_secondary_effect()
-                            else:
-                                print(indent(3) +
-                                      'We can\'t apply the secondary effect of the building because the worker is placed on one of his/her own building and already took advantage of the building\'s primary effect.')
+                self.notify_effect_begin(building, 'apply_primary_effect')
+                building.apply_primary_effect(worker)
+                self.notify_effect_end(building, 'apply_primary_effect')
+                if building.get_building_type() == BuildingType.PLAYER:
+                    if worker != building.color_player.player:
+                        self.notify_effect_begin(building, 'apply_secondary_effect')
+                        building.apply_secondary_effect()
+                        self.notify_effect_end(building, 'apply_secondary_effect')
                     else:
                         print(indent(3) +
-                              'The worker in the building can\'t apply the effect because he/she is beyond the Provost\'s current location.')
-                    # The worker goes from the road to the player.
-                    self.road[i_road][1] = None
-                    worker.current_n_workers += 1
+                              'We can\'t apply the secondary effect of the building because the worker is placed on one of his/her own building and already took advantage of the building\'s primary effect.')
+                # The worker goes from the road to the player (the replaced building is removed from the road).
+                self.road.remove_worker(i_road)
+                worker.current_n_workers += 1
+            # The remaining workers are beyond the Provost's current location.
+            for i_road in self.road.get_i_occupied_slots():
+                print(indent(2) + 'Apply the ' + ordinal_number(i_road + 1) + ' building along the road: ' +
+                      self.txt_one_building_worker_road(i_road, False) + '.')
+                print(indent(3) +
+                      'The worker in the building can\'t apply the effect because he/she is beyond the Provost\'s current location.')
+                # The worker goes from the road to the player.
+                self.road.remove_worker(i_road).current_n_workers += 1
 
     def play_phase_castle(self) -> None:
         """
@@ -613,7 +681,7 @@ class Game:
                 self.i_first_player += 1
             print(indent(2) + 'The new first player is ' + self.players[self.i_first_player].name() + '.')
 
-    def winners(self) -> None:
+    def winners(self):  # -> List[Player]
         """The player with the most prestige points is the winner. There is no tie-breaker."""
         # Display the players.
         print(indent(0) + 'Players (according to the order in the game):')
@@ -621,20 +689,22 @@ class Game:
             print(indent(1) + player.txt_name_money_resources_workers_PPs_deck(True, True, False, True, True) + '.')
         # Display the road.
         print(indent(0) + 'The road consists in: ' + self.txt_road(True) + '.')
-        # We don't use a dictionary in order to keep the order of self.players.
-        tot_n_prestige_pts_players = [player.tot_n_prestige_pts([building_worker[0] for building_worker in self.road
-                                                                 if building_worker[0].get_building_type() in [
-                                                                     BuildingType.BACKGROUND, BuildingType.PLAYER,
-                                                                     BuildingType.PRESTIGE]
-                                                                 and building_worker[0].color_player.player == player])
-                                      for player in self.players]  # type: List[int]
+        tot_n_prestige_pts_players = self.get_tot_n_prestige_pts_players()  # type: List[int]
         print('The number of prestige points of players are: ' +
               TXT_SEPARATOR.join(str(tot_n_prestige_pts_players[i_player]) + ' for ' + self.players[i_player].name()
                                  for i_player in range(self.n_players)) + '.')
         max_tot_n_prestige_pts = max(tot_n_prestige_pts_players)
-        print('The winner(s) is(are): ' +
-              TXT_SEPARATOR.join(self.players[i_player].name() for i_player in range(self.n_players)
-                                 if tot_n_prestige_pts_players[i_player] == max_tot_n_prestige_pts) + '.')
+        winners = [self.players[i_player] for i_player in range(self.n_players)
+                   if tot_n_prestige_pts_players[i_player] == max_tot_n_prestige_pts]  # type: List[Player]
+        print('The winner(s) is(are): ' + TXT_SEPARATOR.join(winner.name() for winner in winners) + '.')
+        return winners
+
+    def get_tot_n_prestige_pts_players(self):  # -> List[int]
+        """Get the total number of prestige points of each player (according to the order in the game)."""
+        # We don't use a dictionary in order to keep the order of self.players.
+        return [player.tot_n_prestige_pts([building for i_road, building in
+                                           self.road.get_i_road_buildings_of_color_player(player.color_player)])
+                for player in self.players]
 
     def print_turn_begin(self, n_turns: int) -> None:
         """Print the beginning of a turn."""
@@ -663,17 +733,20 @@ class Game:
 
     def txt_road(self, with_prestige_points: bool) -> str:
         """Get the text of the road with the prestige points."""
-        return TXT_SEPARATOR.join(self.txt_one_building_worker_road(building_worker, with_prestige_points)
-                                  for building_worker in self.road)
+        return TXT_SEPARATOR.join(self.txt_one_building_worker_road(i_road, with_prestige_points)
+                                  for i_road in range(len(self.road)))
 
-    def txt_one_building_worker_road(self, building_worker, with_prestige_points: bool) -> str:
+    def txt_one_building_worker_road(self, i_road: int, with_prestige_points: bool) -> str:
         """Get the text of one building and worker on the road with the prestige points."""
-        return (building_worker[0].txt_name_owner(True)
-                if len(building_worker) == 2 else building_worker[2].txt_name_owner(True) + ' constructed as a ' +
-                                                  building_worker[0].txt_name_owner(True)) + \
-               (' where is a worker ' + building_worker[1].name() if building_worker[1] is not None else '') + \
-               (' giving ' + str(building_worker[0].n_prestige_pts) + ' prestige point(s)'
-                if with_prestige_points and building_worker[0].n_prestige_pts > 0 else '')
+        building = self.road.get_building(i_road)  # type: Building
+        replaced_building = self.road.get_replaced_building(i_road)  # type: Optional[Building]
+        worker = self.road.get_worker(i_road)  # type: Optional[Player]
+        return (building.txt_name_owner(True)
+                if replaced_building is None else replaced_building.txt_name_owner(True) + ' constructed as a ' +
+                                                  building.txt_name_owner(True)) + \
+               (' where is a worker ' + worker.name() if worker is not None else '') + \
+               (' giving ' + str(building.n_prestige_pts) + ' prestige point(s)'
+                if with_prestige_points and building.n_prestige_pts > 0 else '')
 
     def get_available_prestige_buildings(self):  # -> List[PrestigeBuilding]
         """Get the available prestige buildings."""
@@ -690,7 +763,7 @@ class Game:
     def txt_provost_owner_building(self) -> str:
         """Get the text of the Provost location in the building with its owner (a player)."""
         return 'The Provost is in the ' + ordinal_number(self.i_provost + 1) + ' building along the road, namely ' + \
-               self.road[self.i_provost][0].txt_name_owner(True)
+               self.road.get_building(self.i_provost).txt_name_owner(True)
 
     def get_remaining_n_castle_tokens(self) -> int:
         """Get the remaining number of tokens in the castle."""
@@ -725,8 +798,8 @@ class GameElement:
 
     TXT_IS_NOT_CORRECT = 'isn\'t correct'  # type: str
 
-    def __init__(self):
-        """Initialization of the elements of the game."""
+    def __init__(self, argv=None):
+        """Initialization of the elements of the game from the arguments of the command (sys.argv by default)."""
         # WARNING: for all buildings, read from the XML file:
         #           <effect>, <primary_effect>, <secondary_effect>: <cost> and <gain>, <CHOICES>
         #           <construction>: <text> and <where>
@@ -750,14 +823,15 @@ class GameElement:
         self.n_cards_in_hand = None  # type: int# Each player takes 3 cards from their own pile.
         self.n_possibilities_to_discard_cards = None  # type: int # Each player may discard all the cards in their hand and take 3 new cards. This may only be done once.
         # Check if there is enough arguments, at least the XML file.
-        n_args = len(sys.argv)  # type: int
+        argv = sys.argv if argv is None else argv  # type: List[str]
+        n_args = len(argv)  # type: int
         if n_args < 2:
             self.usage('The number of arguments ' + str(n_args) + ' ' + GameElement.TXT_IS_NOT_CORRECT +
                        ' (you must have an XML file).')
         # Check if the XML file exists.
-        if not path.isfile(sys.argv[1]):
-            self.usage('The file ' + sys.argv[1] + ' does not exist.')
-        xml_tree = ET.parse(sys.argv[1])  # type: xml.etree.ElementTree.ElementTree
+        if not path.isfile(argv[1]):
+            self.usage('The file ' + argv[1] + ' does not exist.')
+        xml_tree = ET.parse(argv[1])  # type: xml.etree.ElementTree.ElementTree
         xml_tree_root = xml_tree.getroot()  # type: xml.etree.ElementTree.Element
         # Read the number minimum and maximum of players from the XML file.
         self.n_min_players = int(xml_tree_root.find('n_min_players').text)
@@ -772,18 +846,18 @@ class GameElement:
         for version_name_tag in xml_tree_root.findall('versions/version/name'):
             self.versions.append(Version(version_name_tag.text))
         # Check the version.
-        if sys.argv[2] not in [version.name for version in self.versions]:
-            self.usage('The version ' + sys.argv[2] + ' ' + GameElement.TXT_IS_NOT_CORRECT + '.', txt_n_min_max_players)
+        if argv[2] not in [version.name for version in self.versions]:
+            self.usage('The version ' + argv[2] + ' ' + GameElement.TXT_IS_NOT_CORRECT + '.', txt_n_min_max_players)
         else:
-            version = [version for version in self.versions if sys.argv[2] == version.name][0]  # type: Version
+            version = [version for version in self.versions if argv[2] == version.name][0]  # type: Version
         # Read the colors of the players from the XML file.
         self.color_players = list()
         for color_player_name_tag in xml_tree_root.findall('color_players/color_player'):
             self.color_players.append(ColorPlayer(color_player_name_tag.text))
-        # Check the players (colors and ai names, 1! human).
+        # Check the players (colors and ai names, at most 1 human).
         self.color_player_names = [color_player.name for color_player in self.color_players]  # type: List[str]
 
-        self.check_player_list(sys.argv)
+        self.check_player_list(argv)
         # Read all the remaining data from the XML file: name of the game.
         self.game_name = xml_tree_root.find('game_name').text
         # Read all the remaining data from the XML file: 3 parts of the castle (sorted by number of PP decreasing).
@@ -1061,15 +1135,9 @@ class GameElement:
         for resource_name, resource in Resource.resources.items():
             Player.money_resources[resource] = int(setup_player_tag.find('n_' + resource_name + '_cubes').text)
         Player.n_prestige_pts = int(setup_player_tag.find('n_prestige_pts').text)
-        for list_arg in [sys.argv[i_arg].split('=') for i_arg in range(3, n_args)]:
-            color_player = ColorPlayer.colors_players[list_arg[0]]  # type: ColorPlayer
-            if len(list_arg) == 1:
-                players.append(HumanPlayer(color_player))
-            else:
-                if list_arg[1] == BasicAIPlayer.ai_name:
-                    players.append(BasicAIPlayer(color_player))
-                else:
-                    players.append(AdvancedAIPlayer(color_player))
+        for list_arg in [argv[i_arg].split('=') for i_arg in range(3, n_args)]:
+            players.append(GameElement.create_player(ColorPlayer.colors_players[list_arg[0]],
+                                                     list_arg[1] if len(list_arg) > 1 else ''))
         # End of the initialization of the elements of the game obtained from the XML file.
         print('Initialization of the elements of "' + self.game_name + '": ' +
               str(len(self.versions)) + ' versions, ' +
@@ -1082,6 +1150,16 @@ class GameElement:
         # Initialization of the game.
         self.game = Game(self, version, players)
 
+    @staticmethod
+    def create_player(color_player: ColorPlayer, ai_name: str) -> Player:
+        """Create a player of a color: a human player for an empty AI name, an AI player otherwise."""
+        if not ai_name:
+            return HumanPlayer(color_player)
+        elif ai_name == BasicAIPlayer.ai_name:
+            return BasicAIPlayer(color_player)
+        else:
+            return AdvancedAIPlayer(color_player)
+
     def check_player_list(self,p_list,color_player_names = None):
         n_args = len(p_list)
         txt_n_min_max_players = str(self.n_min_players) + '..' + str(self.n_max_players)  # type: str
@@ -1108,7 +1186,7 @@ class GameElement:
                     self.color_player_names.remove(list_arg[0])
             else:
                 self.usage('The argument ' + arg + ' ' + GameElement.TXT_IS_NOT_CORRECT + '.', txt_n_min_max_players)
-        if n_humans != 1:
+        if n_humans > 1:  # Without human, the game is played by the AIs only.
             self.usage('The number of human players ' + str(n_humans) + ' ' + GameElement.TXT_IS_NOT_CORRECT + '.',
                         txt_n_min_max_players)
 
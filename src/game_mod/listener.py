@@ -0,0 +1,33 @@
+#!/usr/bin/python
+
+
+class GameListener:
+    """Listener of the progress of a game (e.g. to record, to time or to trace it); each notification does nothing by default."""
+
+    def game_begin(self, game) -> None:
+        """Notification of the beginning of a game (once the setup is done)."""
+        pass
+
+    def turn_begin(self, game) -> None:
+        """Notification of the beginning of a turn (game.n_turns is the number of the turn)."""
+        pass
+
+    def phase_begin(self, game, phase_numero: int) -> None:
+        """Notification of the beginning of a phase of a turn."""
+        pass
+
+    def phase_end(self, game, phase_numero: int) -> None:
+        """Notification of the end of a phase of a turn."""
+        pass
+
+    def effect_begin(self, game, building, effect_method_name: str) -> None:
+        """Notification of the beginning of the application of an effect of a building (e.g. 'apply_primary_effect')."""
+        pass
+
+    def effect_end(self, game, building, effect_method_name: str) -> None:
+        """Notification of the end of the application of an effect of a building."""
+        pass
+
+    def game_end(self, game) -> None:
+        """Notification of the end of a game (once the winners are known)."""
+        pass
@@ -0,0 +1,96 @@
+#!/usr/bin/python
+import time
+
+from game_mod.listener import GameListener
+
+
+class MetricsRegistry(GameListener):
+    """Registry of counters and distributions of the branching of the decisions and of the search of the AIs."""
+    """
+    As a listener of a game, it measures the number of candidate actions of each decision, the number of payment
+    alternatives of each building (computed by the game for the possible actions) and the range of the movement of the
+    Provost.
+    The players get the registry (player.metrics) so that a search AI can count its nodes expanded, transposition hits
+    and rollouts. The registry can be snapshotted at any time; the snapshot of each game is kept at its end.
+    """
+
+    CANDIDATE_ACTIONS = 'candidate_actions'  # type: str
+    PAYMENT_ALTERNATIVES = 'payment_alternatives'  # type: str # Followed by '.' and the name of the building for the distribution per building.
+    PROVOST_MOVE_RANGE = 'provost_move_range'  # type: str
+    NODES_EXPANDED = 'nodes_expanded'  # type: str
+    TRANSPOSITION_HITS = 'transposition_hits'  # type: str
+    ROLLOUTS = 'rollouts'  # type: str
+
+    def __init__(self, is_reset_per_game: bool = True):
+        """Initialization without measure."""
+        self.is_reset_per_game = is_reset_per_game  # type: bool
+        self.counters = dict()  # type: Dict[str, int]
+        self.distributions = dict()  # type: Dict[str, List[float]] # Number, total and maximum of the values indexed by the names.
+        self.time_begin = time.perf_counter()  # type: float
+        self.game_snapshots = list()  # type: List[Dict] # Snapshots at the end of the games.
+        self.measured_players = set()  # type: Set[Player] # Players whose methods are already decorated.
+
+    def reset(self) -> None:
+        """Reset the counters, the distributions and the time."""
+        self.counters.clear()
+        self.distributions.clear()
+        self.time_begin = time.perf_counter()
+
+    def increment(self, name: str, n: int = 1) -> None:
+        """Increment a counter (e.g. the nodes expanded)."""
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def observe(self, name: str, value: float) -> None:
+        """Add a value to a distribution (e.g. the number of candidate actions of a decision)."""
+        distribution = self.distributions.get(name)  # type: List[float]
+        if distribution is None:
+            self.distributions[name] = [1, value, value]
+        else:
+            distribution[0] += 1
+            distribution[1] += value
+            distribution[2] = max(distribution[2], value)
+
+    def snapshot(self) -> dict:
+        """Get the measures (JSON serializable) with the rate of each counter (e.g. rollouts per second)."""
+        elapsed_time = time.perf_counter() - self.time_begin  # type: float
+        return {'elapsed_time': elapsed_time,
+                'counters': dict(self.counters),
+                'rates': {name: n / elapsed_time for name, n in self.counters.items()} if elapsed_time > 0 else {},
+                'distributions': {name: {'n': n, 'mean': tot / n, 'max': max_value}
+                                  for name, (n, tot, max_value) in sorted(self.distributions.items())}}
+
+    def game_begin(self, game) -> None:
+        if self.is_reset_per_game:
+            self.reset()
+        for player in game.players:
+            player.metrics = self
+            if player not in self.measured_players:
+                self.measured_players.add(player)
+                self.measure_player(player)
+
+    def game_end(self, game) -> None:
+        self.game_snapshots.append(self.snapshot())
+
+    def observe_payment_alternatives(self, building_name: str, n_payments: int) -> None:
+        """Add the number of payment alternatives of a player to construct a building (in total and per building)."""
+        self.observe(MetricsRegistry.PAYMENT_ALTERNATIVES, n_payments)
+        self.observe(MetricsRegistry.PAYMENT_ALTERNATIVES + '.' + building_name, n_payments)
+
+    def measure_player(self, player) -> None:
+        """Decorate the choose methods of a player measuring the branching of its decisions."""
+        player.decorate_choose_methods(self.decorate_choose_method)
+
+    def decorate_choose_method(self, choose_method_name: str, choose_method):
+        """Decorate a choose method of a player in order to measure its number of candidates (if it is measured)."""
+        if choose_method_name == 'choose_action':
+            def measured_choose_action(possible_actions):
+                self.observe(MetricsRegistry.CANDIDATE_ACTIONS, len(possible_actions))
+                return choose_method(possible_actions)
+            return measured_choose_action
+        if choose_method_name == 'choose_n_provost_movement':
+            def measured_choose_n_provost_movement(n_min_provost_movements_player, n_max_provost_movements_player):
+                self.observe(MetricsRegistry.PROVOST_MOVE_RANGE,
+                             n_max_provost_movements_player - n_min_provost_movements_player + 1)
+                return choose_method(n_min_provost_movements_player, n_max_provost_movements_player)
+            return measured_choose_n_provost_movement
+        return choose_method
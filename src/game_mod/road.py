@@ -0,0 +1,137 @@
+#!/usr/bin/python
+import bisect
+from array import array
+
+
+class Road:
+    """Road: buildings and workers along the road with an index of the occupied and free slots."""
+    """
+    The road is stored as parallel arrays (one item per slot): the building id, the index of the player owning the
+    worker, the id of the building replaced while a worker is on it and the index of the color of the player owning the
+    building. An id of a building is its index in the buildings of the game element and -1 stands for none.
+    The index allows the effects of the buildings to be applied only on the slots where there is a worker (up to the
+    Provost) and the placement of a worker to be proposed only on the free slots.
+    """
+
+    NONE = -1  # type: int # No worker, no replaced building or no color of player.
+
+    def __init__(self, game_element, players, buildings):
+        """Initialization of the road (without worker)."""
+        self.all_buildings = game_element.buildings  # type: List[Building] # Buildings indexed by their ids.
+        self.i_all_buildings = {building: i_building for i_building, building
+                                in enumerate(game_element.buildings)}  # type: Dict[Building, int]
+        self.players = players  # type: List[Player] # Players indexed by the index of their workers.
+        self.i_players = {player: i_player for i_player, player in enumerate(players)}  # type: Dict[Player, int]
+        self.i_color_players = {color_player: i_color_player for i_color_player, color_player
+                                in enumerate(game_element.color_players)}  # type: Dict[ColorPlayer, int]
+        self.i_buildings = array('h', [self.i_all_buildings[building] for building in buildings])  # type: array[int]
+        self.i_workers = array('b', [Road.NONE] * len(buildings))  # type: array[int]
+        self.i_replaced_buildings = array('h', [Road.NONE] * len(buildings))  # type: array[int] # The building (with a worker) which becomes a résidence player buiding; in such case, the primary and secondary effects have to be applied on this building.
+        self.i_owners = array('b', [self.get_i_color_player(building) for building in buildings])  # type: array[int]
+        self.i_occupied_slots = list()  # type: List[int] # Sorted indexes of the slots where there is a worker.
+        self.i_free_slots = [i_road for i_road, building in enumerate(buildings)
+                             if building.allows_to_place_a_worker]  # type: List[int] # Sorted indexes of the slots where a worker can be placed.
+
+    def __len__(self) -> int:
+        return len(self.i_buildings)
+
+    def copy(self):  # -> Road
+        """Get a copy of the road (the buildings and the players are shared)."""
+        road = Road.__new__(Road)  # type: Road
+        road.__dict__.update(self.__dict__)
+        road.i_buildings = self.i_buildings[:]
+        road.i_workers = self.i_workers[:]
+        road.i_replaced_buildings = self.i_replaced_buildings[:]
+        road.i_owners = self.i_owners[:]
+        road.i_occupied_slots = self.i_occupied_slots[:]
+        road.i_free_slots = self.i_free_slots[:]
+        return road
+
+    def get_i_color_player(self, building) -> int:
+        """Get the index of the color of the player owning a building (-1 for a neutral building)."""
+        color_player = getattr(building, 'color_player', None)  # type: ColorPlayer # A neutral building has no owner.
+        return Road.NONE if color_player is None else self.i_color_players[color_player]
+
+    def get_building(self, i_road: int):  # -> Building
+        """Get the (visible) building of a slot."""
+        return self.all_buildings[self.i_buildings[i_road]]
+
+    def get_buildings(self):  # -> List[Building]
+        """Get the (visible) buildings along the road."""
+        return [self.all_buildings[i_building] for i_building in self.i_buildings]
+
+    def get_worker(self, i_road: int):  # -> Optional[Player]
+        """Get the player owning the worker of a slot."""
+        i_worker = self.i_workers[i_road]  # type: int
+        return None if i_worker == Road.NONE else self.players[i_worker]
+
+    def get_replaced_building(self, i_road: int):  # -> Optional[Building]
+        """Get the building replaced (by a résidence player building) while a worker is on it."""
+        i_replaced_building = self.i_replaced_buildings[i_road]  # type: int
+        return None if i_replaced_building == Road.NONE else self.all_buildings[i_replaced_building]
+
+    def get_effect_building(self, i_road: int):  # -> Building
+        """Get the building whose effects are applied for the worker of a slot."""
+        i_replaced_building = self.i_replaced_buildings[i_road]  # type: int
+        return self.all_buildings[self.i_buildings[i_road] if i_replaced_building == Road.NONE
+                                  else i_replaced_building]
+
+    def get_i_road_buildings_of_color_player(self, color_player):  # -> List[Tuple[int, Building]]
+        """Get the (visible) buildings (and their indexes) along the road owned by a color of player."""
+        i_color_player = self.i_color_players[color_player]  # type: int
+        return [(i_road, self.all_buildings[self.i_buildings[i_road]])
+                for i_road, i_owner in enumerate(self.i_owners) if i_owner == i_color_player]
+
+    def append_building(self, building) -> None:
+        """Add a building at the end of the road."""
+        self.i_buildings.append(self.i_all_buildings[building])
+        self.i_workers.append(Road.NONE)
+        self.i_replaced_buildings.append(Road.NONE)
+        self.i_owners.append(self.get_i_color_player(building))
+        if building.allows_to_place_a_worker:
+            self.i_free_slots.append(len(self.i_buildings) - 1)
+
+    def replace_building(self, i_road: int, building) -> None:
+        """Replace the building of a slot (e.g. by a residential or a prestige building)."""
+        if self.i_workers[i_road] != Road.NONE and self.i_replaced_buildings[i_road] == Road.NONE:
+            # The effects have to be applied on the replaced building where is the worker.
+            self.i_replaced_buildings[i_road] = self.i_buildings[i_road]
+        self.i_buildings[i_road] = self.i_all_buildings[building]
+        self.i_owners[i_road] = self.get_i_color_player(building)
+        self.update_free_slot(i_road)
+
+    def place_worker(self, i_road: int, player) -> None:
+        """Place a worker of a player on a free slot."""
+        self.i_workers[i_road] = self.i_players[player]
+        del self.i_free_slots[bisect.bisect_left(self.i_free_slots, i_road)]
+        bisect.insort(self.i_occupied_slots, i_road)
+
+    def remove_worker(self, i_road: int):  # -> Player
+        """Remove the worker of an occupied slot (and the replaced building kept for the effects); return the owner of the worker."""
+        worker = self.players[self.i_workers[i_road]]  # type: Player
+        self.i_workers[i_road] = Road.NONE
+        self.i_replaced_buildings[i_road] = Road.NONE
+        del self.i_occupied_slots[bisect.bisect_left(self.i_occupied_slots, i_road)]
+        self.update_free_slot(i_road)
+        return worker
+
+    def update_free_slot(self, i_road: int) -> None:
+        """Update the index of the free slots for one slot."""
+        i_free_slots = bisect.bisect_left(self.i_free_slots, i_road)  # type: int
+        is_indexed = i_free_slots < len(self.i_free_slots) and self.i_free_slots[i_free_slots] == i_road  # type: bool
+        is_free = self.get_building(i_road).allows_to_place_a_worker \
+                  and self.i_workers[i_road] == Road.NONE  # type: bool
+        if is_free and not is_indexed:
+            self.i_free_slots.insert(i_free_slots, i_road)
+        elif not is_free and is_indexed:
+            del self.i_free_slots[i_free_slots]
+
+    def get_i_occupied_slots(self, i_road_last: int = None):  # -> List[int]
+        """Get the indexes of the slots where there is a worker, up to and including the last index (e.g. the Provost)."""
+        if i_road_last is None:
+            return list(self.i_occupied_slots)
+        return self.i_occupied_slots[:bisect.bisect_right(self.i_occupied_slots, i_road_last)]
+
+    def get_i_free_slots(self):  # -> List[int]
+        """Get the indexes of the slots where a worker can be placed."""
+        return list(self.i_free_slots)
@@ -0,0 +1,34 @@
+#!/usr/bin/python
+from game_mod.snapshot import get_element_fields
+
+
+class SharedGameState:
+    """State of a game kept by the elements of the game, which are shared by all the games of these elements."""
+    """
+    The tokens of the castle, the cubes of the small production buildings, the owners of the prestige buildings, the
+    players of the colors and the game of the elements belong to the elements of the game. So several games of the same
+    elements can be interleaved (e.g. by a server) as long as this state is taken from the elements when a game stops
+    and installed again before it goes on.
+    """
+
+    def __init__(self, game, element_values, players):
+        """Initialization of the state of a game."""
+        self.game = game  # type: Game
+        self.element_values = element_values  # type: List[Tuple[Any, str, Any]] # Fields of the elements with their values.
+        self.players = players  # type: Dict[ColorPlayer, Optional[Player]]
+
+    @staticmethod
+    def take(game):  # -> SharedGameState
+        """Take the state of a game from its elements."""
+        return SharedGameState(game,
+                               [(element, field_name, getattr(element, field_name))
+                                for element, field_name in get_element_fields(game)],
+                               {color_player: color_player.player for color_player in game.game_element.color_players})
+
+    def install(self) -> None:
+        """Install the state of the game into its elements."""
+        self.game.game_element.game = self.game
+        for element, field_name, value in self.element_values:
+            setattr(element, field_name, value)
+        for color_player, player in self.players.items():
+            color_player.player = player
@@ -0,0 +1,114 @@
+#!/usr/bin/python
+from array import array
+
+from buildings_mod import *
+
+from game_mod.road import Road
+from game_mod.utils import Location
+from game_mod.utils import read_signed_varint
+from game_mod.utils import write_signed_varint
+
+
+def get_element_fields(game):  # -> List[Tuple[Any, str]]
+    """Get the fields (element, name of its attribute) of the state of a game kept by the elements of the game."""
+    # The tokens of the castle, the cubes into the area of the small production buildings and the owners of the
+    # prestige buildings.
+    element_fields = [(castle_part, 'current_n_castle_tokens')
+                      for castle_part in game.game_element.castle]  # type: List[Tuple[Any, str]]
+    for building in game.current_buildings:
+        if hasattr(building, 'current_n_cubes_into_area'):
+            element_fields.append((building, 'current_n_cubes_into_area'))
+        elif building.get_building_type() == BuildingType.PRESTIGE:
+            element_fields.append((building, 'color_player'))
+    return element_fields
+
+
+class GameSnapshot:
+    """Snapshot of the state of a game at the beginning of a turn, as a compact sequence of integers."""
+    """
+    The snapshot only contains what changes during a game: the elements of the game (buildings, players...) are referred
+    to by their indexes and have to be the same ones (a game set up with the same version, players and seed). The random
+    number generators are not saved since they are reseeded at the beginning of each turn.
+    """
+
+    def __init__(self, ns):
+        """Initialization of a snapshot from its integers."""
+        self.ns = ns  # type: List[int]
+
+    @staticmethod
+    def take(game):  # -> GameSnapshot
+        """Take a snapshot of the state of a game."""
+        ns = [game.n_turns, -1 if game.i_provost is None else game.i_provost, game.i_first_player]  # type: List[int]
+        # Passing marker players.
+        ns.append(len(game.passing_marker_players))
+        ns.extend(game.players.index(player) for player in game.passing_marker_players)
+        # Road.
+        road = game.road  # type: Road
+        ns.append(len(road))
+        for i_road in range(len(road)):
+            ns.extend((road.i_buildings[i_road], road.i_workers[i_road], road.i_replaced_buildings[i_road],
+                       road.i_owners[i_road]))
+        # Castle and buildings.
+        for element, field_name in get_element_fields(game):
+            ns.append(road.get_i_color_player(element) if field_name == 'color_player'
+                      else getattr(element, field_name))
+        # Players.
+        for player in game.players:
+            ns.extend(player.current_money_resources.values())
+            ns.extend((player.current_n_prestige_pts, player.current_n_workers))
+            ns.extend(location.value for location in player.deck.values())
+        return GameSnapshot(ns)
+
+    def restore(self, game) -> None:
+        """Restore the state of a game (set up as the game of the snapshot) and reseed it for the turn."""
+        i_ns = iter(self.ns)  # type: Iterator[int]
+        game.n_turns = next(i_ns)
+        i_provost = next(i_ns)  # type: int
+        game.i_provost = None if i_provost == -1 else i_provost
+        game.i_first_player = next(i_ns)
+        # Passing marker players.
+        game.passing_marker_players = [game.players[next(i_ns)] for _i_player in range(next(i_ns))]
+        # Road.
+        road = game.road  # type: Road
+        n_road = next(i_ns)  # type: int
+        i_slots = [[next(i_ns) for _i_array in range(4)] for _i_road in range(n_road)]  # type: List[List[int]]
+        road.i_buildings[:] = array('h', (i_slot[0] for i_slot in i_slots))
+        road.i_workers[:] = array('b', (i_slot[1] for i_slot in i_slots))
+        road.i_replaced_buildings[:] = array('h', (i_slot[2] for i_slot in i_slots))
+        road.i_owners[:] = array('b', (i_slot[3] for i_slot in i_slots))
+        road.i_occupied_slots = [i_road for i_road in range(n_road) if road.i_workers[i_road] != Road.NONE]
+        road.i_free_slots = [i_road for i_road in range(n_road) if road.i_workers[i_road] == Road.NONE
+                             and road.get_building(i_road).allows_to_place_a_worker]
+        # Castle and buildings.
+        for element, field_name in get_element_fields(game):
+            n = next(i_ns)  # type: int
+            if field_name == 'color_player':
+                setattr(element, field_name, None if n == Road.NONE else game.game_element.color_players[n])
+            else:
+                setattr(element, field_name, n)
+        # Players.
+        for player in game.players:
+            for money_resource in player.current_money_resources:
+                player.current_money_resources[money_resource] = next(i_ns)
+            player.current_n_prestige_pts = next(i_ns)
+            player.current_n_workers = next(i_ns)
+            for player_building in player.deck:
+                player.deck[player_building] = Location(next(i_ns))
+        game.reseed()
+
+    def to_bytes(self) -> bytes:
+        """Get the binary form of the snapshot (a varint per integer)."""
+        buffer = bytearray()  # type: bytearray
+        for n in self.ns:
+            write_signed_varint(buffer, n)
+        return bytes(buffer)
+
+    @staticmethod
+    def from_bytes(data: bytes):  # -> GameSnapshot
+        """Get a snapshot from its binary form."""
+        ns = list()  # type: List[int]
+        i_data = 0  # type: int
+        while i_data < len(data):
+            n, i_data = read_signed_varint(data, i_data)
+            ns.append(n)
+        return GameSnapshot(ns)
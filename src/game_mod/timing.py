@@ -0,0 +1,142 @@
+#!/usr/bin/python
+import time
+
+from game_mod.listener import GameListener
+
+
+class LatencyHistogram:
+    """Histogram of durations with buckets of powers of 2 microseconds, mergeable."""
+    """
+    The bucket i counts the durations d such that 2^(i-1) <= d < 2^i microseconds (the bucket 0 for d < 1 µs), so
+    adding a duration is cheap and the histograms of several games or processes can be summed.
+    """
+
+    def __init__(self):
+        """Initialization without duration."""
+        self.ns = list()  # type: List[int] # Numbers of durations indexed by the buckets.
+        self.tot_time = 0.0  # type: float # Seconds.
+        self.max_time = 0.0  # type: float # Seconds.
+
+    def add(self, duration: float) -> None:
+        """Add a duration (seconds)."""
+        i_bucket = int(duration * 1e6).bit_length()  # type: int
+        if i_bucket >= len(self.ns):
+            self.ns.extend([0] * (i_bucket + 1 - len(self.ns)))
+        self.ns[i_bucket] += 1
+        self.tot_time += duration
+        self.max_time = max(self.max_time, duration)
+
+    def merge(self, other) -> None:
+        """Merge the durations of another histogram into this one."""
+        if len(other.ns) > len(self.ns):
+            self.ns.extend([0] * (len(other.ns) - len(self.ns)))
+        for i_bucket, n in enumerate(other.ns):
+            self.ns[i_bucket] += n
+        self.tot_time += other.tot_time
+        self.max_time = max(self.max_time, other.max_time)
+
+    def get_n(self) -> int:
+        """Get the number of durations."""
+        return sum(self.ns)
+
+    def get_percentile(self, q: float) -> float:
+        """Get an upper bound (the one of its bucket) of a percentile (0 < q <= 1) of the durations (seconds)."""
+        n_durations = q * self.get_n()  # type: float
+        n_cumulated = 0  # type: int
+        for i_bucket, n in enumerate(self.ns):
+            n_cumulated += n
+            if n_cumulated >= n_durations:
+                return min((1 << i_bucket) * 1e-6, self.max_time)
+        return self.max_time
+
+    def to_dict(self) -> dict:
+        """Get the histogram as a dictionary (JSON serializable)."""
+        return {'ns': self.ns, 'tot_time': self.tot_time, 'max_time': self.max_time}
+
+    @staticmethod
+    def from_dict(histogram_dict: dict):  # -> LatencyHistogram
+        """Get the histogram from a dictionary."""
+        histogram = LatencyHistogram()  # type: LatencyHistogram
+        histogram.ns = list(histogram_dict['ns'])
+        histogram.tot_time = histogram_dict['tot_time']
+        histogram.max_time = histogram_dict['max_time']
+        return histogram
+
+
+class GameTimer(GameListener):
+    """Listener timing each phase of the games and each decision (choose method) of their players in histograms."""
+    """
+    The time of a phase includes the decisions of the players in it (e.g. an AI thinking) and the generation of their
+    possible actions; so the per-player histograms tell whether a slow phase is slow because of the AIs.
+    """
+
+    def __init__(self):
+        """Initialization without duration."""
+        self.phase_histograms = dict()  # type: Dict[int, LatencyHistogram] # Indexed by the numeros of the phases.
+        self.player_histograms = dict()  # type: Dict[str, Dict[str, LatencyHistogram]] # Indexed by the names of the colors of the players and of the choose methods.
+        self.time_phase_begin = 0.0  # type: float
+
+    def attach(self, game) -> None:
+        """Listen to a game (before its setup, which already asks the players to discard their hands): the choose methods of its players are decorated."""
+        for player in game.players:
+            player.decorate_choose_methods(self.get_timed_choose_method_decorator(player.color_player.name))
+        game.listeners.append(self)
+
+    def phase_begin(self, game, phase_numero: int) -> None:
+        self.time_phase_begin = time.perf_counter()
+
+    def phase_end(self, game, phase_numero: int) -> None:
+        duration = time.perf_counter() - self.time_phase_begin  # type: float
+        self.phase_histograms.setdefault(phase_numero, LatencyHistogram()).add(duration)
+
+    def get_timed_choose_method_decorator(self, color_player_name: str):  # -> Callable[[str, Callable], Callable]
+        """Get the decorator of the choose methods of a player adding their durations to the histograms of the player."""
+        histograms = self.player_histograms.setdefault(color_player_name, dict())  # type: Dict[str, LatencyHistogram]
+
+        def decorator(choose_method_name, choose_method):
+            histogram = histograms.setdefault(choose_method_name, LatencyHistogram())  # type: LatencyHistogram
+
+            def timed_choose_method(*args, **kwargs):
+                time_begin = time.perf_counter()  # type: float
+                try:
+                    return choose_method(*args, **kwargs)
+                finally:
+                    histogram.add(time.perf_counter() - time_begin)
+            return timed_choose_method
+        return decorator
+
+    def merge_dict(self, timings_dict: dict) -> None:
+        """Merge the histograms of a dictionary (e.g. of a game played by another process) into the ones of this timer."""
+        for phase_numero, histogram_dict in timings_dict['phases'].items():
+            self.phase_histograms.setdefault(int(phase_numero), LatencyHistogram()).merge(
+                LatencyHistogram.from_dict(histogram_dict))
+        for color_player_name, histogram_dicts in timings_dict['players'].items():
+            histograms = self.player_histograms.setdefault(color_player_name, dict())  # type: Dict[str, LatencyHistogram]
+            for choose_method_name, histogram_dict in histogram_dicts.items():
+                histograms.setdefault(choose_method_name, LatencyHistogram()).merge(
+                    LatencyHistogram.from_dict(histogram_dict))
+
+    def to_dict(self) -> dict:
+        """Get the histograms as a dictionary (JSON serializable)."""
+        return {'phases': {str(phase_numero): histogram.to_dict()
+                           for phase_numero, histogram in sorted(self.phase_histograms.items())},
+                'players': {color_player_name: {choose_method_name: histogram.to_dict()
+                                                for choose_method_name, histogram in histograms.items()
+                                                if histogram.get_n() > 0}
+                            for color_player_name, histograms in self.player_histograms.items()}}
+
+    def txt_timings(self) -> str:
+        """Get the text of a table of the durations of the phases and of the decisions of the players."""
+        lines = ['{:40} {:>9} {:>12} {:>12} {:>12} {:>12}'.format('Timer', 'N', 'Mean (µs)', 'p50 (µs)', 'p99 (µs)',
+                                                                  'Max (µs)')]  # type: List[str]
+        rows = [('phase ' + str(phase_numero), histogram)
+                for phase_numero, histogram in sorted(self.phase_histograms.items())] + \
+               [(color_player_name + ' ' + choose_method_name, histogram)
+                for color_player_name, histograms in self.player_histograms.items()
+                for choose_method_name, histogram in sorted(histograms.items())
+                if histogram.get_n() > 0]  # type: List[Tuple[str, LatencyHistogram]]
+        for name, histogram in rows:
+            lines.append('{:40} {:9} {:12.1f} {:12.1f} {:12.1f} {:12.1f}'.format(
+                name, histogram.get_n(), histogram.tot_time / histogram.get_n() * 1e6,
+                histogram.get_percentile(0.5) * 1e6, histogram.get_percentile(0.99) * 1e6, histogram.max_time * 1e6))
+        return '\n'.join(lines)
@@ -0,0 +1,83 @@
+#!/usr/bin/python
+import json
+import time
+
+from game_mod.listener import GameListener
+
+
+class ChromeTracer(GameListener):
+    """Listener recording the spans of a game (turn, phase, effect and decision) as events of a Chrome trace."""
+    """
+    The trace (JSON) opens in a trace viewer (e.g. chrome://tracing or Perfetto): the spans are nested as turn > phase >
+    effect of a building (e.g. LawyerPlayerBuilding.apply_primary_effect) > decision of a player (e.g. choose_action); the
+    decisions of the setup (discards of the hands) are directly in the game.
+    Only the boundaries of the spans are timed, so the durations are not distorted as with a profiler.
+    """
+
+    def __init__(self, pid: int = 0):
+        """Initialization without event."""
+        # :param pid: # type: int # Identifier of the process in the trace, e.g. to merge the traces of several games.
+        self.pid = pid  # type: int
+        self.events = list()  # type: List[Dict] # Events of the trace.
+        self.time_origin = time.perf_counter()  # type: float
+        self.is_turn_open = False  # type: bool # There is no notification at the end of a turn.
+
+    def attach(self, game) -> None:
+        """Listen to a game (before its setup, which already asks the players to discard their hands): the choose methods of its players are decorated and the span of the game begins."""
+        for player in game.players:
+            player.decorate_choose_methods(self.get_traced_choose_method_decorator(player.color_player.name))
+        game.listeners.append(self)
+        self.add_event('B', 'game', 'game', {'version': game.version.name})
+
+    def add_event(self, phase: str, name: str, category: str, args: dict = None) -> None:
+        """Add an event of the beginning (phase 'B') or the end (phase 'E') of a span."""
+        event = {'name': name, 'cat': category, 'ph': phase, 'pid': self.pid, 'tid': 0,
+                 'ts': (time.perf_counter() - self.time_origin) * 1e6}  # type: Dict
+        if args:
+            event['args'] = args
+        self.events.append(event)
+
+    def end_turn(self) -> None:
+        """End the span of the current turn if any."""
+        if self.is_turn_open:
+            self.add_event('E', 'turn', 'turn')
+            self.is_turn_open = False
+
+    def turn_begin(self, game) -> None:
+        self.end_turn()
+        self.add_event('B', 'turn', 'turn', {'n_turns': game.n_turns})
+        self.is_turn_open = True
+
+    def phase_begin(self, game, phase_numero: int) -> None:
+        self.add_event('B', game.game_element.phases[phase_numero].name, 'phase', {'numero': phase_numero})
+
+    def phase_end(self, game, phase_numero: int) -> None:
+        self.add_event('E', game.game_element.phases[phase_numero].name, 'phase')
+
+    def effect_begin(self, game, building, effect_method_name: str) -> None:
+        self.add_event('B', type(building).__name__ + '.' + effect_method_name, 'effect', {'building': building.name})
+
+    def effect_end(self, game, building, effect_method_name: str) -> None:
+        self.add_event('E', type(building).__name__ + '.' + effect_method_name, 'effect')
+
+    def game_end(self, game) -> None:
+        self.end_turn()
+        self.add_event('E', 'game', 'game', {'seed': game.seed,
+                                             'winners': [player.color_player.name for player in game.winner_players]})
+
+    def get_traced_choose_method_decorator(self, color_player_name: str):  # -> Callable[[str, Callable], Callable]
+        """Get the decorator of the choose methods of a player recording their spans."""
+        def decorator(choose_method_name, choose_method):
+            def traced_choose_method(*args, **kwargs):
+                self.add_event('B', choose_method_name, 'decision', {'player': color_player_name})
+                try:
+                    return choose_method(*args, **kwargs)
+                finally:
+                    self.add_event('E', choose_method_name, 'decision')
+            return traced_choose_method
+        return decorator
+
+    def write(self, trace_file_path: str) -> None:
+        """Write the trace (JSON object format of the trace events)."""
+        with open(trace_file_path, 'w', encoding='utf-8') as trace_file:
+            json.dump({'traceEvents': self.events, 'displayTimeUnit': 'ms'}, trace_file)
@@ -1,4 +1,6 @@
 #!/usr/bin/python
+import contextlib
+import hashlib
 from enum import Enum, unique
 
 
@@ -28,6 +30,73 @@ def indent(n_indent: int) -> str:
     return '  ' * n_indent
 
 
+class NoDisplay:
+    """Output which displays nothing (e.g. for the games played by the AIs only or replayed)."""
+
+    def write(self, txt: str) -> int:
+        return len(txt)
+
+    def flush(self) -> None:
+        pass
+
+
+@contextlib.contextmanager
+def no_display():
+    """Context in which all the displays (print) are discarded."""
+    with contextlib.redirect_stdout(NoDisplay()):
+        yield
+
+
+def write_varint(buffer: bytearray, n: int) -> None:
+    """Write a non-negative integer as a varint (7 bits per byte, the high bit indicates that a byte follows)."""
+    while n >= 0x80:
+        buffer.append((n & 0x7F) | 0x80)
+        n >>= 7
+    buffer.append(n)
+
+
+def read_varint(data: bytes, i_data: int):  # -> Tuple[int, int]
+    """Read a varint from some index of the data; return the integer and the index following the varint."""
+    n = 0  # type: int
+    shift = 0  # type: int
+    while True:
+        byte = data[i_data]  # type: int
+        i_data += 1
+        n |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return n, i_data
+        shift += 7
+
+
+def write_signed_varint(buffer: bytearray, n: int) -> None:
+    """Write an integer as a varint (zigzag encoding: 0, -1, 1, -2, ... are written as 0, 1, 2, 3, ...)."""
+    write_varint(buffer, 2 * n if n >= 0 else -2 * n - 1)
+
+
+def read_signed_varint(data: bytes, i_data: int):  # -> Tuple[int, int]
+    """Read a varint (zigzag encoding) from some index of the data; return the integer and the index following the varint."""
+    n, i_data = read_varint(data, i_data)
+    return (n >> 1) if n % 2 == 0 else -((n + 1) >> 1), i_data
+
+
+def write_txt(buffer: bytearray, txt: str) -> None:
+    """Write a text (UTF-8) preceded by its length."""
+    txt_bytes = txt.encode('utf-8')  # type: bytes
+    write_varint(buffer, len(txt_bytes))
+    buffer.extend(txt_bytes)
+
+
+def read_txt(data: bytes, i_data: int):  # -> Tuple[str, int]
+    """Read a text (UTF-8) preceded by its length; return the text and the index following the text."""
+    n_txt_bytes, i_data = read_varint(data, i_data)
+    return bytes(data[i_data:i_data + n_txt_bytes]).decode('utf-8'), i_data + n_txt_bytes
+
+
+def derive_seed(seed: int, *keys) -> int:
+    """Derive a seed (64 bits) from a master seed and some keys (e.g. the color of a player) in a reproducible way."""
+    return int.from_bytes(hashlib.sha256(repr((seed,) + keys).encode()).digest()[:8], 'big')
+
+
 @unique
 class Location(Enum):
     """Enumeration of all the possible locations of the player buildings."""
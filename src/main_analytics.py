@@ -0,0 +1,19 @@
+import sys
+
+from batch_mod import *
+
+
+if __name__ == "__main__":
+    # Usage: python main_analytics.py <journal_file>...
+    # Win rates of the players owning each building at the end of the games of the journals.
+    aggregator = BuildingWinAggregator()  # type: BuildingWinAggregator
+    for journal_file_path in sys.argv[1:]:
+        for game_summary in ResultsJournal.read(journal_file_path):
+            if 'buildings' in game_summary:  # The journals of old batches have no buildings.
+                aggregator.add(game_summary)
+    print('version    players building                  owners win_rate    95% CI     vs mean')
+    for version_name, n_players, building_name, n_players_owning, win_rate, ci_low, ci_high, win_rate_diff \
+            in aggregator.get_win_rates():
+        print('{:10} {:7} {:25} {:6} {:8.3f} [{:.3f}, {:.3f}] {:+8.3f}'.format(
+            version_name, n_players, building_name or '(all)', n_players_owning, win_rate, ci_low, ci_high,
+            win_rate_diff))
@@ -0,0 +1,46 @@
+import contextlib
+import json
+import sys
+
+from batch_mod import *
+from game_mod import *
+
+
+if __name__ == "__main__":
+    # Usage: python main_batch.py [--events] [--metrics] [--timings=<JSON_file>] [--watchdog] [--max-worker-memory=<MiB>] [--metrics-port=<port>] <journal_file> <first_seed> <n_games> <XML_file> <version> <color>=<ai_name>...
+    # The summaries of the games (with the events of their turns and their metrics e.g. the number of candidate actions
+    # per decision) are appended to the journal; the seeds already in the journal are skipped. The histograms of the
+    # durations of the phases and of the decisions of the players are written at the end into the JSON file of the
+    # timings. With the watchdog, the games are played in this process and the sites where the memory grows are
+    # reported every 100 games. The pool of processes is recycled once a process exceeds the memory ceiling.
+    # The live metrics of the batch are served (Prometheus text format) at http://127.0.0.1:<port>/metrics.
+    with_events = '--events' in sys.argv  # type: bool
+    with_metrics = '--metrics' in sys.argv  # type: bool
+    timings_file_paths = [arg[len('--timings='):] for arg in sys.argv if arg.startswith('--timings=')]  # type: List[str]
+    max_worker_memories = [int(arg[len('--max-worker-memory='):]) * 1024 * 1024 for arg in sys.argv
+                           if arg.startswith('--max-worker-memory=')]  # type: List[int]
+    metrics_ports = [int(arg[len('--metrics-port='):]) for arg in sys.argv
+                     if arg.startswith('--metrics-port=')]  # type: List[int]
+    args = [arg for arg in sys.argv if not arg.startswith('--')]  # type: List[str]
+    seats = [tuple(player_arg.split('=')) for player_arg in args[6:]]  # type: List[Tuple[str, str]]
+    game_timer = GameTimer() if timings_file_paths else None  # type: Optional[GameTimer]
+    memory_watchdog = MemoryWatchdog() if '--watchdog' in sys.argv else None  # type: Optional[MemoryWatchdog]
+    batch_metrics = BatchMetrics()  # type: BatchMetrics
+    try:
+        with memory_watchdog if memory_watchdog is not None else contextlib.nullcontext(), \
+                MetricsServer(batch_metrics, metrics_ports[0]) if metrics_ports else contextlib.nullcontext():
+            n_games_played = run_batch(args[1], args[4], args[5], seats, int(args[2]), int(args[3]),
+                                       n_processes=0 if memory_watchdog is not None else None,
+                                       with_events=with_events, game_timer=game_timer, with_metrics=with_metrics,
+                                       memory_watchdog=memory_watchdog,
+                                       max_worker_memory=max_worker_memories[0] if max_worker_memories else None,
+                                       batch_metrics=batch_metrics)  # type: int
+        print(str(n_games_played) + ' game(s) played.')
+    finally:
+        # The timings of the games already played are dumped even if the batch is interrupted.
+        if game_timer is not None:
+            with open(timings_file_paths[0], 'w', encoding='utf-8') as timings_file:
+                json.dump(game_timer.to_dict(), timings_file, indent=1)
+            print(game_timer.txt_timings())
+        if memory_watchdog is not None:
+            print(memory_watchdog.txt_reports())
@@ -0,0 +1,15 @@
+import json
+import sys
+
+from benchmark_mod import *
+
+
+if __name__ == "__main__":
+    # Usage: python main_benchmark.py <JSON_file> [<version> [<n_repeats>]]
+    # The times (seconds per call) of the hot paths are written into the JSON file, e.g. to compare two commits.
+    results = run_benchmarks(*sys.argv[2:3], *[int(arg) for arg in sys.argv[3:4]])  # type: Dict
+    with open(sys.argv[1], 'w', encoding='utf-8') as results_file:
+        json.dump(results, results_file, indent=1)
+    for name, benchmark in results['benchmarks'].items():
+        print('{:35} {:12.3f} µs (min) {:12.3f} µs (median)'.format(name, benchmark['min'] * 1e6,
+                                                                    benchmark['median'] * 1e6))
@@ -0,0 +1,25 @@
+import json
+import sys
+
+from benchmark_mod import *
+from benchmark_mod.regression import THRESHOLD
+
+
+if __name__ == "__main__":
+    # Usage: python main_benchmark_gate.py <baseline_JSON_file> [<threshold> [<n_repeats>]] [--update]
+    # The benchmarks are run and compared with the baseline (e.g. ../res/benchmark_baseline.json); the exit status is 1
+    # if a hot path regresses by more than the threshold (default: 0.25 i.e. 25 %). --update writes the new baseline.
+    is_update = '--update' in sys.argv  # type: bool
+    args = [arg for arg in sys.argv[1:] if arg != '--update']  # type: List[str]
+    baseline_file_path = args[0]  # type: str
+    threshold = float(args[1]) if len(args) > 1 else THRESHOLD  # type: float
+    n_repeats = int(args[2]) if len(args) > 2 else 9  # type: int
+    with open(baseline_file_path, encoding='utf-8') as baseline_file:
+        baseline_results = json.load(baseline_file)  # type: Dict
+    results = run_benchmarks(baseline_results['version'], n_repeats)  # type: Dict
+    rows = compare_benchmarks(baseline_results, results, threshold)  # type: List[Tuple]
+    print(txt_comparison(rows))
+    if is_update:
+        with open(baseline_file_path, 'w', encoding='utf-8') as baseline_file:
+            json.dump(results, baseline_file, indent=1)
+    sys.exit(1 if any(row[5] for row in rows) else 0)
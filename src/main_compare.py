@@ -0,0 +1,16 @@
+import sys
+
+from batch_mod import *
+
+
+if __name__ == "__main__":
+    # Usage: python main_compare.py <XML_file> <version> <ai_name> <other_ai_name> <max_n_games> [<p0> <p1>]
+    # E.g. python main_compare.py game_elements-CaylusMagnaCarta.xml Standard Advanced Basic 10000 0.5 0.55
+    # The score of the first AI is tested for p0 (no difference) against p1 (better) and p0 - (p1 - p0) (worse).
+    sprt = Sprt(*[float(p) for p in sys.argv[6:8]])  # type: Sprt
+    result = compare_ais(sys.argv[1], sys.argv[2], sys.argv[3], sys.argv[4], int(sys.argv[5]), sprt=sprt)  # type: Dict
+    print(result['ai_name'] + ' against ' + result['other_ai_name'] + ': ' + str(result['n_games']) + ' games, ' +
+          'score {:.3f}, LLR {:.3f} (better) {:.3f} (worse), '.format(result['score'], *result['llrs']) +
+          {Sprt.BETTER: result['ai_name'] + ' is significantly better.',
+           Sprt.WORSE: result['other_ai_name'] + ' is significantly better.',
+           Sprt.H0: 'the difference is ruled out.', None: 'no decision.'}[result['decision']])
@@ -0,0 +1,36 @@
+import json
+import socket
+import sys
+
+
+if __name__ == "__main__":
+    # Usage: python main_daemon.py --serve=<socket_file> <XML_file>
+    #        python main_daemon.py --socket=<socket_file> [<request>...]
+    # The daemon keeps the elements of the game loaded and plays the games of AIs asked over the Unix socket, e.g.
+    # '{"command": "play", "version": "Standard", "seats": [["red", "Basic"], ["green", "Advanced"]], "seed": 3}'.
+    # The client sends the requests given (or the lines of the standard input) and prints the responses (JSON lines);
+    # it only imports the standard library so that it starts in milliseconds.
+    serve_socket_file_paths = [arg[len('--serve='):] for arg in sys.argv if arg.startswith('--serve=')]  # type: List[str]
+    socket_file_paths = [arg[len('--socket='):] for arg in sys.argv if arg.startswith('--socket=')]  # type: List[str]
+    args = [arg for arg in sys.argv if not arg.startswith('--')]  # type: List[str]
+    if serve_socket_file_paths:
+        from server_mod.daemon import GameDaemon
+        game_daemon = GameDaemon(args[1])  # type: GameDaemon
+        print('Daemon ready on ' + serve_socket_file_paths[0] + '.')
+        try:
+            game_daemon.serve(serve_socket_file_paths[0])
+        except KeyboardInterrupt:
+            pass
+    else:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as daemon_socket:
+            daemon_socket.connect(socket_file_paths[0])
+            with daemon_socket.makefile('rwb') as stream:
+                is_error = False  # type: bool
+                for request_line in args[1:] or sys.stdin:
+                    if request_line.strip():
+                        stream.write(request_line.strip().encode('utf-8') + b'\n')
+                        stream.flush()
+                        response_line = stream.readline().decode('utf-8')  # type: str
+                        is_error = is_error or 'error' in json.loads(response_line)
+                        print(response_line, end='')
+        sys.exit(1 if is_error else 0)
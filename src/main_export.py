@@ -0,0 +1,14 @@
+import sys
+
+from batch_mod import *
+
+
+if __name__ == "__main__":
+    # Usage: python main_export.py <journal_file> <SQLite_file>
+    # The summaries of the games of the journal (and the events of their turns if any) are added to the database.
+    n_games = 0  # type: int
+    with SqliteExporter(sys.argv[2]) as exporter:
+        for game_summary in ResultsJournal.read(sys.argv[1]):
+            exporter.export(game_summary)
+            n_games += 1
+    print(str(n_games) + ' game(s) exported.')
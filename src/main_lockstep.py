@@ -0,0 +1,26 @@
+import sys
+
+from server_mod import *
+from server_mod.lockstep import play_lockstep_client
+
+
+if __name__ == "__main__":
+    # Usage: python main_lockstep.py --hub=[<host>:]<port> <version> <seed> <players>...
+    #        python main_lockstep.py --connect=<host>:<port> <XML_file>
+    # The hub gives the seats (e.g. red green=Basic: the color without AI name is a human) to the clients in the order
+    # of their connections, then relays their decisions; each client plays the whole game locally.
+    hub_addresses = [arg[len('--hub='):] for arg in sys.argv if arg.startswith('--hub=')]  # type: List[str]
+    connect_addresses = [arg[len('--connect='):] for arg in sys.argv if arg.startswith('--connect=')]  # type: List[str]
+    args = [arg for arg in sys.argv if not arg.startswith('--')]  # type: List[str]
+    if hub_addresses:
+        host, _separator, port = hub_addresses[0].rpartition(':')
+        seats = [tuple(arg.partition('=')[::2]) for arg in args[3:]]  # type: List[Tuple[str, str]]
+        lockstep_hub = LockstepHub(args[1], int(args[2]), seats, host or '127.0.0.1', int(port))  # type: LockstepHub
+        print('Hub on port ' + str(lockstep_hub.port) + ' waiting for ' + str(len(seats)) + ' clients.')
+        lockstep_hub.serve()
+        print(str(lockstep_hub.n_bytes_relayed) + ' bytes relayed.')
+    else:
+        host, _separator, port = connect_addresses[0].rpartition(':')
+        game_summary = play_lockstep_client(args[1], host, int(port), with_display=True)  # type: Dict
+        print(str(len(game_summary['state_hashes'])) + ' turns in sync, ' + str(game_summary['n_bytes_sent']) +
+              ' bytes sent.')
@@ -0,0 +1,17 @@
+import sys
+
+from batch_mod import *
+
+
+if __name__ == "__main__":
+    # Usage: python main_paired.py <XML_file> <version> <n_groups> <color>=<ai_name>...
+    # Each group of games shares a seed while the AIs are rotated through all the permutations of the seats.
+    seats = [tuple(player_arg.split('=')) for player_arg in sys.argv[4:]]  # type: List[Tuple[str, str]]
+    ai_stats = run_paired_games(sys.argv[1], sys.argv[2], [ai_name for color_player_name, ai_name in seats],
+                                [color_player_name for color_player_name, ai_name in seats], int(sys.argv[3]))
+    for ai_name, stats in ai_stats.items():
+        print(ai_name + ': ' + str(stats['n_games']) + ' games, score {:.4f}, '.format(stats['score']) +
+              'standard error {:.4f} (paired) vs {:.4f} (independent games)'.format(
+                  stats['paired_standard_error'], stats['unpaired_standard_error']) +
+              (', variance divided by {:.2f}.'.format(stats['variance_reduction'])
+               if stats['variance_reduction'] is not None else '.'))
@@ -0,0 +1,39 @@
+import cProfile
+import pstats
+import sys
+
+from batch_mod import *
+from benchmark_mod import *
+
+
+if __name__ == "__main__":
+    # Usage: python main_profile.py [--cprofile | --collapsed=<file>] <n_games> <XML_file> <version> <color>=<ai_name>...
+    # Games of AIs (seeds 0, 1...) are played without display under a sampling profiler (by default) or cProfile; the
+    # table of the hottest functions is printed and the collapsed stacks of the samples (for the flamegraph tools) are
+    # written into the file. cProfile only keeps the callers of each function (not the stacks), so it does not write
+    # collapsed stacks. This file is not named profile.py which would shadow the module profile of Python.
+    is_cprofile = '--cprofile' in sys.argv  # type: bool
+    collapsed_file_paths = [arg[len('--collapsed='):] for arg in sys.argv
+                            if arg.startswith('--collapsed=')]  # type: List[str]
+    if is_cprofile and collapsed_file_paths:
+        sys.exit('Usage error: --collapsed=<file> needs the sampling profiler, not --cprofile.')
+    args = [arg for arg in sys.argv if not arg.startswith('--')]  # type: List[str]
+    n_games = int(args[1])  # type: int
+    seats = [tuple(player_arg.split('=')) for player_arg in args[4:]]  # type: List[Tuple[str, str]]
+    game_tasks = [(args[2], args[3], seats, seed, False) for seed in range(n_games)]  # type: List[Tuple]
+    if is_cprofile:
+        profiler = cProfile.Profile()  # type: cProfile.Profile
+        profiler.enable()
+        for game_task in game_tasks:
+            play_game(game_task)
+        profiler.disable()
+        pstats.Stats(profiler).sort_stats('tottime').print_stats(30)
+    else:
+        with SamplingProfiler() as sampling_profiler:
+            for game_task in game_tasks:
+                play_game(game_task)
+        print(str(sampling_profiler.get_n_samples()) + ' samples.')
+        print(sampling_profiler.txt_hot_functions())
+        if collapsed_file_paths:
+            with open(collapsed_file_paths[0], 'w', encoding='utf-8') as collapsed_file:
+                collapsed_file.write(sampling_profiler.txt_collapsed_stacks())
@@ -0,0 +1,16 @@
+import sys
+
+from batch_mod import *
+
+
+if __name__ == "__main__":
+    # Usage: python main_rating.py <ratings_file> <n_players> <journal_file>...
+    # The ratings are updated with the games of the journals not read yet, saved, and the next matchups are proposed.
+    ratings = GlickoRatings.load(sys.argv[1])  # type: GlickoRatings
+    n_games = sum(ratings.update_from_journal(journal_file_path) for journal_file_path in sys.argv[3:])  # type: int
+    ratings.save(sys.argv[1])
+    print(str(n_games) + ' new game(s).')
+    for ai_name, (rating, rd, n_games_ai) in sorted(ratings.ratings.items(), key=lambda item: -item[1][0]):
+        print('{:20} {:7.1f} ± {:5.1f} ({} games)'.format(ai_name, rating, 2 * rd, n_games_ai))
+    print('Next matchups: ' + ', '.join(' vs '.join(matchup) for matchup in
+                                       ratings.propose_matchups(ratings.ratings.keys(), int(sys.argv[2]), 3)) + '.')
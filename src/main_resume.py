@@ -0,0 +1,23 @@
+import sys
+from os import path
+
+from game_mod import *
+
+
+if __name__ == "__main__":
+    # Usage: python main_resume.py <checkpoint_file> <XML_file> <version> <players>...
+    # The game of the checkpoint file is resumed if it exists, otherwise a new game is started; a checkpoint is saved
+    # at the end of each turn so that the game can be stopped (e.g. Ctrl+C) and resumed later from the last turn. The
+    # checkpoint file is deleted at the end of the game.
+    print('Hello.')
+    checkpoint_file_path = sys.argv[1]  # type: str
+    game_element = GameElement(sys.argv[:1] + sys.argv[2:])  # type: GameElement
+    if path.isfile(checkpoint_file_path):
+        print('The game is resumed from ' + checkpoint_file_path + '.')
+        game = resume_game(game_element, Checkpoint.load(checkpoint_file_path))  # type: Game
+    else:
+        game = game_element.game
+        game.setup()
+    game.listeners.append(Checkpointer(checkpoint_file_path))
+    game.play()
+    print('Bye.')
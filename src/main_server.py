@@ -0,0 +1,33 @@
+import asyncio
+import sys
+
+from server_mod import *
+
+
+async def serve(game_server: GameServer, tcp_addresses, socket_file_paths) -> None:
+    """Serve the games over TCP and Unix sockets until interrupted."""
+    servers = list()  # type: List[asyncio.AbstractServer]
+    for tcp_address in tcp_addresses:
+        host, _separator, port = tcp_address.rpartition(':')
+        servers.append(await game_server.start_tcp(host or '127.0.0.1', int(port)))
+    for socket_file_path in socket_file_paths:
+        servers.append(await game_server.start_unix(socket_file_path))
+    await asyncio.gather(*[server.serve_forever() for server in servers])
+
+
+if __name__ == "__main__":
+    # Usage: python main_server.py [--tcp=[<host>:]<port>] [--unix=<socket_file>] [--move-timeout=<seconds>] <XML_file> <version>
+    # A client (e.g. nc 127.0.0.1 <port>) sends the players as for main.py and optionally a seed, e.g. 'red green=Basic
+    # seed=42', then plays the human seat by answering line by line; a random move is played without answer in time.
+    tcp_addresses = [arg[len('--tcp='):] for arg in sys.argv if arg.startswith('--tcp=')]  # type: List[str]
+    socket_file_paths = [arg[len('--unix='):] for arg in sys.argv if arg.startswith('--unix=')]  # type: List[str]
+    move_timeouts = [float(arg[len('--move-timeout='):]) for arg in sys.argv
+                     if arg.startswith('--move-timeout=')]  # type: List[float]
+    args = [arg for arg in sys.argv if not arg.startswith('--')]  # type: List[str]
+    game_server = GameServer(args[1], args[2], *move_timeouts[:1])  # type: GameServer
+    try:
+        asyncio.run(serve(game_server, tcp_addresses or ['127.0.0.1:7777'], socket_file_paths))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        game_server.close()
@@ -0,0 +1,28 @@
+import sys
+
+from batch_mod import *
+
+
+if __name__ == "__main__":
+    # Usage: python main_sweep.py <cache_dir> <n_games> <XML_file> <version> <color>=<ai_name>... --set <path>=<value>,<value>...
+    # E.g. --set setup/setup_player/n_cards_in_hand=3,4 --set phase_income/gain/n_deniers=2,3
+    # The path of an element of the XML file follows the syntax of ElementTree (e.g. ".//player_building[name='Lawyer']/cost/n_food_cubes").
+    grid = dict()  # type: Dict[str, List[str]]
+    args = list()  # type: List[str]
+    i_arg = 1  # type: int
+    while i_arg < len(sys.argv):
+        if sys.argv[i_arg] == '--set':
+            path, values = sys.argv[i_arg + 1].rsplit('=', 1)
+            grid[path] = values.split(',')
+            i_arg += 2
+        else:
+            args.append(sys.argv[i_arg])
+            i_arg += 1
+    seats = [tuple(player_arg.split('=')) for player_arg in args[4:]]  # type: List[Tuple[str, str]]
+    for overrides, stats in run_sweep(args[2], grid, args[3], seats, int(args[1]), args[0]):
+        print(', '.join(path + '=' + value for path, value in overrides.items()) + ': ' +
+              str(stats['n_games']) + ' games, ' +
+              'score {mean:.2f} ± {stdev:.2f} [{min}..{max}], '.format(**stats['scores']) +
+              'winner score {mean:.2f} ± {stdev:.2f}, '.format(**stats['winner_scores']) +
+              'turns {mean:.2f} ± {stdev:.2f} [{min}..{max}], '.format(**stats['lengths']) +
+              'win rates ' + ' '.join('{:.3f}'.format(win_rate) for win_rate in stats['win_rates_seats']))
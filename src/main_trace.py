@@ -0,0 +1,21 @@
+import contextlib
+import sys
+
+from game_mod import *
+
+from game_mod.utils import no_display
+
+
+if __name__ == "__main__":
+    # Usage: python main_trace.py <trace_JSON_file> <seed> <XML_file> <version> <players>...
+    # A game is played and its spans (turns, phases, effects and decisions) are written as a Chrome trace which opens in
+    # a trace viewer (e.g. chrome://tracing or https://ui.perfetto.dev). A game of AIs is played without display.
+    game_element = GameElement(sys.argv[:1] + sys.argv[3:])  # type: GameElement
+    game = game_element.game  # type: Game
+    chrome_tracer = ChromeTracer()  # type: ChromeTracer
+    chrome_tracer.attach(game)
+    with no_display() if not any(player.is_human() for player in game.players) else contextlib.nullcontext():
+        game.setup(int(sys.argv[2]))
+        game.play()
+    chrome_tracer.write(sys.argv[1])
+    print(str(len(chrome_tracer.events)) + ' events written into ' + sys.argv[1] + '.')
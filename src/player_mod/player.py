@@ -45,6 +45,10 @@ class Player():
     """
 
     txt_separator_name = '='  # type: str
+    choose_method_names = ('choose_discard_hand_for_new', 'choose_action', 'choose_n_provost_movement',
+                           'choose_buy_resource', 'choose_buy_resource_multi', 'choose_buy_castle_multi',
+                           'choose_exchange_resource', 'choose_construct_residence',
+                           'choose_n_batches_to_castle')  # type: Tuple[str] # All the decisions of a player.
     n_workers = None  # type: int
     money_resources = None  # type: Dict[MoneyResource, int]
     n_prestige_pts = None  # type: int # Number of prestige points obtained from tokens of the castle and prestige buildings for a beginner version.
@@ -58,6 +62,8 @@ class Player():
         self.current_money_resources = None  # type: Dict[MoneyResource, int]
         self.current_n_prestige_pts = None  # type: int
         self.deck = None  # type: Dict[PlayerBuilding, Location]
+        self.random = None  # type: random.Random # Random number generator of the player (used by the AIs).
+        self.metrics = None  # type: Optional[MetricsRegistry] # Registry of the metrics if measured (e.g. the nodes expanded by a search AI).
 
     def name(self) -> str:
         """Get the default name of the player."""
@@ -68,13 +74,20 @@ class Player():
         """Indicates whether the player is a human or an artificial intelligence."""
         pass
 
-    def setup(self) -> None:
-        """Setup the player."""
+    def setup(self, random_generator: random.Random = None) -> None:
+        """Setup the player with his/her own random number generator."""
         self.color_player.player = self
+        self.random = random.Random() if random_generator is None else random_generator
         self.current_n_workers = Player.n_workers
         self.current_money_resources = Player.money_resources.copy()
         self.current_n_prestige_pts = Player.n_prestige_pts
 
+    def decorate_choose_methods(self, decorator) -> None:
+        """Decorate all the choose methods (that is the decisions) of this player, e.g. to record or to time them."""
+        # :param decorator: # type: Callable[[str, Callable], Callable] # From the name and the choose method to the decorated choose method.
+        for choose_method_name in Player.choose_method_names:
+            setattr(self, choose_method_name, decorator(choose_method_name, getattr(self, choose_method_name)))
+
     def get_residence_building(self):  # -> BackgroundPlayerBuilding:
         return self.color_player.background_player_building
 
@@ -455,40 +468,40 @@ class AIPlayer(Player):
         return False
 
     def choose_discard_hand_for_new(self) -> bool:
-        return bool(random.getrandbits(1))  # proba(True) = proba(False) = 0.5
+        return bool(self.random.getrandbits(1))  # proba(True) = proba(False) = 0.5
 
     def choose_action(self, possible_actions):
-        return possible_actions[random.randrange(len(possible_actions))]
+        return possible_actions[self.random.randrange(len(possible_actions))]
 
     def choose_n_provost_movement(self, n_min_provost_movements_player: int,
                                   n_max_provost_movements_player: int) -> int:
-        return random.randint(n_min_provost_movements_player,
-                              n_max_provost_movements_player)  # n_min_provost_movements_player..n_max_provost_movements_player
+        return self.random.randint(n_min_provost_movements_player,
+                                   n_max_provost_movements_player)  # n_min_provost_movements_player..n_max_provost_movements_player
 
     def choose_buy_resource(self, money_resource_cost: MoneyResource, qty_cost: int, resource_gain_choices,
                             qty_gain: int) -> Resource:
-        n_choice = random.randrange(len(resource_gain_choices) + 1)  # type: int
+        n_choice = self.random.randrange(len(resource_gain_choices) + 1)  # type: int
         return None if n_choice == len(resource_gain_choices) else resource_gain_choices[n_choice]
 
     def choose_buy_resource_multi(self, costs, resource_gain_choices, qty_gain: int):  # -> List[Resource]
         choices = [list(choice) for n_parts in range(qty_gain + 1)
                    for choice in itertools.combinations_with_replacement(resource_gain_choices, n_parts)]
-        return choices[random.randrange(len(choices))]
+        return choices[self.random.randrange(len(choices))]
 
     def choose_buy_castle_multi(self, costs, castle_gain_choices):  # -> List[Castle]
-        return castle_gain_choices[:random.randrange(len(castle_gain_choices) + 1)]
+        return castle_gain_choices[:self.random.randrange(len(castle_gain_choices) + 1)]
 
     def choose_exchange_resource(self, can_no_use_effect: bool, qty_cost: int, resource_cost_choices,
                                  money_resource_gain: MoneyResource, qty_gain: int) -> Resource:
-        n_choice = random.randrange(len(resource_cost_choices) + (1 if can_no_use_effect else 0))  # type: int
+        n_choice = self.random.randrange(len(resource_cost_choices) + (1 if can_no_use_effect else 0))  # type: int
         return None if n_choice == len(resource_cost_choices) else resource_cost_choices[n_choice]
 
     def choose_construct_residence(self, resource_costs, i_road_buildings_on_road):  # -> Optional[Tuple[int, Building]]
-        n_choice = random.randrange(len(i_road_buildings_on_road) + 1)  # type: int
+        n_choice = self.random.randrange(len(i_road_buildings_on_road) + 1)  # type: int
         return None if n_choice == len(i_road_buildings_on_road) else i_road_buildings_on_road[n_choice]
 
     def choose_n_batches_to_castle(self, n_max_batches_to_castle: int) -> int:
-        return random.randrange(n_max_batches_to_castle + 1)  # 0..n_max_batches_to_castle
+        return self.random.randrange(n_max_batches_to_castle + 1)  # 0..n_max_batches_to_castle
 
 
 class BasicAIPlayer(AIPlayer):
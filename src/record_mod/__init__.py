@@ -0,0 +1,6 @@
+from record_mod.record import GameRecord
+from record_mod.record import GameRecorder
+from record_mod.record import ReplayPlayer
+from record_mod.record import DecisionReader
+from record_mod.record import replay_game
+from record_mod.record import seek_game
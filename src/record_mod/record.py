@@ -0,0 +1,307 @@
+#!/usr/bin/python
+import bisect
+import contextlib
+import itertools
+
+from game_mod import *
+from player_mod import *
+from moneyres_mod import *
+
+from game_mod.utils import no_display
+from game_mod.utils import read_txt
+from game_mod.utils import read_varint
+from game_mod.utils import write_txt
+from game_mod.utils import write_varint
+
+
+def get_ai_name(player) -> str:
+    """Get the AI name of a player (an empty name for a human player)."""
+    return '' if player.is_human() else player.ai_name
+
+
+def get_choices_buy_resource_multi(resource_gain_choices, qty_gain: int):  # -> List[List[Resource]]
+    """Get all the possible choices to buy resources 0, 1 or more times (in the same order as the AIs)."""
+    return [list(choice) for n_parts in range(qty_gain + 1)
+            for choice in itertools.combinations_with_replacement(resource_gain_choices, n_parts)]
+
+
+def encode_choice(choose_method_name: str, args, choice) -> int:
+    """Encode the choice (result) of a choose method of a player for its arguments as a non-negative integer."""
+    if choose_method_name == 'choose_discard_hand_for_new':
+        return int(choice)
+    elif choose_method_name == 'choose_action':
+        possible_actions = args[0]
+        return [i_possible_actions for i_possible_actions, possible_action in enumerate(possible_actions)
+                if possible_action is choice][0]
+    elif choose_method_name == 'choose_n_provost_movement':
+        n_min_provost_movements_player = args[0]  # type: int
+        return choice - n_min_provost_movements_player  # Provost delta from the minimum.
+    elif choose_method_name in ['choose_buy_resource', 'choose_exchange_resource']:
+        resource_choices = args[2]  # type: List[Resource]
+        return len(resource_choices) if choice is None else resource_choices.index(choice)
+    elif choose_method_name == 'choose_buy_resource_multi':
+        return get_choices_buy_resource_multi(args[1], args[2]).index(list(choice))
+    elif choose_method_name == 'choose_buy_castle_multi':
+        return len(choice)
+    elif choose_method_name == 'choose_construct_residence':
+        i_road_buildings_on_road = args[1]  # type: List[Tuple[int, PlayerBuilding]]
+        return len(i_road_buildings_on_road) if choice is None else i_road_buildings_on_road.index(choice)
+    elif choose_method_name == 'choose_n_batches_to_castle':
+        return choice
+    else:
+        raise Exception('Choose method ' + choose_method_name + ' unknown.')
+
+
+def decode_choice(choose_method_name: str, args, n_choice: int):
+    """Decode the choice (result) of a choose method of a player for its arguments from a non-negative integer."""
+    if choose_method_name == 'choose_discard_hand_for_new':
+        return bool(n_choice)
+    elif choose_method_name == 'choose_action':
+        return args[0][n_choice]
+    elif choose_method_name == 'choose_n_provost_movement':
+        return args[0] + n_choice
+    elif choose_method_name in ['choose_buy_resource', 'choose_exchange_resource']:
+        resource_choices = args[2]  # type: List[Resource]
+        return None if n_choice == len(resource_choices) else resource_choices[n_choice]
+    elif choose_method_name == 'choose_buy_resource_multi':
+        return get_choices_buy_resource_multi(args[1], args[2])[n_choice]
+    elif choose_method_name == 'choose_buy_castle_multi':
+        return args[1][:n_choice]
+    elif choose_method_name == 'choose_construct_residence':
+        i_road_buildings_on_road = args[1]  # type: List[Tuple[int, PlayerBuilding]]
+        return None if n_choice == len(i_road_buildings_on_road) else i_road_buildings_on_road[n_choice]
+    elif choose_method_name == 'choose_n_batches_to_castle':
+        return n_choice
+    else:
+        raise Exception('Choose method ' + choose_method_name + ' unknown.')
+
+
+class GameRecord:
+    """Compact record of a game: version, seed, seats, the stream of the decisions of the players and keyframes."""
+    """
+    The decisions are a stream of varints, one per decision of a player in the order of the game, each one encoding the
+    choice among the possibilities offered to the player (e.g. index of an action, Provost delta, number of batches).
+    A keyframe is a snapshot of the game at the beginning of a turn with the index of the next decision in the stream:
+    seeking a turn and a phase only replays from the last keyframe before it.
+    """
+
+    MAGIC = b'CMCR'  # type: bytes
+    FORMAT_VERSION = 1  # type: int
+
+    def __init__(self, version_name: str, seed: int, seats, decisions: bytes = b'', keyframes=None):
+        """Initialization of a record of a game."""
+        self.version_name = version_name  # type: str
+        self.seed = seed  # type: int
+        self.seats = seats  # type: List[Tuple[str, str]] # Color and AI name (empty for a human) of each player in the order of the game.
+        self.decisions = bytearray(decisions)  # type: bytearray
+        self.keyframes = list() if keyframes is None else keyframes  # type: List[Tuple[int, int, bytes]] # Number of the turn, index of the next decision and snapshot; sorted by turn.
+
+    def to_bytes(self) -> bytes:
+        """Get the binary form of the record."""
+        buffer = bytearray(GameRecord.MAGIC)  # type: bytearray
+        write_varint(buffer, GameRecord.FORMAT_VERSION)
+        write_txt(buffer, self.version_name)
+        write_varint(buffer, self.seed)
+        write_varint(buffer, len(self.seats))
+        for color_player_name, ai_name in self.seats:
+            write_txt(buffer, color_player_name)
+            write_txt(buffer, ai_name)
+        write_varint(buffer, len(self.decisions))
+        buffer.extend(self.decisions)
+        write_varint(buffer, len(self.keyframes))
+        for n_turns, i_decisions, snapshot_bytes in self.keyframes:
+            write_varint(buffer, n_turns)
+            write_varint(buffer, i_decisions)
+            write_varint(buffer, len(snapshot_bytes))
+            buffer.extend(snapshot_bytes)
+        return bytes(buffer)
+
+    @staticmethod
+    def from_bytes(data: bytes):  # -> GameRecord
+        """Get a record from its binary form."""
+        if data[:len(GameRecord.MAGIC)] != GameRecord.MAGIC:
+            raise Exception('The data is not a record of a game.')
+        format_version, i_data = read_varint(data, len(GameRecord.MAGIC))
+        if format_version != GameRecord.FORMAT_VERSION:
+            raise Exception('The format version ' + str(format_version) + ' of the record is not supported.')
+        version_name, i_data = read_txt(data, i_data)
+        seed, i_data = read_varint(data, i_data)
+        n_seats, i_data = read_varint(data, i_data)
+        seats = list()  # type: List[Tuple[str, str]]
+        for _i_seat in range(n_seats):
+            color_player_name, i_data = read_txt(data, i_data)
+            ai_name, i_data = read_txt(data, i_data)
+            seats.append((color_player_name, ai_name))
+        n_decisions_bytes, i_data = read_varint(data, i_data)
+        decisions = data[i_data:i_data + n_decisions_bytes]  # type: bytes
+        i_data += n_decisions_bytes
+        n_keyframes, i_data = read_varint(data, i_data)
+        keyframes = list()  # type: List[Tuple[int, int, bytes]]
+        for _i_keyframe in range(n_keyframes):
+            n_turns, i_data = read_varint(data, i_data)
+            i_decisions, i_data = read_varint(data, i_data)
+            n_snapshot_bytes, i_data = read_varint(data, i_data)
+            keyframes.append((n_turns, i_decisions, bytes(data[i_data:i_data + n_snapshot_bytes])))
+            i_data += n_snapshot_bytes
+        return GameRecord(version_name, seed, seats, decisions, keyframes)
+
+    def save(self, file_path: str) -> None:
+        """Save the record into a file."""
+        with open(file_path, 'wb') as record_file:
+            record_file.write(self.to_bytes())
+
+    @staticmethod
+    def load(file_path: str):  # -> GameRecord
+        """Load a record from a file."""
+        with open(file_path, 'rb') as record_file:
+            return GameRecord.from_bytes(record_file.read())
+
+
+class GameRecorder(GameListener):
+    """Recorder of the decisions of all the players of a game and of keyframes (to create before the setup of the game)."""
+
+    def __init__(self, game, n_turns_between_keyframes: int = 1):
+        """Initialization of the recorder: the choose methods of the players are decorated and the game is listened."""
+        self.game = game  # type: Game
+        self.n_turns_between_keyframes = n_turns_between_keyframes  # type: int # 0 for no keyframe.
+        self.record = GameRecord(game.version.name, None, [(player.color_player.name, get_ai_name(player))
+                                                           for player in game.players])  # type: GameRecord
+        for player in game.players:
+            player.decorate_choose_methods(self.decorate_choose_method)
+        game.listeners.append(self)
+
+    def decorate_choose_method(self, choose_method_name: str, choose_method):
+        """Decorate a choose method of a player in order to record the choice."""
+        def record_choose_method(*args):
+            choice = choose_method(*args)
+            write_varint(self.record.decisions, encode_choice(choose_method_name, args, choice))
+            return choice
+        return record_choose_method
+
+    def turn_begin(self, game) -> None:
+        """Record a keyframe at the beginning of some turns."""
+        if self.n_turns_between_keyframes > 0 and (game.n_turns - 1) % self.n_turns_between_keyframes == 0:
+            self.record.keyframes.append((game.n_turns, len(self.record.decisions),
+                                          GameSnapshot.take(game).to_bytes()))
+
+    def get_record(self):  # -> GameRecord
+        """Get the record of the game (once the setup is done)."""
+        self.record.seed = self.game.seed
+        return self.record
+
+
+class DecisionReader:
+    """Reader of the stream of the decisions of a record."""
+
+    def __init__(self, decisions: bytes):
+        """Initialization of the reader at the beginning of the decisions."""
+        self.decisions = bytes(decisions)  # type: bytes
+        self.i_decisions = 0  # type: int # Index of the next decision to read.
+
+    def read(self) -> int:
+        """Read the next decision."""
+        if self.i_decisions >= len(self.decisions):
+            raise Exception('The record has no more decisions.')
+        n_choice, self.i_decisions = read_varint(self.decisions, self.i_decisions)
+        return n_choice
+
+
+class ReplayPlayer(Player):
+    """Player replaying the decisions of a seat of a record."""
+
+    def __init__(self, color_player: ColorPlayer, ai_name: str, decision_reader: DecisionReader):
+        """Initialization of a replay player."""
+        Player.__init__(self, color_player)
+        self.ai_name = ai_name  # type: str # Empty for a human player.
+        self.decision_reader = decision_reader  # type: DecisionReader # Shared by all the players of the game.
+
+    def is_human(self) -> bool:
+        """Indicates that a replay player is not an human player (nothing is asked)."""
+        return False
+
+    def name(self) -> str:
+        """Get the name of the recorded player."""
+        return '"' + self.color_player.name + Player.txt_separator_name + \
+               (self.ai_name if self.ai_name else 'you!') + '"'
+
+    def replay_choice(self, choose_method_name: str, args):
+        """Replay the next recorded choice for a choose method."""
+        return decode_choice(choose_method_name, args, self.decision_reader.read())
+
+    def choose_discard_hand_for_new(self) -> bool:
+        return self.replay_choice('choose_discard_hand_for_new', ())
+
+    def choose_action(self, possible_actions):
+        return self.replay_choice('choose_action', (possible_actions,))
+
+    def choose_n_provost_movement(self, n_min_provost_movements_player: int,
+                                  n_max_provost_movements_player: int) -> int:
+        return self.replay_choice('choose_n_provost_movement',
+                                  (n_min_provost_movements_player, n_max_provost_movements_player))
+
+    def choose_buy_resource(self, money_resource_cost: MoneyResource, qty_cost: int, resource_gain_choices,
+                            qty_gain: int) -> Resource:
+        return self.replay_choice('choose_buy_resource',
+                                  (money_resource_cost, qty_cost, resource_gain_choices, qty_gain))
+
+    def choose_buy_resource_multi(self, costs, resource_gain_choices, qty_gain: int):  # -> List[Resource]
+        return self.replay_choice('choose_buy_resource_multi', (costs, resource_gain_choices, qty_gain))
+
+    def choose_buy_castle_multi(self, costs, castle_gain_choices):  # -> List[Castle]
+        return self.replay_choice('choose_buy_castle_multi', (costs, castle_gain_choices))
+
+    def choose_exchange_resource(self, can_no_use_effect: bool, qty_cost: int, resource_cost_choices,
+                                 money_resource_gain: MoneyResource, qty_gain: int) -> Resource:
+        return self.replay_choice('choose_exchange_resource',
+                                  (can_no_use_effect, qty_cost, resource_cost_choices, money_resource_gain, qty_gain))
+
+    def choose_construct_residence(self, resource_costs, i_road_buildings_on_road):  # -> Optional[Tuple[int, Building]]
+        return self.replay_choice('choose_construct_residence', (resource_costs, i_road_buildings_on_road))
+
+    def choose_n_batches_to_castle(self, n_max_batches_to_castle: int) -> int:
+        return self.replay_choice('choose_n_batches_to_castle', (n_max_batches_to_castle,))
+
+
+def create_replay_game(game_element, record: GameRecord):  # -> Tuple[Game, DecisionReader]
+    """Create the game (not set up) replaying a record and the reader of its decisions."""
+    version = [version for version in game_element.versions
+               if version.name == record.version_name][0]  # type: Version
+    color_players = {color_player.name: color_player
+                     for color_player in game_element.color_players}  # type: Dict[str, ColorPlayer]
+    decision_reader = DecisionReader(record.decisions)  # type: DecisionReader
+    players = [ReplayPlayer(color_players[color_player_name], ai_name, decision_reader)
+               for color_player_name, ai_name in record.seats]  # type: List[ReplayPlayer]
+    game = Game(game_element, version, players)  # type: Game
+    game_element.game = game  # The buildings (e.g. lawyer, church) refer to the game of the elements.
+    return game, decision_reader
+
+
+def replay_game(game_element, record: GameRecord, with_display: bool = False):  # -> Game
+    """Replay a recorded game (without display by default) and return it once ended."""
+    game, _decision_reader = create_replay_game(game_element, record)  # type: Game, DecisionReader
+    with contextlib.nullcontext() if with_display else no_display():
+        game.setup(record.seed)
+        game.play()
+    return game
+
+
+def seek_game(game_element, record: GameRecord, n_turns: int, phase_numero: int = 1):  # -> Game
+    """Replay a recorded game (without display) up to the beginning of a phase of a turn from the last keyframe before it."""
+    game, decision_reader = create_replay_game(game_element, record)  # type: Game, DecisionReader
+    with no_display():
+        game.setup(record.seed)
+        i_keyframes = bisect.bisect_right([keyframe[0] for keyframe in record.keyframes], n_turns)  # type: int
+        if i_keyframes == 0:
+            # No keyframe before the turn: the game is replayed from its beginning.
+            game.begin_turn()
+        else:
+            _n_turns_keyframe, decision_reader.i_decisions, snapshot_bytes = record.keyframes[i_keyframes - 1]
+            GameSnapshot.from_bytes(snapshot_bytes).restore(game)
+        while game.n_turns < n_turns:
+            game.play_phases()
+            if game.game_ended():
+                raise Exception('The game ended at the turn ' + str(game.n_turns) + ' before the turn ' +
+                                str(n_turns) + '.')
+            game.begin_turn()
+        game.play_phases(1, phase_numero - 1)
+    return game
@@ -0,0 +1,9 @@
+from server_mod.server import GameServer
+from server_mod.server import MoveTimeoutError
+from server_mod.lockstep import LockstepHub
+from server_mod.lockstep import LockstepClient
+from server_mod.lockstep import DesyncError
+from server_mod.lockstep import play_lockstep_loopback
+from server_mod.daemon import GameDaemon
+from server_mod.daemon import DaemonClient
+from server_mod.daemon import DaemonError
@@ -0,0 +1,158 @@
+#!/usr/bin/python
+import json
+import os
+import socket
+import socketserver
+import stat
+import threading
+import time
+
+from batch_mod.batch import get_game_element
+from batch_mod.batch import play_game
+from batch_mod.batch import play_games
+from batch_mod.batch import run_batch
+
+
+class DaemonError(Exception):
+    """Error of a request to the daemon (e.g. an unknown command or version)."""
+    pass
+
+
+class GameDaemon:
+    """Resident daemon playing the games of AIs asked over a Unix socket with the elements of the game loaded once."""
+    """
+    The requests and the responses are JSON lines, e.g.
+    {"command": "play", "version": "Standard", "seats": [["red", "Basic"], ["green", "Advanced"]], "seed": 3}
+    gets {"summary": {...}} (with "events", "timings" and "metrics" true, the summary has them);
+    {"command": "batch", "version": ..., "seats": ..., "first_seed": 0, "n_games": 100} gets {"summaries": [...]}
+    or, with "journal": <file>, the summaries are appended to the journal and {"n_games_played": 100} is got;
+    {"command": "status"} gets the requests and games served; {"command": "shutdown"} stops the daemon.
+    An error gets {"error": <message>}. Since the games share the elements of the game, the connections are served one
+    after the other (a connection may send many requests).
+    """
+
+    def __init__(self, xml_file_path: str, warm_up_version_name: str = 'Standard'):
+        """Initialization of the daemon: the elements of the game are loaded and a game is played to warm up the code."""
+        self.xml_file_path = xml_file_path  # type: str
+        self.time_begin = time.perf_counter()  # type: float
+        self.n_requests = 0  # type: int
+        self.n_games_played = 0  # type: int
+        self.unix_server = None  # type: Optional[socketserver.UnixStreamServer]
+        seats = [('red', 'Basic'), ('green', 'Basic')]  # type: List[Tuple[str, str]]
+        get_game_element(xml_file_path, warm_up_version_name, seats)
+        play_game((xml_file_path, warm_up_version_name, seats, 0, False))
+
+    def handle_request(self, request: dict) -> dict:
+        """Handle a request and get its response."""
+        self.n_requests += 1
+        command = request.get('command')  # type: str
+        if command == 'play':
+            game_summary = play_game(self.get_game_task(request, request.get('seed')),
+                                     with_timings=bool(request.get('timings')),
+                                     with_metrics=bool(request.get('metrics')))  # type: Dict
+            self.n_games_played += 1
+            return {'summary': game_summary}
+        elif command == 'batch':
+            first_seed, n_games = int(request['first_seed']), int(request['n_games'])  # type: int, int
+            if 'journal' in request:
+                self.get_game_task(request, first_seed)  # Checked before the journal is opened.
+                n_games_played = run_batch(request['journal'], self.xml_file_path, request['version'],
+                                           self.get_seats(request), first_seed, n_games, n_processes=0,
+                                           with_events=bool(request.get('events')),
+                                           with_metrics=bool(request.get('metrics')))  # type: int
+                self.n_games_played += n_games_played
+                return {'n_games_played': n_games_played}
+            game_summaries = [game_summary for _game_task, game_summary
+                              in play_games((self.get_game_task(request, first_seed + i_game)
+                                             for i_game in range(n_games)), 0,
+                                            with_timings=bool(request.get('timings')),
+                                            with_metrics=bool(request.get('metrics')))]  # type: List[Dict]
+            self.n_games_played += len(game_summaries)
+            return {'summaries': game_summaries}
+        elif command == 'status':
+            return {'uptime': time.perf_counter() - self.time_begin, 'n_requests': self.n_requests,
+                    'n_games_played': self.n_games_played}
+        elif command == 'shutdown':
+            if self.unix_server is not None:
+                # The server is shut down from another thread since it waits for the end of its loop.
+                threading.Thread(target=self.unix_server.shutdown).start()
+            return {'shutdown': True}
+        raise DaemonError('Command ' + str(command) + ' unknown.')
+
+    def get_seats(self, request: dict):  # -> List[Tuple[str, str]]
+        """Get the seats (color and AI name) of a request."""
+        seats = [(color_player_name, ai_name) for color_player_name, ai_name in request['seats']]  # type: List[Tuple[str, str]]
+        if any(not ai_name for _color_player_name, ai_name in seats):
+            raise DaemonError('Only seats of AIs are expected.')
+        return seats
+
+    def get_game_task(self, request: dict, seed: int):  # -> Tuple[str, str, List[Tuple[str, str]], int, bool]
+        """Get the task of a game of a request for a seed (None for a random one)."""
+        seats = self.get_seats(request)  # type: List[Tuple[str, str]]
+        game_element = get_game_element(self.xml_file_path, request['version'], seats)  # type: GameElement
+        if request['version'] not in [version.name for version in game_element.versions]:
+            raise DaemonError('Version ' + str(request['version']) + ' unknown.')
+        if not game_element.n_min_players <= len(seats) <= game_element.n_max_players:
+            raise DaemonError('From ' + str(game_element.n_min_players) + ' to ' + str(game_element.n_max_players) +
+                              ' seats are expected.')
+        return self.xml_file_path, request['version'], seats, seed, bool(request.get('events'))
+
+    def handle_line(self, line: bytes) -> bytes:
+        """Handle a request line and get its response line."""
+        try:
+            response = self.handle_request(json.loads(line))  # type: Dict
+        except Exception as error:  # The daemon goes on whatever the request.
+            response = {'error': type(error).__name__ + ': ' + str(error)}
+        return (json.dumps(response, separators=(',', ':')) + '\n').encode('utf-8')
+
+    def serve(self, socket_file_path: str) -> None:
+        """Serve the requests over a Unix socket until a shutdown request (the file of a previous socket is replaced)."""
+        daemon = self  # type: GameDaemon
+
+        class DaemonRequestHandler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for line in self.rfile:
+                    if line.strip():
+                        self.wfile.write(daemon.handle_line(line))
+
+        if os.path.exists(socket_file_path) and stat.S_ISSOCK(os.stat(socket_file_path).st_mode):
+            os.remove(socket_file_path)
+        try:
+            with socketserver.UnixStreamServer(socket_file_path, DaemonRequestHandler) as self.unix_server:
+                self.unix_server.serve_forever()
+        finally:
+            self.unix_server = None
+            if os.path.exists(socket_file_path):
+                os.remove(socket_file_path)
+
+
+class DaemonClient:
+    """Client of a game daemon over its Unix socket (a connection for many requests)."""
+
+    def __init__(self, socket_file_path: str):
+        """Initialization of the client connected to the daemon."""
+        self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)  # type: socket.socket
+        self.socket.connect(socket_file_path)
+        self.stream = self.socket.makefile('rwb')  # type: BinaryIO
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.stream.close()
+        self.socket.close()
+
+    def request(self, request: dict) -> dict:
+        """Send a request to the daemon and get its response; an error of the daemon raises a DaemonError."""
+        self.stream.write((json.dumps(request) + '\n').encode('utf-8'))
+        self.stream.flush()
+        line = self.stream.readline()  # type: bytes
+        if not line:
+            raise ConnectionError('The daemon closed the connection.')
+        response = json.loads(line)  # type: Dict
+        if 'error' in response:
+            raise DaemonError(response['error'])
+        return response
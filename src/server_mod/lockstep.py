@@ -0,0 +1,345 @@
+#!/usr/bin/python
+import concurrent.futures
+import contextlib
+import hashlib
+import socket
+import threading
+
+from game_mod import *
+from record_mod import *
+
+from batch_mod.batch import get_game_element
+from game_mod.utils import no_display
+from game_mod.utils import write_txt
+from game_mod.utils import write_varint
+from record_mod.record import encode_choice
+
+
+PROTOCOL_VERSION = 1  # type: int
+MSG_HELLO = 0  # type: int # Hub to client: protocol version, seat of the client, version of the game, seed and seats.
+MSG_DECISION = 1  # type: int # Seat and choice (encoded as in a record).
+MSG_HASH = 2  # type: int # Seat, number of the turn and hash of the state at the end of the turn.
+MSG_BYE = 3  # type: int # Seat whose game is over.
+N_BYTES_HASH = 8  # type: int
+
+
+class DesyncError(Exception):
+    """The state of a game differs from the one of another client (or the stream of the decisions is inconsistent)."""
+    pass
+
+
+def get_state_hash(game) -> bytes:
+    """Get the hash of the state of a game (its snapshot)."""
+    return hashlib.sha256(GameSnapshot.take(game).to_bytes()).digest()[:N_BYTES_HASH]
+
+
+def read_exactly(stream, n_bytes: int) -> bytes:
+    """Read some bytes from a (binary) stream; an error if it ends before."""
+    data = stream.read(n_bytes)  # type: bytes
+    if len(data) < n_bytes:
+        raise ConnectionError('The connection is closed.')
+    return data
+
+
+def read_stream_varint(stream) -> int:
+    """Read a varint from a (binary) stream."""
+    n = 0  # type: int
+    shift = 0  # type: int
+    while True:
+        byte = read_exactly(stream, 1)[0]  # type: int
+        n |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return n
+        shift += 7
+
+
+def read_stream_txt(stream) -> str:
+    """Read a text (its length then its UTF-8 bytes) from a (binary) stream."""
+    return read_exactly(stream, read_stream_varint(stream)).decode('utf-8')
+
+
+def write_hello(i_seat: int, version_name: str, seed: int, seats) -> bytes:
+    """Write the message of the beginning of a game for a seat."""
+    buffer = bytearray([MSG_HELLO])  # type: bytearray
+    write_varint(buffer, PROTOCOL_VERSION)
+    write_varint(buffer, i_seat)
+    write_txt(buffer, version_name)
+    write_varint(buffer, seed)
+    write_varint(buffer, len(seats))
+    for color_player_name, ai_name in seats:
+        write_txt(buffer, color_player_name)
+        write_txt(buffer, ai_name)
+    return bytes(buffer)
+
+
+def read_message(stream):  # -> Tuple[int, bytes, Tuple]
+    """Read a message of a client (decision, hash or bye) from a stream; get its type, its bytes and its fields."""
+    msg_type = read_exactly(stream, 1)[0]  # type: int
+    buffer = bytearray([msg_type])  # type: bytearray
+    if msg_type == MSG_DECISION:
+        fields = (read_stream_varint(stream), read_stream_varint(stream))  # type: Tuple
+        write_varint(buffer, fields[0])
+        write_varint(buffer, fields[1])
+    elif msg_type == MSG_HASH:
+        fields = (read_stream_varint(stream), read_stream_varint(stream), read_exactly(stream, N_BYTES_HASH))
+        write_varint(buffer, fields[0])
+        write_varint(buffer, fields[1])
+        buffer.extend(fields[2])
+    elif msg_type == MSG_BYE:
+        fields = (read_stream_varint(stream),)
+        write_varint(buffer, fields[0])
+    else:
+        raise DesyncError('Message type ' + str(msg_type) + ' unknown.')
+    return msg_type, bytes(buffer), fields
+
+
+class LockstepHub:
+    """Hub of a lockstep game: it gives their seats to the clients then relays the messages of each client to the other ones."""
+    """
+    The hub never plays the game: it only relays the decisions and the hashes of the states (a few bytes each).
+    If a client leaves before the end of its game, the connections of all the clients are closed.
+    """
+
+    def __init__(self, version_name: str, seed: int, seats, host: str = '127.0.0.1', port: int = 0):
+        """Initialization of the hub listening for the clients (a free port for 0)."""
+        self.version_name = version_name  # type: str
+        self.seed = seed  # type: int
+        self.seats = seats  # type: List[Tuple[str, str]] # Colors and AI names (empty for a human).
+        self.server_socket = socket.create_server((host, port))  # type: socket.socket
+        self.port = self.server_socket.getsockname()[1]  # type: int
+        self.client_sockets = list()  # type: List[socket.socket] # Indexed by the seats.
+        self.broadcast_lock = threading.Lock()  # type: threading.Lock
+        self.n_bytes_relayed = 0  # type: int
+
+    def serve(self) -> None:
+        """Give their seats to the clients (in the order of their connections) and relay their messages until the end."""
+        with self.server_socket:
+            for i_seat in range(len(self.seats)):
+                client_socket, _address = self.server_socket.accept()
+                client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                self.client_sockets.append(client_socket)
+        for i_seat, client_socket in enumerate(self.client_sockets):
+            client_socket.sendall(write_hello(i_seat, self.version_name, self.seed, self.seats))
+        relay_threads = [threading.Thread(target=self.relay, args=(i_seat,))
+                         for i_seat in range(len(self.seats))]  # type: List[threading.Thread]
+        for relay_thread in relay_threads:
+            relay_thread.start()
+        for relay_thread in relay_threads:
+            relay_thread.join()
+        for client_socket in self.client_sockets:
+            client_socket.close()
+
+    def relay(self, i_seat: int) -> None:
+        """Relay the messages of a client to the other ones until its bye."""
+        with self.client_sockets[i_seat].makefile('rb') as stream:
+            try:
+                while True:
+                    msg_type, data, _fields = read_message(stream)
+                    # A message is sent to all the other clients before any answer to it (e.g. the next decision).
+                    with self.broadcast_lock:
+                        for i_other_seat, other_socket in enumerate(self.client_sockets):
+                            if i_other_seat != i_seat:
+                                other_socket.sendall(data)
+                                self.n_bytes_relayed += len(data)
+                    if msg_type == MSG_BYE:
+                        return
+            except (ConnectionError, OSError, DesyncError):
+                # The client left before the end of its game: the other ones cannot go on.
+                for client_socket in self.client_sockets:
+                    try:
+                        client_socket.shutdown(socket.SHUT_RDWR)
+                    except OSError:
+                        pass
+
+
+class RemoteDecisionReader:
+    """Reader of the decisions of a remote seat (as the reader of the decisions of a record for a replay player)."""
+
+    def __init__(self, lockstep_client, i_seat: int):
+        self.lockstep_client = lockstep_client  # type: LockstepClient
+        self.i_seat = i_seat  # type: int
+
+    def read(self) -> int:
+        return self.lockstep_client.read_decision(self.i_seat)
+
+
+class RemotePlayer(ReplayPlayer):
+    """Player of a remote seat replaying the decisions received (a decision impossible here is a desync)."""
+
+    def replay_choice(self, choose_method_name: str, args):
+        try:
+            return ReplayPlayer.replay_choice(self, choose_method_name, args)
+        except IndexError:
+            raise DesyncError('Impossible decision of ' + self.name() + ' for ' + choose_method_name + '.')
+
+
+class LockstepClient(GameListener):
+    """Client of a lockstep game: the game is simulated locally from the seed and only the decisions are exchanged."""
+    """
+    The player of the seat of the client decides (an AI or a human) and its decisions are sent; the other seats replay
+    the decisions received. At the end of each turn, the hash of the state is sent and compared with the ones of the
+    other clients: a difference raises a DesyncError.
+    """
+
+    def __init__(self, client_socket: socket.socket, xml_file_path: str):
+        """Initialization of the client from the beginning of the game sent by the hub."""
+        self.client_socket = client_socket  # type: socket.socket
+        self.stream = client_socket.makefile('rb')  # type: BinaryIO
+        self.n_bytes_sent = 0  # type: int
+        if read_exactly(self.stream, 1)[0] != MSG_HELLO or read_stream_varint(self.stream) != PROTOCOL_VERSION:
+            raise DesyncError('Protocol unknown.')
+        self.i_seat = read_stream_varint(self.stream)  # type: int
+        version_name = read_stream_txt(self.stream)  # type: str
+        self.seed = read_stream_varint(self.stream)  # type: int
+        self.seats = [(read_stream_txt(self.stream), read_stream_txt(self.stream))
+                      for _i_seat in range(read_stream_varint(self.stream))]  # type: List[Tuple[str, str]]
+        game_element = get_game_element(xml_file_path, version_name, self.seats)  # type: GameElement
+        version = [version for version in game_element.versions if version.name == version_name][0]  # type: Version
+        color_players = {color_player.name: color_player
+                         for color_player in game_element.color_players}  # type: Dict[str, ColorPlayer]
+        players = [game_element.create_player(color_players[color_player_name], ai_name) if i_seat == self.i_seat
+                   else RemotePlayer(color_players[color_player_name], ai_name, RemoteDecisionReader(self, i_seat))
+                   for i_seat, (color_player_name, ai_name) in enumerate(self.seats)]  # type: List[Player]
+        players[self.i_seat].decorate_choose_methods(self.decorate_choose_method)
+        self.game = Game(game_element, version, players)  # type: Game
+        game_element.game = self.game  # The buildings (e.g. lawyer, church) refer to the game of the elements.
+        self.game.listeners.append(self)
+        self.state_hashes = list()  # type: List[bytes] # Hashes of the states at the end of the turns (indexed by the turns - 1).
+        self.other_state_hashes = list()  # type: List[Tuple[int, int, bytes]] # Hashes of the other clients not yet compared.
+        self.i_seats_over = set()  # type: Set[int] # Seats whose game is over.
+
+    def send(self, data: bytes) -> None:
+        """Send a message to the hub."""
+        self.client_socket.sendall(data)
+        self.n_bytes_sent += len(data)
+
+    def decorate_choose_method(self, choose_method_name: str, choose_method):
+        """Decorate a choose method of the player of the seat in order to send the choice."""
+        def send_choose_method(*args):
+            choice = choose_method(*args)
+            buffer = bytearray([MSG_DECISION])  # type: bytearray
+            write_varint(buffer, self.i_seat)
+            write_varint(buffer, encode_choice(choose_method_name, args, choice))
+            self.send(bytes(buffer))
+            return choice
+        return send_choose_method
+
+    def read_decision(self, i_seat: int) -> int:
+        """Read the next decision (of a seat) received; the hashes received meanwhile are compared."""
+        while True:
+            msg_type, _data, fields = read_message(self.stream)
+            if msg_type == MSG_DECISION:
+                if fields[0] != i_seat:
+                    raise DesyncError('Decision of the seat ' + str(fields[0]) + ' instead of the seat ' +
+                                      str(i_seat) + '.')
+                return fields[1]
+            self.receive(msg_type, fields)
+
+    def receive(self, msg_type: int, fields) -> None:
+        """Receive a hash or a bye of another client."""
+        if msg_type == MSG_HASH:
+            self.other_state_hashes.append(fields)
+            self.compare_state_hashes()
+        elif msg_type == MSG_BYE:
+            self.i_seats_over.add(fields[0])
+        else:
+            raise DesyncError('Unexpected decision of the seat ' + str(fields[0]) + '.')
+
+    def compare_state_hashes(self) -> None:
+        """Compare the hashes of the other clients with the ones of this client (for the turns already played)."""
+        other_state_hashes = list()  # type: List[Tuple[int, int, bytes]]
+        for i_seat, n_turns, state_hash in self.other_state_hashes:
+            if n_turns > len(self.state_hashes):
+                other_state_hashes.append((i_seat, n_turns, state_hash))  # This client is late.
+            elif state_hash != self.state_hashes[n_turns - 1]:
+                raise DesyncError('The state of the seat ' + str(i_seat) + ' differs at the end of the turn ' +
+                                  str(n_turns) + '.')
+        self.other_state_hashes = other_state_hashes
+
+    def phase_end(self, game, phase_numero: int) -> None:
+        """Send the hash of the state at the end of each turn."""
+        if phase_numero == 6:
+            state_hash = get_state_hash(game)  # type: bytes
+            self.state_hashes.append(state_hash)
+            buffer = bytearray([MSG_HASH])  # type: bytearray
+            write_varint(buffer, self.i_seat)
+            write_varint(buffer, game.n_turns)
+            buffer.extend(state_hash)
+            self.send(bytes(buffer))
+            self.compare_state_hashes()
+
+    def play(self) -> None:
+        """Play the game then wait for the end of the games of the other clients (comparing their last hashes)."""
+        self.game.setup(self.seed)
+        self.game.play()
+        buffer = bytearray([MSG_BYE])  # type: bytearray
+        write_varint(buffer, self.i_seat)
+        self.send(bytes(buffer))
+        while len(self.i_seats_over) < len(self.seats) - 1:
+            msg_type, _data, fields = read_message(self.stream)
+            self.receive(msg_type, fields)
+        if self.other_state_hashes:
+            raise DesyncError('The games of the other clients have more turns.')
+
+    def close(self) -> None:
+        """Close the connection to the hub (the hub closes the other ones if the game is not over)."""
+        self.stream.close()
+        try:
+            self.client_socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.client_socket.close()
+
+
+def play_lockstep_client(xml_file_path: str, host: str, port: int, listeners=None, with_display: bool = False,
+                         connect_timeout: float = 60.0) -> dict:
+    """Play the seat given by a hub and get the summary of the game with its hashes and bytes sent."""
+    # :param listeners: # type: List[GameListener] # Other listeners of the local game.
+    # :param connect_timeout: # Seconds to connect to the hub; then the client waits for the other seats without
+    # timeout (e.g. a human thinking).
+    with socket.create_connection((host, port), timeout=connect_timeout) as client_socket:
+        client_socket.settimeout(None)
+        client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        lockstep_client = LockstepClient(client_socket, xml_file_path)  # type: LockstepClient
+        lockstep_client.game.listeners.extend(listeners or [])
+        try:
+            with contextlib.nullcontext() if with_display else no_display():
+                lockstep_client.play()
+        finally:
+            lockstep_client.close()
+    return {'i_seat': lockstep_client.i_seat,
+            'tot_n_prestige_pts': lockstep_client.game.get_tot_n_prestige_pts_players(),
+            'winners': [player.color_player.name for player in lockstep_client.game.winner_players],
+            'state_hashes': [state_hash.hex() for state_hash in lockstep_client.state_hashes],
+            'n_bytes_sent': lockstep_client.n_bytes_sent}
+
+
+def play_lockstep_loopback(xml_file_path: str, version_name: str, seats, seed: int, listeners_by_seat=None,
+                           connect_timeout: float = 60.0):
+    """Play a lockstep game with a local hub and a process per client (e.g. to test the protocol); get their summaries."""
+    """
+    If a client fails, its error is raised (a DesyncError before the errors of the clients left without their game).
+    """
+    # :param listeners_by_seat: # type: Dict[int, List[GameListener]] # Other listeners of the games of some clients (e.g. to simulate a desync).
+    lockstep_hub = LockstepHub(version_name, seed, seats)  # type: LockstepHub
+    hub_thread = threading.Thread(target=lockstep_hub.serve)  # type: threading.Thread
+    hub_thread.start()
+    try:
+        with concurrent.futures.ProcessPoolExecutor(len(seats)) as executor:
+            client_futures = list()  # type: List[concurrent.futures.Future]
+            for i_client in range(len(seats)):
+                client_futures.append(executor.submit(play_lockstep_client, xml_file_path, '127.0.0.1',
+                                                      lockstep_hub.port, (listeners_by_seat or {}).get(i_client),
+                                                      connect_timeout=connect_timeout))
+                # The seats are given in the order of the connections.
+                while len(lockstep_hub.client_sockets) <= i_client and not client_futures[-1].done():
+                    threading.Event().wait(0.001)
+            concurrent.futures.wait(client_futures)
+    finally:
+        hub_thread.join()
+    errors = [client_future.exception() for client_future in client_futures
+              if client_future.exception() is not None]  # type: List[BaseException]
+    if errors:
+        # The client which detected the desync (if any) is more telling than the other ones left without their game.
+        raise ([error for error in errors if isinstance(error, DesyncError)] + errors)[0]
+    return [client_future.result() for client_future in client_futures]
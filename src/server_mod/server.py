@@ -0,0 +1,263 @@
+#!/usr/bin/python
+import asyncio
+import concurrent.futures
+import sys
+import threading
+
+from game_mod import *
+from player_mod import *
+
+from game_mod.shared_state import SharedGameState
+from game_mod.utils import no_display
+
+
+class MoveTimeoutError(Exception):
+    """A human player did not answer in time (or is disconnected)."""
+    pass
+
+
+class ThreadLocalStream:
+    """Standard stream (stdout or stdin) of the current thread: the one of its seat if any, the default one otherwise."""
+    """
+    The games of the server are played by threads which display (print) and ask (input) through the standard streams,
+    so each thread of a game gets the streams of its seat.
+    """
+
+    def __init__(self, default_stream, thread_local: threading.local, name: str):
+        """Initialization of the stream from the default stream (e.g. sys.stdout)."""
+        self.default_stream = default_stream  # type: TextIO
+        self.thread_local = thread_local  # type: threading.local
+        self.name = name  # type: str # Name of the attribute of the stream of the thread ('stdout' or 'stdin').
+
+    def get_stream(self):  # -> TextIO
+        return getattr(self.thread_local, self.name, None) or self.default_stream
+
+    def write(self, text: str) -> int:
+        return self.get_stream().write(text)
+
+    def flush(self) -> None:
+        self.get_stream().flush()
+
+    def readline(self) -> str:
+        return self.get_stream().readline()
+
+
+class EngineLock:
+    """Lock of the engine: only one game goes on at a time, the other ones wait (e.g. for a human) or for the lock."""
+    """
+    Since the state of a game is partly kept by the elements of the game shared by all the games, the state of the
+    game leaving the engine is taken from the elements and the one of the game entering the engine is installed.
+    """
+
+    def __init__(self):
+        """Initialization of the lock (free)."""
+        self.lock = threading.Lock()  # type: threading.Lock
+        self.active_seat = None  # type: Optional[Seat] # Seat of the game which used the engine the last.
+
+    def acquire(self, seat) -> None:
+        """Acquire the engine for the game of a seat."""
+        self.lock.acquire()
+        if self.active_seat is not seat:
+            if self.active_seat is not None and self.active_seat.game is not None:
+                self.active_seat.shared_game_state = SharedGameState.take(self.active_seat.game)
+            if seat.shared_game_state is not None:
+                seat.shared_game_state.install()
+            self.active_seat = seat
+
+    def release(self, is_game_over: bool = False) -> None:
+        """Release the engine (its state has not to be kept if the game is over)."""
+        if is_game_over:
+            self.active_seat = None
+        self.lock.release()
+
+
+class Seat:
+    """Seat of a connection to the server: the streams of its game and its human player (if any)."""
+    """
+    The text displayed by the game is written to the connection; the answers of the human player are lines read from
+    the connection: the prompt is awaited by the loop of the server, with a timeout, while the game leaves the engine.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                 engine_lock: EngineLock, move_timeout: float):
+        """Initialization of the seat of a connection."""
+        self.loop = loop  # type: asyncio.AbstractEventLoop
+        self.reader = reader  # type: asyncio.StreamReader
+        self.writer = writer  # type: asyncio.StreamWriter
+        self.engine_lock = engine_lock  # type: EngineLock
+        self.move_timeout = move_timeout  # type: float # Seconds.
+        self.game = None  # type: Optional[Game]
+        self.shared_game_state = None  # type: Optional[SharedGameState]
+        self.is_disconnected = False  # type: bool
+        self.n_move_timeouts = 0  # type: int
+
+    def write(self, text: str) -> int:
+        """Write a text to the connection (from the thread of the game)."""
+        if not self.is_disconnected:
+            self.loop.call_soon_threadsafe(self.write_in_loop, text.encode('utf-8'))
+        return len(text)
+
+    def write_in_loop(self, data: bytes) -> None:
+        """Write data to the connection (from the loop of the server) unless it is closed."""
+        if self.writer.is_closing():
+            self.is_disconnected = True
+        else:
+            self.writer.write(data)
+
+    def flush(self) -> None:
+        pass
+
+    def readline(self) -> str:
+        """Read a line (an answer) from the connection (from the thread of the game), leaving the engine meanwhile."""
+        if self.is_disconnected:
+            raise MoveTimeoutError('disconnected')
+        self.engine_lock.release()
+        try:
+            return asyncio.run_coroutine_threadsafe(self.read_answer(), self.loop).result()
+        finally:
+            self.engine_lock.acquire(self)
+
+    async def read_answer(self) -> str:
+        """Await an answer (a line) of the human player for at most the timeout of a move."""
+        try:
+            await self.writer.drain()
+            line = await asyncio.wait_for(self.reader.readline(), self.move_timeout)  # type: bytes
+        except asyncio.TimeoutError:
+            self.n_move_timeouts += 1
+            raise MoveTimeoutError('timeout')
+        except ConnectionError:
+            line = b''
+        if not line:
+            self.is_disconnected = True
+            raise MoveTimeoutError('disconnected')
+        return line.decode('utf-8', 'replace')
+
+    def get_fallback_choose_method_decorator(self):  # -> Callable[[str, Callable], Callable]
+        """Get the decorator of the choose methods of the human player playing a random move if he/she does not answer in time."""
+        def decorator(choose_method_name, choose_method):
+            def fallback_choose_method(*args, **kwargs):
+                try:
+                    return choose_method(*args, **kwargs)
+                except MoveTimeoutError:
+                    print(indent(3) + 'No answer in time: a random move is played.')
+                    return getattr(BasicAIPlayer, choose_method_name)(player, *args, **kwargs)
+            return fallback_choose_method
+        player = [player for player in self.game.players if player.is_human()][0]  # type: HumanPlayer
+        return decorator
+
+
+class GameServer:
+    """Asynchronous server of games: a connection plays a game with a human seat (or watches a game of AIs)."""
+    """
+    The first line sent by a connection gives the players as the command line of main.py (e.g. 'red green=Basic': the
+    color without AI name is the human player) and optionally the seed (e.g. 'seed=42'). Then the text of the game is
+    sent and each answer of the human player is a line. The games are played by the threads of an executor (with their
+    AI players) and only one of them goes on at a time: a game waiting for a human costs a blocked thread. Beyond the
+    maximum number of games open, a connection is refused with an error line.
+    Limitation: the loop of a game is not resumable, so each game open holds a thread blocked on the answers of its human
+    player, the games take turns on the engine (whose state is swapped by the engine lock since it is kept by the shared
+    elements of the game) and the standard streams of the process are redirected to the seats while the server serves.
+    """
+
+    def __init__(self, xml_file_path: str, version_name: str, move_timeout: float = 60.0, max_n_games: int = 256):
+        """Initialization of the server with the elements of the game loaded once."""
+        with no_display():
+            self.game_element = GameElement(['server', xml_file_path, version_name,
+                                             'red=Basic', 'green=Basic'])  # type: GameElement
+        self.version = [version for version in self.game_element.versions
+                        if version.name == version_name][0]  # type: Version
+        self.move_timeout = move_timeout  # type: float # Seconds.
+        self.max_n_games = max_n_games  # type: int # Maximum number of games open at once (a thread for each).
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_n_games)  # type: concurrent.futures.ThreadPoolExecutor
+        self.engine_lock = EngineLock()  # type: EngineLock
+        self.n_open_games = 0  # type: int
+        self.n_games_played = 0  # type: int
+        self.n_connections_refused = 0  # type: int
+        self.thread_local = threading.local()  # type: threading.local
+        self.stdout, self.stdin = None, None  # type: Optional[TextIO], Optional[TextIO] # Streams redirected if any.
+
+    def close(self) -> None:
+        """Close the server: the standard streams are restored once the games are over."""
+        self.executor.shutdown()
+        if self.stdout is not None:
+            sys.stdout, sys.stdin = self.stdout, self.stdin
+            self.stdout, self.stdin = None, None
+
+    def redirect_standard_streams(self) -> None:
+        """Redirect the standard streams to the seats of the threads of the games (once for all the starts)."""
+        if self.stdout is None:
+            self.stdout, self.stdin = sys.stdout, sys.stdin
+            sys.stdout = ThreadLocalStream(self.stdout, self.thread_local, 'stdout')
+            sys.stdin = ThreadLocalStream(self.stdin, self.thread_local, 'stdin')
+
+    async def start_tcp(self, host: str = '127.0.0.1', port: int = 0):  # -> asyncio.AbstractServer
+        """Start serving over TCP (a free port for 0)."""
+        self.redirect_standard_streams()
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+    async def start_unix(self, socket_file_path: str):  # -> asyncio.AbstractServer
+        """Start serving over a Unix socket."""
+        self.redirect_standard_streams()
+        return await asyncio.start_unix_server(self.handle_connection, socket_file_path)
+
+    def create_game(self, args):  # -> Game
+        """Create a game from the arguments (e.g. ['red', 'green=Basic'])."""
+        color_players = {color_player.name: color_player
+                         for color_player in self.game_element.color_players}  # type: Dict[str, ColorPlayer]
+        players = list()  # type: List[Player]
+        for arg in args:
+            color_player_name, _separator, ai_name = arg.partition('=')
+            players.append(GameElement.create_player(color_players[color_player_name], ai_name))
+        if not self.game_element.n_min_players <= len(players) <= self.game_element.n_max_players \
+                or sum(player.is_human() for player in players) > 1:
+            raise ValueError('From ' + str(self.game_element.n_min_players) + ' to ' +
+                             str(self.game_element.n_max_players) + ' players with at most one human are expected.')
+        return Game(self.game_element, self.version, players)
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Play the game asked by a connection (refused if the server is full)."""
+        seat = Seat(asyncio.get_running_loop(), reader, writer, self.engine_lock, self.move_timeout)  # type: Seat
+        self.n_open_games += 1
+        try:
+            args = (await reader.readline()).decode('utf-8', 'replace').split()  # type: List[str]
+            if self.n_open_games > self.max_n_games:
+                # Otherwise the game would wait silently for a thread of the executor.
+                self.n_connections_refused += 1
+                writer.write(('Error: the server is full (' + str(self.max_n_games) + ' games open).\n').encode('utf-8'))
+                return
+            seeds = [int(arg[len('seed='):]) for arg in args if arg.startswith('seed=')]  # type: List[int]
+            try:
+                seat.game = self.create_game([arg for arg in args if not arg.startswith('seed=')])
+            except (KeyError, ValueError) as error:
+                writer.write(('Error: ' + str(error) + '\n').encode('utf-8'))
+                return
+            await asyncio.get_running_loop().run_in_executor(self.executor, self.play_game, seat,
+                                                             seeds[0] if seeds else None)
+            self.n_games_played += 1
+        finally:
+            self.n_open_games -= 1
+            if not writer.is_closing():
+                try:
+                    await writer.drain()
+                except ConnectionError:
+                    pass
+                writer.close()
+
+    def play_game(self, seat: Seat, seed: int) -> None:
+        """Play the game of a seat (in a thread of the executor) with a seed (None for a random one)."""
+        self.thread_local.stdout = seat
+        self.thread_local.stdin = seat
+        self.engine_lock.acquire(seat)
+        try:
+            if any(player.is_human() for player in seat.game.players):
+                [player for player in seat.game.players
+                 if player.is_human()][0].decorate_choose_methods(seat.get_fallback_choose_method_decorator())
+            seat.game.setup(seed)
+            try:
+                seat.game.play()
+            except MoveTimeoutError:
+                pass  # No answer for the replay once the game is over.
+        finally:
+            self.engine_lock.release(True)
+            self.thread_local.stdout = None
+            self.thread_local.stdin = None
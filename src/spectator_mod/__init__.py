@@ -0,0 +1,4 @@
+from spectator_mod.bus import DeltaBus
+from spectator_mod.bus import Subscription
+from spectator_mod.deltas import StateDeltaPublisher
+from spectator_mod.deltas import get_state_view
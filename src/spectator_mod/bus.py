@@ -0,0 +1,126 @@
+#!/usr/bin/python
+import threading
+
+
+class Subscription:
+    """Subscription to a bus of deltas: its queue is the window of the deltas of the bus not yet got by the subscriber."""
+    """
+    The deltas are pairs (key, value): the value of the key of the state has changed (e.g. (('slot', 12), 'red')).
+    The queue is bounded by a maximum number of deltas: beyond (a slow subscriber), the coalesce policy keeps only the
+    last value of each key (the oldest deltas are dropped if there are still too many) and the drop policy drops the
+    oldest deltas. The number of deltas dropped tells the subscriber that it missed some changes.
+    """
+
+    COALESCE = 'coalesce'  # type: str
+    DROP = 'drop'  # type: str
+
+    def __init__(self, bus, max_n_deltas: int, policy: str):
+        """Initialization of a subscription to a bus: it first gets the current state of the bus."""
+        if policy not in (Subscription.COALESCE, Subscription.DROP):
+            raise ValueError('Policy ' + policy + ' unknown.')
+        self.bus = bus  # type: DeltaBus
+        self.max_n_deltas = max_n_deltas  # type: int
+        self.policy = policy  # type: str
+        self.i_next_delta = bus.n_deltas_published  # type: int # Number (in the bus) of the next delta to get.
+        self.state_deltas = list(bus.state.items())  # type: List[Tuple[Tuple, Any]] # State when subscribed, to get first.
+        self.n_coalesced = 0  # type: int # Deltas replaced by a later value of their keys.
+        self.n_dropped = 0  # type: int # Deltas lost.
+        self.i_end_delta = None  # type: Optional[int] # Number of the first delta published once closed (None if not closed).
+
+    def get_i_end_delta(self) -> int:
+        """Get the number (in the bus) of the first delta not to get: the next one to publish unless it is closed."""
+        return self.bus.n_deltas_published if self.i_end_delta is None else self.i_end_delta
+
+    def has_deltas(self) -> bool:
+        """Indicates whether there are deltas not yet got (the lock of the bus is held)."""
+        return bool(self.state_deltas) or self.i_next_delta < self.get_i_end_delta()
+
+    def get(self, timeout: float = None):  # -> List[Tuple[Tuple, Any]]
+        """Get all the deltas not yet got, waiting for some (at most the timeout in seconds) if there is none."""
+        bus = self.bus  # type: DeltaBus
+        with bus.condition:
+            if not self.has_deltas() and self.i_end_delta is None and timeout != 0:
+                bus.n_waiting_subscriptions += 1
+                bus.condition.wait(timeout)
+                bus.n_waiting_subscriptions -= 1
+            deltas, self.state_deltas = self.state_deltas, list()  # type: List[Tuple[Tuple, Any]]
+            if self.i_next_delta < bus.i_first_delta and self.policy == Subscription.COALESCE:
+                # The last value of each key of the state coalesces all the deltas (even those no more in the bus).
+                self.n_coalesced += max(0, bus.n_deltas_published - self.i_next_delta - len(bus.state))
+                deltas = list(bus.state.items())
+            else:
+                if self.i_next_delta < bus.i_first_delta:
+                    self.n_dropped += bus.i_first_delta - self.i_next_delta
+                    self.i_next_delta = bus.i_first_delta
+                deltas.extend(bus.deltas[self.i_next_delta - bus.i_first_delta:
+                                         self.get_i_end_delta() - bus.i_first_delta])
+            self.i_next_delta = max(self.i_next_delta, self.get_i_end_delta())
+        if len(deltas) > self.max_n_deltas and self.policy == Subscription.COALESCE:
+            last_deltas = dict()  # type: Dict[Tuple, Any] # Ordered by the last changes.
+            for key, value in deltas:
+                last_deltas.pop(key, None)
+                last_deltas[key] = value
+            self.n_coalesced += len(deltas) - len(last_deltas)
+            deltas = list(last_deltas.items())
+        if len(deltas) > self.max_n_deltas:
+            self.n_dropped += len(deltas) - self.max_n_deltas
+            deltas = deltas[len(deltas) - self.max_n_deltas:]
+        return deltas
+
+    def poll(self):  # -> List[Tuple[Tuple, Any]]
+        """Get all the deltas not yet got without waiting."""
+        return self.get(0)
+
+    def is_closed(self) -> bool:
+        """Indicates whether the subscription is closed and all its deltas are got."""
+        with self.bus.condition:
+            return self.i_end_delta is not None and not self.has_deltas()
+
+    def close(self) -> None:
+        """Unsubscribe: only the deltas already published are still to get (a subscriber waiting for deltas is woken up)."""
+        with self.bus.condition:
+            if self.i_end_delta is None:
+                self.i_end_delta = self.bus.n_deltas_published
+                self.bus.n_open_subscriptions -= 1
+            self.bus.condition.notify_all()
+
+
+class DeltaBus:
+    """Bus publishing the deltas of a state to its subscribers (e.g. the spectators of a game)."""
+    """
+    The deltas published are appended once to the bus, whatever the number of subscribers: each subscription reads
+    them from where it stopped, so publishing never waits for (nor copies to) a subscriber. The bus keeps the last
+    deltas (at least its capacity) and the current state: a new subscriber first gets the whole state. A publisher may
+    skip publishing while no subscription is open, so the state got by a new subscriber may lag until the next deltas.
+    """
+
+    def __init__(self, capacity: int = 1 << 16):
+        """Initialization of a bus without delta."""
+        self.capacity = capacity  # type: int
+        self.condition = threading.Condition()  # type: threading.Condition
+        self.state = dict()  # type: Dict[Tuple, Any]
+        self.deltas = list()  # type: List[Tuple[Tuple, Any]] # Last deltas published.
+        self.i_first_delta = 0  # type: int # Number of the first delta kept.
+        self.n_deltas_published = 0  # type: int
+        self.n_waiting_subscriptions = 0  # type: int
+        self.n_open_subscriptions = 0  # type: int # Subscriptions not closed.
+
+    def subscribe(self, max_n_deltas: int = 1024, policy: str = Subscription.COALESCE) -> Subscription:
+        """Subscribe to the deltas (the current state first) with a bounded queue and a policy for a slow subscriber."""
+        with self.condition:
+            subscription = Subscription(self, max_n_deltas, policy)  # type: Subscription
+            self.n_open_subscriptions += 1
+            return subscription
+
+    def publish(self, deltas) -> None:
+        """Publish deltas to all the subscribers."""
+        # :param deltas: # type: List[Tuple[Tuple, Any]]
+        with self.condition:
+            self.state.update(deltas)
+            self.deltas.extend(deltas)
+            self.n_deltas_published += len(deltas)
+            if len(self.deltas) > 2 * self.capacity:
+                del self.deltas[:len(self.deltas) - self.capacity]
+                self.i_first_delta = self.n_deltas_published - self.capacity
+            if self.n_waiting_subscriptions:
+                self.condition.notify_all()
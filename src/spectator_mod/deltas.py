@@ -0,0 +1,170 @@
+#!/usr/bin/python
+from game_mod import *
+from buildings_mod import *
+
+from spectator_mod.bus import DeltaBus
+
+
+TURN = 'turn'  # type: str # (TURN,): number of the turn.
+PHASE = 'phase'  # type: str # (PHASE,): numero of the phase.
+PROVOST = 'provost'  # type: str # (PROVOST,): index of the slot of the road of the Provost.
+SLOT = 'slot'  # type: str # (SLOT, i_road): color of the worker on the slot (None if free).
+BUILDING = 'building'  # type: str # (BUILDING, i_road): name of the building of the slot (e.g. built by a player).
+OWNER = 'owner'  # type: str # (OWNER, i_road): color of the owner of the building of the slot (None if neutral).
+CASTLE_TOKENS = 'castle_tokens'  # type: str # (CASTLE_TOKENS, part): tokens left of the part of the castle.
+PRESTIGE = 'prestige'  # type: str # (PRESTIGE, building): color of the owner of the prestige building.
+PLAYER = 'player'  # type: str # (PLAYER, color, attribute): money, resources, prestige points or workers of a player.
+CARD = 'card'  # type: str # (CARD, color, building): location of a player building (e.g. 'road' once built).
+LOCATION_NAMES = {location: location.name.lower() for location in Location}  # type: Dict[Location, str]
+
+
+def get_road_view(game):  # -> Dict[Tuple, Any]
+    """Get the slots of the road seen by the spectators: workers, buildings and owners."""
+    road = game.road  # type: Road
+    worker_names = [player.color_player.name for player in road.players] + [None]  # type: List[Optional[str]] # Indexed by the workers (Road.NONE = -1 is the last).
+    owner_names = [color_player.name for color_player in game.game_element.color_players] + [None]  # type: List[Optional[str]]
+    road_view = dict()  # type: Dict[Tuple, Any]
+    for i_road, (i_building, i_worker, i_owner) in enumerate(zip(road.i_buildings, road.i_workers, road.i_owners)):
+        road_view[(SLOT, i_road)] = worker_names[i_worker]
+        road_view[(BUILDING, i_road)] = road.all_buildings[i_building].name
+        road_view[(OWNER, i_road)] = owner_names[i_owner]
+    return road_view
+
+
+def get_castle_view(game):  # -> Dict[Tuple, Any]
+    """Get the tokens left of the parts of the castle seen by the spectators."""
+    return {(CASTLE_TOKENS, castle_part.name): castle_part.current_n_castle_tokens
+            for castle_part in game.game_element.castle}
+
+
+def get_prestige_view(prestige_buildings):  # -> Dict[Tuple, Any]
+    """Get the owners of the prestige buildings seen by the spectators."""
+    # :param prestige_buildings: # type: List[PrestigeBuilding]
+    return {(PRESTIGE, building.name): None if building.color_player is None else building.color_player.name
+            for building in prestige_buildings}
+
+
+def get_player_view(player):  # -> Dict[Tuple, Any]
+    """Get the money, resources, prestige points and workers of a player seen by the spectators."""
+    color_player_name = player.color_player.name  # type: str
+    player_view = {(PLAYER, color_player_name, money_resource.name): qty
+                   for money_resource, qty in player.current_money_resources.items()}  # type: Dict[Tuple, Any]
+    player_view[(PLAYER, color_player_name, 'prestige_pts')] = player.current_n_prestige_pts
+    player_view[(PLAYER, color_player_name, 'workers')] = player.current_n_workers
+    return player_view
+
+
+def get_cards_view(player):  # -> Dict[Tuple, Any]
+    """Get the locations of the player buildings of a player seen by the spectators."""
+    color_player_name = player.color_player.name  # type: str
+    return {(CARD, color_player_name, player_building.name): LOCATION_NAMES[location]
+            for player_building, location in player.deck.items()}
+
+
+def get_prestige_buildings(game):  # -> List[PrestigeBuilding]
+    """Get the prestige buildings of a game."""
+    return [building for building in game.current_buildings if building.get_building_type() == BuildingType.PRESTIGE]
+
+
+def get_state_view(game):  # -> Dict[Tuple, Any]
+    """Get the state of a game seen by its spectators: the value of each key (e.g. (SLOT, 12) for a worker)."""
+    state_view = {(TURN,): game.n_turns, (PROVOST,): game.i_provost}  # type: Dict[Tuple, Any]
+    state_view.update(get_road_view(game))
+    state_view.update(get_castle_view(game))
+    state_view.update(get_prestige_view(get_prestige_buildings(game)))
+    for player in game.players:
+        state_view.update(get_player_view(player))
+        state_view.update(get_cards_view(player))
+    return state_view
+
+
+class StateDeltaPublisher(GameListener):
+    """Publisher of the deltas of the state of a game to a bus, e.g. for its spectators."""
+    """
+    Rather than the text of the players and of the road displayed after each action, the spectators get what changed:
+    the state seen by the spectators is compared with the previous one before each decision of a player, after each
+    effect of a building and at the beginning of each phase, and the changed keys are published.
+    The state is split into sections (e.g. the road, the castle or the cards of a player) with a raw value cheap to take
+    and compare (e.g. the bytes of the arrays of the road): only the view of a section whose raw value changed is built
+    and compared. Nothing is published while the bus has no open subscription.
+    """
+
+    def __init__(self, bus: DeltaBus = None):
+        """Initialization of the publisher to a bus (a new one by default)."""
+        self.bus = DeltaBus() if bus is None else bus  # type: DeltaBus
+        self.state_view = dict()  # type: Dict[Tuple, Any] # Last state published.
+        self.section_raws = dict()  # type: Dict[str, Any] # Raw values of the sections last published.
+        self.phase_numero = None  # type: Optional[int]
+        self.prestige_buildings = list()  # type: List[PrestigeBuilding]
+        self.observed_players = set()  # type: Set[Player] # Players whose choose methods are already decorated.
+
+    def get_sections(self, game):  # -> List[Tuple[str, Any, Callable[[], Dict[Tuple, Any]]]]
+        """Get the sections of the state seen by the spectators: name, raw value and function getting its view."""
+        road = game.road  # type: Road
+        sections = [('phase', self.phase_numero, lambda: {(PHASE,): self.phase_numero}),
+                    ('turn', (game.n_turns, game.i_provost),
+                     lambda: {(TURN,): game.n_turns, (PROVOST,): game.i_provost}),
+                    ('road', (road.i_buildings.tobytes(), road.i_workers.tobytes(), road.i_owners.tobytes()),
+                     lambda: get_road_view(game)),
+                    ('castle', tuple(castle_part.current_n_castle_tokens for castle_part in game.game_element.castle),
+                     lambda: get_castle_view(game)),
+                    ('prestige', tuple(building.color_player for building in self.prestige_buildings),
+                     lambda: get_prestige_view(self.prestige_buildings))
+                    ]  # type: List[Tuple[str, Any, Callable[[], Dict[Tuple, Any]]]]
+        for player in game.players:
+            sections.append(('player ' + player.color_player.name,
+                             (tuple(player.current_money_resources.values()), player.current_n_prestige_pts,
+                              player.current_n_workers), lambda player=player: get_player_view(player)))
+            sections.append(('cards ' + player.color_player.name, tuple(player.deck.values()),
+                             lambda player=player: get_cards_view(player)))
+        return sections
+
+    def publish(self, game, phase_numero: int = None) -> None:
+        """Publish the deltas of the state of the game since the last publication (if any subscription is open)."""
+        if phase_numero is not None:
+            self.phase_numero = phase_numero
+        if not self.bus.n_open_subscriptions:
+            # The next publication compares all the sections with the state last published.
+            self.section_raws = dict()
+            return
+        deltas = list()  # type: List[Tuple[Tuple, Any]]
+        for section_name, section_raw, get_section_view in self.get_sections(game):
+            if section_name not in self.section_raws or self.section_raws[section_name] != section_raw:
+                self.section_raws[section_name] = section_raw
+                for key, value in get_section_view().items():
+                    if key not in self.state_view or self.state_view[key] != value:
+                        deltas.append((key, value))
+                        self.state_view[key] = value
+        if deltas:
+            self.bus.publish(deltas)
+
+    def game_begin(self, game) -> None:
+        self.state_view = dict()
+        self.section_raws = dict()
+        self.prestige_buildings = get_prestige_buildings(game)
+        for player in game.players:
+            if player not in self.observed_players:
+                self.observed_players.add(player)
+                player.decorate_choose_methods(self.get_publishing_decorator(game))
+        self.publish(game, 0)
+
+    def turn_begin(self, game) -> None:
+        self.publish(game)
+
+    def phase_begin(self, game, phase_numero: int) -> None:
+        self.publish(game, phase_numero)
+
+    def effect_end(self, game, building, effect_method_name: str) -> None:
+        self.publish(game)
+
+    def game_end(self, game) -> None:
+        self.publish(game)
+
+    def get_publishing_decorator(self, game):  # -> Callable[[str, Callable], Callable]
+        """Get the decorator of the choose methods of a player publishing the deltas before each decision."""
+        def decorator(choose_method_name, choose_method):
+            def publishing_choose_method(*args, **kwargs):
+                self.publish(game)
+                return choose_method(*args, **kwargs)
+            return publishing_choose_method
+        return decorator
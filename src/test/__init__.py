@@ -2,4 +2,26 @@ from test.Ordinal_number_test import TestOrdinal_number
 from test.Money_singleton_test import TestMoney_singleton
 from test.resource_all_payments_test import TestResource_all_payments
 from test.remove_token_test import TestRemove_token
-from test.provost_movement_test import TestProvost_movement
\ No newline at end of file
+from test.provost_movement_test import TestProvost_movement
+from test.road_index_test import TestRoad_index
+from test.random_seed_test import TestRandom_seed
+from test.game_record_test import TestGame_record
+from test.checkpoint_test import TestCheckpoint
+from test.batch_test import TestBatch
+from test.sqlite_export_test import TestSqlite_export
+from test.building_win_test import TestBuilding_win
+from test.sweep_test import TestSweep
+from test.sprt_test import TestSprt
+from test.paired_games_test import TestPaired_games
+from test.rating_test import TestRating
+from test.benchmark_test import TestBenchmark
+from test.timing_test import TestTiming
+from test.trace_test import TestTrace
+from test.sampling_test import TestSampling
+from test.metrics_test import TestMetrics
+from test.watchdog_test import TestWatchdog
+from test.metrics_server_test import TestMetrics_server
+from test.server_test import TestServer
+from test.lockstep_test import TestLockstep
+from test.spectator_test import TestSpectator
+from test.daemon_test import TestDaemon
@@ -0,0 +1,54 @@
+import os
+import tempfile
+import unittest
+
+from batch_mod.batch import run_batch
+from batch_mod.journal import ResultsJournal
+from test.game_utils import XML_FILE
+
+
+
+class TestBatch(unittest.TestCase):
+    SEATS = [('red', 'Basic'), ('green', 'Advanced')]
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.journal_file_path = os.path.join(self.tmp_dir.name, 'journal.jsonl')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_journal_repair(self):
+        with ResultsJournal(self.journal_file_path) as journal:
+            journal.write({'seed': 1})
+            journal.write({'seed': 2})
+        with open(self.journal_file_path, 'a') as journal_file:
+            journal_file.write('{"seed":')  # Truncated by a crash.
+        self.assertEqual([{'seed': 1}, {'seed': 2}], list(ResultsJournal.read(self.journal_file_path)))
+        with ResultsJournal(self.journal_file_path) as journal:
+            journal.write({'seed': 3})
+        self.assertEqual([{'seed': 1}, {'seed': 2}, {'seed': 3}], list(ResultsJournal.read(self.journal_file_path)))
+
+    def test_run_batch_resume(self):
+        self.assertEqual(5, run_batch(self.journal_file_path, XML_FILE, 'Standard', TestBatch.SEATS, 10, 5, 0))
+        self.assertEqual(3, run_batch(self.journal_file_path, XML_FILE, 'Standard', TestBatch.SEATS, 10, 8, 0))
+        game_summaries = list(ResultsJournal.read(self.journal_file_path))
+        self.assertEqual(list(range(10, 18)), [game_summary['seed'] for game_summary in game_summaries])
+        for game_summary in game_summaries:
+            self.assertEqual([['red', 'Basic'], ['green', 'Advanced']], game_summary['seats'])
+            max_tot_n_prestige_pts = max(game_summary['tot_n_prestige_pts'])
+            self.assertEqual([color_player_name for (color_player_name, ai_name), tot_n_prestige_pts
+                              in zip(game_summary['seats'], game_summary['tot_n_prestige_pts'])
+                              if tot_n_prestige_pts == max_tot_n_prestige_pts], game_summary['winners'])
+            self.assertGreater(game_summary['n_turns'], 0)
+
+    def test_run_batch_processes(self):
+        self.assertEqual(4, run_batch(self.journal_file_path, XML_FILE, 'Beginner', TestBatch.SEATS, 0, 4, 2))
+        journal_file_path = os.path.join(self.tmp_dir.name, 'journal_0.jsonl')
+        run_batch(journal_file_path, XML_FILE, 'Beginner', TestBatch.SEATS, 0, 4, 0)
+        self.assertEqual(sorted(map(str, ResultsJournal.read(journal_file_path))),
+                         sorted(map(str, ResultsJournal.read(self.journal_file_path))))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import json
+import statistics
+import unittest
+
+from benchmark_mod.benchmark import get_mid_game
+from benchmark_mod.benchmark import run_benchmarks
+from benchmark_mod.benchmark import time_function
+from benchmark_mod.regression import compare_benchmarks
+from benchmark_mod.regression import get_n_u_statistics
+from benchmark_mod.regression import mann_whitney_p_value
+from benchmark_mod.regression import txt_comparison
+from game_mod.snapshot import GameSnapshot
+
+
+class TestBenchmark(unittest.TestCase):
+    def test_time_function(self):
+        calls = list()
+        times = time_function(lambda: calls.append('call'), 3, 2, lambda: calls.append('setup'))
+        self.assertEqual(2, len(times))
+        self.assertEqual(['setup', 'call'] * 6, calls)
+
+    def test_mid_game_is_reproducible(self):
+        ns = GameSnapshot.take(get_mid_game('Standard', 4)).ns
+        self.assertEqual(ns, GameSnapshot.take(get_mid_game('Standard', 4)).ns)
+
+    def test_run_benchmarks(self):
+        results = run_benchmarks('Standard', 1, 0.01)
+        self.assertEqual({'Game.possible_actions', 'Player.resource_all_payments', 'Player.n_max_batches_to_castle',
+                          'Game.txt_road', 'Game.play_phase_building_effects', 'GameElement', 'full_game', 'calibration'},
+                         set(results['benchmarks']))
+        for benchmark in results['benchmarks'].values():
+            self.assertGreater(benchmark['min'], 0)
+        json.dumps(results)
+
+    def test_mann_whitney_p_value(self):
+        self.assertAlmostEqual(1 / 252, mann_whitney_p_value([6, 7, 8, 9, 10], [1, 2, 3, 4, 5]))
+        self.assertAlmostEqual(1.0, mann_whitney_p_value([1, 2, 3, 4, 5], [6, 7, 8, 9, 10]))
+        self.assertAlmostEqual(4 / 6, mann_whitney_p_value([1, 4], [2, 3]))
+        self.assertEqual(252, sum(get_n_u_statistics(5, 5)))
+
+    def test_compare_benchmarks(self):
+        def get_results(calibration_times, txt_road_times):
+            return {'benchmarks': {name: {'times': times, 'median': statistics.median(times)} for name, times
+                                   in [('calibration', calibration_times), ('Game.txt_road', txt_road_times)]}}
+        baseline_results = get_results([1.0] * 5, [1.0, 1.1, 0.9, 1.0, 1.05])
+        rows = compare_benchmarks(baseline_results, get_results([1.0] * 5, [2.0, 2.1, 1.9, 2.0, 2.2]), 0.5)
+        self.assertEqual(1, len(rows))
+        self.assertTrue(rows[0][5])
+        self.assertIn('REGRESSION', txt_comparison(rows))
+        # Twice as slow on a machine twice as slow: no regression.
+        rows = compare_benchmarks(baseline_results, get_results([2.0] * 5, [2.0, 2.1, 1.9, 2.0, 2.2]), 0.5)
+        self.assertAlmostEqual(1.0, rows[0][3])
+        self.assertFalse(rows[0][5])
+        self.assertIn('No regression.', txt_comparison(rows))
+
+    def test_compare_fresh_baseline(self):
+        baseline_results = run_benchmarks('Standard', 5, 0.01)
+        rows = compare_benchmarks(json.loads(json.dumps(baseline_results)), baseline_results)
+        self.assertEqual(len(baseline_results['benchmarks']) - 1, len(rows))
+        for row in rows:
+            self.assertAlmostEqual(1.0, row[3])
+            self.assertFalse(row[5])
+        self.assertIn('No regression.', txt_comparison(rows))
+
+
+if __name__ == '__main__':
+    unittest.main()
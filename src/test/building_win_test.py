@@ -0,0 +1,48 @@
+import unittest
+
+from batch_mod.analytics import wilson_interval
+from batch_mod.analytics import BuildingWinAggregator
+
+
+
+class TestBuilding_win(unittest.TestCase):
+    GAME_SUMMARIES = [
+        {'version': 'Standard', 'seats': [['red', 'Basic'], ['green', 'Advanced']], 'winners': ['red'],
+         'buildings': [['red', 'Bank'], ['red', 'Résidence'], ['red', 'Résidence'], ['green', 'Lawyer']]},
+        {'version': 'Standard', 'seats': [['red', 'Basic'], ['green', 'Advanced']], 'winners': ['red', 'green'],
+         'buildings': [['green', 'Bank']]},
+        {'version': 'Beginner', 'seats': [['red', 'Basic'], ['green', 'Advanced'], ['blue', 'Basic']],
+         'winners': ['blue'], 'buildings': [['red', 'Bank']]}]
+
+    def test_wilson_interval(self):
+        ci_low, ci_high = wilson_interval(50, 100)
+        self.assertAlmostEqual(0.5, (ci_low + ci_high) / 2)
+        self.assertAlmostEqual(0.404, ci_low, 3)
+        self.assertEqual((0.0, 1.0), wilson_interval(0, 0))
+
+    def test_add(self):
+        aggregator = BuildingWinAggregator()
+        for game_summary in TestBuilding_win.GAME_SUMMARIES:
+            aggregator.add(game_summary)
+        self.assertEqual({('Standard', 2, ''): [4, 3], ('Standard', 2, 'Bank'): [2, 2],
+                          ('Standard', 2, 'Résidence'): [1, 1], ('Standard', 2, 'Lawyer'): [1, 0],
+                          ('Beginner', 3, ''): [3, 1], ('Beginner', 3, 'Bank'): [1, 0]}, aggregator.counts)
+        win_rates = {(version_name, n_players, building_name): (n_players_owning, win_rate, win_rate_diff)
+                     for version_name, n_players, building_name, n_players_owning, win_rate, ci_low, ci_high,
+                         win_rate_diff in aggregator.get_win_rates()}
+        self.assertEqual((2, 1.0, 0.25), win_rates[('Standard', 2, 'Bank')])
+
+    def test_merge(self):
+        aggregator = BuildingWinAggregator()
+        for game_summary in TestBuilding_win.GAME_SUMMARIES:
+            aggregator.add(game_summary)
+        aggregator_merged = BuildingWinAggregator()
+        for game_summary in TestBuilding_win.GAME_SUMMARIES:
+            aggregator_game = BuildingWinAggregator()
+            aggregator_game.add(game_summary)
+            aggregator_merged.merge(BuildingWinAggregator.from_dict(aggregator_game.to_dict()))
+        self.assertEqual(aggregator.counts, aggregator_merged.counts)
+
+
+if __name__ == '__main__':
+    unittest.main()
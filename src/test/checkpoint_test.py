@@ -0,0 +1,82 @@
+import os
+import tempfile
+import unittest
+
+from game_mod.checkpoint import Checkpoint
+from game_mod.checkpoint import Checkpointer
+from game_mod.checkpoint import resume_game
+from game_mod.listener import GameListener
+from game_mod.snapshot import GameSnapshot
+from game_mod.utils import no_display
+from test.game_utils import load_game_element
+
+
+
+class TurnCheckpointListener(GameListener):
+    def __init__(self):
+        self.checkpoints_bytes = list()
+
+    def phase_end(self, game, phase_numero):
+        if phase_numero == 6:
+            self.checkpoints_bytes.append(Checkpoint.take(game).to_bytes())
+
+
+class CheckpointFileListener(GameListener):
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.checkpoints_bytes = list()
+
+    def phase_end(self, game, phase_numero):
+        if phase_numero == 6:
+            with open(self.file_path, 'rb') as checkpoint_file:
+                self.checkpoints_bytes.append(checkpoint_file.read())
+
+
+class TestCheckpoint(unittest.TestCase):
+    PLAYER_ARGS = ['red=Basic', 'green=Advanced', 'blue=Advanced', 'orange=Basic']
+
+    def play_game(self, version_name, seed):
+        game_element = load_game_element(version_name, TestCheckpoint.PLAYER_ARGS)
+        game = game_element.game
+        listener = TurnCheckpointListener()
+        game.listeners.append(listener)
+        with no_display():
+            game.setup(seed)
+            game.play()
+        return game, listener.checkpoints_bytes
+
+    def test_resume_game(self):
+        for version_name in ['Standard', 'Beginner']:
+            game, checkpoints_bytes = self.play_game(version_name, 3)
+            for i_checkpoints in [0, len(checkpoints_bytes) // 2]:
+                game_element = load_game_element(version_name, TestCheckpoint.PLAYER_ARGS)
+                with no_display():
+                    game_resumed = resume_game(game_element, Checkpoint.from_bytes(checkpoints_bytes[i_checkpoints]))
+                    self.assertEqual(i_checkpoints + 1, game_resumed.n_turns)
+                    game_resumed.play()
+                self.assertEqual(GameSnapshot.take(game).ns, GameSnapshot.take(game_resumed).ns)
+
+    def test_checkpointer(self):
+        game_element = load_game_element('Standard', TestCheckpoint.PLAYER_ARGS)
+        game = game_element.game
+        with tempfile.TemporaryDirectory() as dir_path:
+            file_path = os.path.join(dir_path, 'game.checkpoint')
+            game.listeners.append(Checkpointer(file_path))
+            file_listener = CheckpointFileListener(file_path)
+            turn_listener = TurnCheckpointListener()
+            game.listeners.extend([file_listener, turn_listener])
+            with no_display():
+                game.setup(8)
+                game.play()
+            # The checkpoint of the finished game is deleted so that it is not resumed.
+            self.assertEqual([], os.listdir(dir_path))
+        self.assertEqual(turn_listener.checkpoints_bytes, file_listener.checkpoints_bytes)
+        checkpoint = Checkpoint.from_bytes(file_listener.checkpoints_bytes[-1])
+        self.assertEqual(('Standard', 8, [('red', 'Basic'), ('green', 'Advanced'), ('blue', 'Advanced'),
+                                          ('orange', 'Basic')]),
+                         (checkpoint.version_name, checkpoint.seed, checkpoint.seats))
+        self.assertEqual(GameSnapshot.take(game).ns, checkpoint.snapshot.ns)
+
+
+if __name__ == '__main__':
+    unittest.main()
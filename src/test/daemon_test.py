@@ -0,0 +1,51 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+from batch_mod.batch import play_game
+from server_mod.daemon import DaemonClient
+from server_mod.daemon import DaemonError
+from server_mod.daemon import GameDaemon
+from test.game_utils import XML_FILE
+
+
+SEATS = [['red', 'Basic'], ['green', 'Advanced']]
+
+
+class TestDaemon(unittest.TestCase):
+    def test_requests(self):
+        with tempfile.TemporaryDirectory() as directory_path:
+            socket_file_path = os.path.join(directory_path, 'daemon.sock')
+            game_daemon = GameDaemon(XML_FILE)
+            daemon_thread = threading.Thread(target=game_daemon.serve, args=(socket_file_path,))
+            daemon_thread.start()
+            try:
+                while not os.path.exists(socket_file_path):
+                    daemon_thread.join(0.001)
+                with DaemonClient(socket_file_path) as daemon_client:
+                    game_summary = daemon_client.request({'command': 'play', 'version': 'Standard', 'seats': SEATS,
+                                                          'seed': 4})['summary']
+                    self.assertEqual(play_game((XML_FILE, 'Standard', SEATS, 4, False)), game_summary)
+                    game_summaries = daemon_client.request({'command': 'batch', 'version': 'Beginner', 'seats': SEATS,
+                                                            'first_seed': 4, 'n_games': 3})['summaries']
+                    self.assertEqual([4, 5, 6], [game_summary['seed'] for game_summary in game_summaries])
+                    journal_file_path = os.path.join(directory_path, 'journal.jsonl')
+                    self.assertEqual(2, daemon_client.request({'command': 'batch', 'version': 'Standard',
+                                                               'seats': SEATS, 'first_seed': 4, 'n_games': 2,
+                                                               'journal': journal_file_path})['n_games_played'])
+                    with open(journal_file_path) as journal_file:
+                        self.assertEqual(game_summary, json.loads(journal_file.readline()))
+                    for request in ({'command': 'fly'}, {'command': 'play', 'version': 'Standard', 'seats': [['red', '']]},
+                                    {'command': 'play', 'version': 'Expert', 'seats': SEATS}):
+                        with self.assertRaises(DaemonError):
+                            daemon_client.request(request)
+                    self.assertEqual(6, daemon_client.request({'command': 'status'})['n_games_played'])
+                    daemon_client.request({'command': 'shutdown'})
+            finally:
+                daemon_thread.join()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+
+from game_mod.utils import no_display
+from game_mod.utils import read_varint
+from game_mod.utils import write_varint
+from record_mod.record import GameRecord
+from record_mod.record import GameRecorder
+from record_mod.record import replay_game
+from record_mod.record import seek_game
+from game_mod.listener import GameListener
+from game_mod.snapshot import GameSnapshot
+from test.game_utils import load_game_element
+
+
+class PhaseSnapshotListener(GameListener):
+    def __init__(self, n_turns, phase_numero):
+        self.n_turns = n_turns
+        self.phase_numero = phase_numero
+        self.snapshot = None
+
+    def phase_begin(self, game, phase_numero):
+        if (game.n_turns, phase_numero) == (self.n_turns, self.phase_numero):
+            self.snapshot = GameSnapshot.take(game)
+
+
+class TestGame_record(unittest.TestCase):
+    def play_recorded_game(self, version_name, seed, n_turns_between_keyframes=1, listener=None):
+        game_element = load_game_element(version_name, ['red=Basic', 'green=Advanced', 'blue=Advanced'])
+        game = game_element.game
+        recorder = GameRecorder(game, n_turns_between_keyframes)
+        if listener is not None:
+            game.listeners.append(listener)
+        with no_display():
+            game.setup(seed)
+            game.play()
+        return game_element, game, recorder.get_record()
+
+    def get_end(self, game):
+        return ([building.name for building in game.road.get_buildings()],
+                [(dict((money_resource.name, qty) for money_resource, qty in player.current_money_resources.items()),
+                  player.current_n_prestige_pts) for player in game.players])
+
+    def test_varint(self):
+        buffer = bytearray()
+        for n in [0, 1, 127, 128, 300, 2 ** 64 - 1]:
+            write_varint(buffer, n)
+        i_data = 0
+        for n in [0, 1, 127, 128, 300, 2 ** 64 - 1]:
+            n_read, i_data = read_varint(buffer, i_data)
+            self.assertEqual(n, n_read)
+        self.assertEqual(len(buffer), i_data)
+        self.assertEqual(1 + 1 + 1 + 2 + 2 + 10, len(buffer))
+
+    def test_record_to_bytes(self):
+        record = GameRecord('Standard', 2 ** 63, [('red', 'Basic'), ('green', '')], b'\x00\x81\x01')
+        record_read = GameRecord.from_bytes(record.to_bytes())
+        self.assertEqual(('Standard', 2 ** 63, [('red', 'Basic'), ('green', '')], bytearray(b'\x00\x81\x01')),
+                         (record_read.version_name, record_read.seed, record_read.seats, record_read.decisions))
+        # A record of another format is rejected.
+        data = bytearray(record.to_bytes())
+        data[len(GameRecord.MAGIC)] = GameRecord.FORMAT_VERSION + 1
+        with self.assertRaises(Exception):
+            GameRecord.from_bytes(bytes(data))
+
+    def test_replay_game(self):
+        for version_name in ['Standard', 'Beginner']:
+            game_element, game, record = self.play_recorded_game(version_name, 7)
+            record_read = GameRecord.from_bytes(record.to_bytes())
+            self.assertEqual(self.get_end(game), self.get_end(replay_game(game_element, record_read)))
+
+    def test_seek_game(self):
+        for version_name in ['Standard', 'Beginner']:
+            for n_turns_between_keyframes in [0, 1, 4]:
+                listener = PhaseSnapshotListener(6, 4)
+                game_element, game, record = self.play_recorded_game(version_name, 11, n_turns_between_keyframes,
+                                                                     listener)
+                self.assertEqual(len(record.keyframes), 0 if n_turns_between_keyframes == 0
+                                 else (game.n_turns - 1) // n_turns_between_keyframes + 1)
+                game_seek = seek_game(game_element, GameRecord.from_bytes(record.to_bytes()), 6, 4)
+                self.assertEqual(listener.snapshot.ns, GameSnapshot.take(game_seek).ns)
+
+    def test_snapshot_restore(self):
+        listener = PhaseSnapshotListener(3, 1)
+        game_element, game, record = self.play_recorded_game('Standard', 5, 1, listener)
+        snapshot = GameSnapshot.from_bytes(listener.snapshot.to_bytes())
+        self.assertEqual(listener.snapshot.ns, snapshot.ns)
+        snapshot.restore(game)
+        self.assertEqual(snapshot.ns, GameSnapshot.take(game).ns)
+
+
+if __name__ == '__main__':
+    unittest.main()
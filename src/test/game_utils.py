@@ -0,0 +1,13 @@
+from os import path
+
+from game_mod.game import GameElement
+from game_mod.utils import no_display
+
+
+XML_FILE = path.join(path.dirname(path.abspath(__file__)), '..', '..', 'res', 'game_elements-CaylusMagnaCarta.xml')
+
+
+def load_game_element(version_name: str, player_args):
+    """Load the elements of the game from the XML file (without display) for the version and the players (e.g. 'red=Basic')."""
+    with no_display():
+        return GameElement(['main.py', XML_FILE, version_name] + list(player_args))
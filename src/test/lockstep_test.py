@@ -0,0 +1,72 @@
+import io
+import time
+import unittest
+
+from game_mod import *
+from batch_mod.batch import play_game
+from server_mod.lockstep import DesyncError
+from server_mod.lockstep import play_lockstep_loopback
+from server_mod.lockstep import read_message
+from server_mod.lockstep import write_hello
+from test.game_utils import XML_FILE
+
+
+SEATS = [('red', 'Basic'), ('green', 'Advanced'), ('blue', 'Basic')]
+
+
+class PrestigeTamperer(GameListener):
+    """Listener giving a prestige point to the first player at the beginning of the second turn (a desync)."""
+
+    def turn_begin(self, game):
+        if game.n_turns == 2:
+            game.players[0].current_n_prestige_pts += 1
+
+
+class SlowListener(GameListener):
+    """Listener waiting (e.g. as a human thinking) at the beginning of the second turn."""
+
+    def __init__(self, wait_time):
+        self.wait_time = wait_time
+
+    def turn_begin(self, game):
+        if game.n_turns == 2:
+            time.sleep(self.wait_time)
+
+
+class TestLockstep(unittest.TestCase):
+    def test_messages(self):
+        for data in (bytes([1, 2, 200, 3]), bytes([2, 1, 5]) + bytes(range(8)), bytes([3, 0])):
+            msg_type, message_data, _fields = read_message(io.BytesIO(data))
+            self.assertEqual(msg_type, data[0])
+            self.assertEqual(message_data, data)
+        self.assertEqual(read_message(io.BytesIO(bytes([1, 2, 200, 3])))[2], (2, 456))
+        self.assertLess(len(write_hello(0, 'Standard', 7, SEATS)), 64)
+
+    def test_loopback(self):
+        game_summaries = play_lockstep_loopback(XML_FILE, 'Standard', SEATS, 5)
+        self.assertEqual([game_summary['i_seat'] for game_summary in game_summaries], [0, 1, 2])
+        for game_summary in game_summaries[1:]:
+            self.assertEqual(game_summary['state_hashes'], game_summaries[0]['state_hashes'])
+            self.assertEqual(game_summary['tot_n_prestige_pts'], game_summaries[0]['tot_n_prestige_pts'])
+        # The game is the one of the same seats played locally.
+        game_summary = play_game((XML_FILE, 'Standard', SEATS, 5, False))
+        self.assertEqual(game_summaries[0]['tot_n_prestige_pts'], game_summary['tot_n_prestige_pts'])
+        self.assertEqual(game_summaries[0]['winners'], game_summary['winners'])
+        self.assertEqual(len(game_summaries[0]['state_hashes']), game_summary['n_turns'])
+        # Only the decisions and the hashes are exchanged.
+        self.assertLess(sum(game_summary['n_bytes_sent'] for game_summary in game_summaries),
+                        40 * game_summary['n_turns'] * len(SEATS))
+
+    def test_slow_seat(self):
+        # The other seats wait for the slow one longer than the timeout to connect.
+        game_summaries = play_lockstep_loopback(XML_FILE, 'Standard', SEATS, 5, {1: [SlowListener(0.3)]}, 0.1)
+        for game_summary in game_summaries[1:]:
+            self.assertEqual(game_summary['state_hashes'], game_summaries[0]['state_hashes'])
+
+    def test_desync(self):
+        with self.assertRaises(DesyncError):
+            play_lockstep_loopback(XML_FILE, 'Standard', SEATS, 5, {1: [PrestigeTamperer()]})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import urllib.error
+import urllib.request
+import unittest
+
+from batch_mod.batch import play_games
+from batch_mod.metrics_server import BatchMetrics
+from batch_mod.metrics_server import MetricsServer
+from test.game_utils import XML_FILE
+
+
+class TestMetrics_server(unittest.TestCase):
+    SEATS = [('red', 'Basic'), ('green', 'Advanced')]
+
+    def test_scrape(self):
+        batch_metrics = BatchMetrics()
+        game_tasks = [(XML_FILE, 'Beginner', TestMetrics_server.SEATS, seed, False) for seed in range(3)]
+        batch_metrics.games_queued(len(game_tasks))
+        game_summaries = list()
+        for _game_task, game_summary in play_games(game_tasks, 0, batch_metrics=batch_metrics):
+            game_summaries.append(game_summary)
+            # The games not yet played are pending.
+            self.assertIn('caylus_queue_depth ' + str(3 - len(game_summaries)),
+                          batch_metrics.txt_prometheus().splitlines())
+        with MetricsServer(batch_metrics) as metrics_server:
+            url = 'http://127.0.0.1:' + str(metrics_server.port)
+            with urllib.request.urlopen(url + '/metrics') as response:
+                self.assertTrue(response.headers['Content-Type'].startswith('text/plain; version=0.0.4'))
+                lines = response.read().decode('utf-8').splitlines()
+            with self.assertRaises(urllib.error.HTTPError):
+                urllib.request.urlopen(url + '/other')
+        samples = dict(line.rsplit(' ', 1) for line in lines if not line.startswith('#'))
+        self.assertEqual('3', samples['caylus_games_completed_total'])
+        self.assertEqual('0', samples['caylus_queue_depth'])
+        self.assertEqual('0', samples['caylus_games_in_flight'])
+        self.assertAlmostEqual(sum(game_summary['n_turns'] for game_summary in game_summaries) / 3,
+                               float(samples['caylus_turns_per_game_mean']))
+        self.assertGreater(float(samples['caylus_games_per_second']), 0)
+        self.assertEqual(1, sum(name.startswith('caylus_worker_busy_seconds_total{worker="') for name in samples))
+        self.assertIn('# TYPE caylus_games_completed_total counter', lines)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+
+from batch_mod.batch import play_game
+from game_mod.metrics import MetricsRegistry
+from game_mod.utils import no_display
+from test.game_utils import XML_FILE
+from test.game_utils import load_game_element
+
+
+class TestMetrics(unittest.TestCase):
+    def test_registry(self):
+        metrics_registry = MetricsRegistry()
+        metrics_registry.increment(MetricsRegistry.ROLLOUTS, 10)
+        metrics_registry.increment(MetricsRegistry.ROLLOUTS)
+        for value in [2, 4, 9]:
+            metrics_registry.observe(MetricsRegistry.CANDIDATE_ACTIONS, value)
+        snapshot = metrics_registry.snapshot()
+        self.assertEqual({MetricsRegistry.ROLLOUTS: 11}, snapshot['counters'])
+        self.assertGreater(snapshot['rates'][MetricsRegistry.ROLLOUTS], 0)
+        self.assertEqual({'n': 3, 'mean': 5, 'max': 9}, snapshot['distributions'][MetricsRegistry.CANDIDATE_ACTIONS])
+        metrics_registry.reset()
+        self.assertEqual({}, metrics_registry.snapshot()['counters'])
+
+    def test_game_metrics(self):
+        game = load_game_element('Standard', ['red=Basic', 'green=Advanced']).game
+        metrics_registry = MetricsRegistry()
+        game.listeners.append(metrics_registry)
+        with no_display():
+            game.setup(7)
+            game.play()
+        self.assertIs(metrics_registry, game.players[0].metrics)
+        self.assertEqual(1, len(metrics_registry.game_snapshots))
+        distributions = metrics_registry.game_snapshots[0]['distributions']
+        self.assertGreaterEqual(distributions[MetricsRegistry.CANDIDATE_ACTIONS]['mean'], 1)  # Passing is always possible.
+        self.assertGreater(distributions[MetricsRegistry.PROVOST_MOVE_RANGE]['n'], 0)
+        self.assertGreater(distributions[MetricsRegistry.PAYMENT_ALTERNATIVES]['n'], 0)
+        building_names = {name[len(MetricsRegistry.PAYMENT_ALTERNATIVES + '.'):] for name in distributions
+                          if name.startswith(MetricsRegistry.PAYMENT_ALTERNATIVES + '.')}
+        self.assertTrue(building_names)
+        self.assertLessEqual(building_names, {building.name for building in game.game_element.buildings})
+        self.assertEqual(distributions[MetricsRegistry.PAYMENT_ALTERNATIVES]['n'],
+                         sum(distributions[MetricsRegistry.PAYMENT_ALTERNATIVES + '.' + building_name]['n']
+                             for building_name in building_names))
+
+    def test_game_summary_metrics(self):
+        game_task = (XML_FILE, 'Standard', [('red', 'Basic'), ('green', 'Advanced')], 7, False)
+        self.assertNotIn('metrics', play_game(game_task))
+        game_summary = play_game(game_task, with_metrics=True)
+        self.assertGreater(game_summary['metrics']['distributions'][MetricsRegistry.CANDIDATE_ACTIONS]['n'], 0)
+        self.assertNotIn('timings', game_summary)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+
+from batch_mod.analytics import RunningStats
+from batch_mod.paired import get_ai_scores
+from batch_mod.paired import get_seat_permutations
+from batch_mod.paired import run_paired_games
+from test.game_utils import XML_FILE
+
+
+
+class TestPaired_games(unittest.TestCase):
+    def test_running_stats(self):
+        values = [1.0, 0.0, 0.5, 0.5, 1.0, 0.0, 0.25]
+        running_stats = RunningStats()
+        for value in values:
+            running_stats.add(value)
+        mean = sum(values) / len(values)
+        self.assertAlmostEqual(mean, running_stats.mean)
+        self.assertAlmostEqual(sum((value - mean) ** 2 for value in values) / (len(values) - 1),
+                               running_stats.get_variance())
+        running_stats_merged = RunningStats()
+        for i_values in range(0, len(values), 3):
+            running_stats_part = RunningStats()
+            for value in values[i_values:i_values + 3]:
+                running_stats_part.add(value)
+            running_stats_merged.merge(running_stats_part)
+        self.assertAlmostEqual(running_stats.mean, running_stats_merged.mean)
+        self.assertAlmostEqual(running_stats.get_variance(), running_stats_merged.get_variance())
+
+    def test_get_seat_permutations(self):
+        self.assertEqual(6, len(get_seat_permutations(['Basic', 'Advanced', 'Other'])))
+        self.assertEqual([('Basic', 'Basic', 'Advanced'), ('Basic', 'Advanced', 'Basic'),
+                          ('Advanced', 'Basic', 'Basic')], get_seat_permutations(['Basic', 'Basic', 'Advanced']))
+
+    def test_get_ai_scores(self):
+        game_summary = {'seats': [['red', 'Basic'], ['green', 'Basic'], ['blue', 'Advanced']],
+                        'winners': ['red', 'blue']}
+        self.assertEqual({'Basic': 0.25, 'Advanced': 0.5}, get_ai_scores(game_summary))
+
+    def test_run_paired_games(self):
+        # Both AIs play the same way: with the same setup and seats, the permutations of a group only swap their names.
+        ai_stats = run_paired_games(XML_FILE, 'Standard', ['Basic', 'Advanced'], ['red', 'green'], 8, n_processes=0)
+        for ai_name in ['Basic', 'Advanced']:
+            self.assertEqual(16, ai_stats[ai_name]['n_games'])
+            self.assertAlmostEqual(0.5, ai_stats[ai_name]['score'])
+            self.assertAlmostEqual(0.0, ai_stats[ai_name]['paired_standard_error'])
+            self.assertGreater(ai_stats[ai_name]['unpaired_standard_error'], 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import contextlib
+import io
+import unittest
+from unittest import mock
+
+from game_mod.utils import derive_seed
+from game_mod.utils import Location
+from test.game_utils import load_game_element
+
+
+
+class TestRandom_seed(unittest.TestCase):
+    def setup_game(self, seed):
+        game = load_game_element('Standard', ['red', 'green=Basic', 'blue=Advanced']).game
+        with contextlib.redirect_stdout(io.StringIO()):
+            game.setup(seed)
+        return game
+
+    def get_setup(self, game):
+        return ([building.name for building in game.road.get_buildings()],
+                [sorted(player_building.name for player_building in player.get_player_buildings_by_location(Location.HAND))
+                 for player in game.players],
+                [player.random.random() for player in game.players])
+
+    def test_derive_seed(self):
+        self.assertEqual(derive_seed(7, 'red'), derive_seed(7, 'red'))
+        self.assertNotEqual(derive_seed(7, 'red'), derive_seed(7, 'blue'))
+        self.assertNotEqual(derive_seed(7, 'red'), derive_seed(8, 'red'))
+
+    @mock.patch('builtins.input', lambda *args : 'N')
+    def test_same_seed_same_setup(self):
+        self.assertEqual(self.get_setup(self.setup_game(42)), self.get_setup(self.setup_game(42)))
+
+    @mock.patch('builtins.input', lambda *args : 'N')
+    def test_seed_is_kept(self):
+        game = self.setup_game(None)
+        self.assertIsNotNone(game.seed)
+        seed = game.seed
+        self.assertEqual(self.get_setup(game), self.get_setup(self.setup_game(seed)))
+
+
+if __name__ == '__main__':
+    unittest.main()
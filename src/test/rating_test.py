@@ -0,0 +1,70 @@
+import os
+import tempfile
+import unittest
+
+from batch_mod.journal import ResultsJournal
+from batch_mod.rating import GlickoRatings
+
+
+
+def get_game_summary(ai_names, tot_n_prestige_pts):
+    return {'seats': [[color_player_name, ai_name] for color_player_name, ai_name
+                      in zip(['red', 'green', 'blue'], ai_names)],
+            'tot_n_prestige_pts': tot_n_prestige_pts}
+
+
+class TestRating(unittest.TestCase):
+    def test_update(self):
+        ratings = GlickoRatings()
+        for _i_game in range(20):
+            ratings.update(get_game_summary(['Strong', 'Weak'], [10, 5]))
+        strong_rating, strong_rd, strong_n_games = ratings.get_rating('Strong')
+        weak_rating, weak_rd, weak_n_games = ratings.get_rating('Weak')
+        self.assertGreater(strong_rating, GlickoRatings.INITIAL_RATING)
+        self.assertAlmostEqual(2 * GlickoRatings.INITIAL_RATING, strong_rating + weak_rating)
+        self.assertLess(strong_rd, GlickoRatings.INITIAL_RD)
+        self.assertEqual((20, 20), (strong_n_games, weak_n_games))
+        ratings.update(get_game_summary(['Strong', 'Strong'], [10, 5]))  # No information.
+        self.assertEqual(strong_rating, ratings.get_rating('Strong')[0])
+
+    def test_multiplayer_draw(self):
+        ratings = GlickoRatings()
+        ratings.update(get_game_summary(['A', 'B', 'C'], [7, 7, 3]))
+        self.assertAlmostEqual(ratings.get_rating('A')[0], ratings.get_rating('B')[0])
+        self.assertGreater(ratings.get_rating('A')[0], GlickoRatings.INITIAL_RATING)
+        self.assertLess(ratings.get_rating('C')[0], GlickoRatings.INITIAL_RATING)
+
+    def test_propose_matchups(self):
+        ratings = GlickoRatings()
+        for _i_game in range(30):
+            ratings.update(get_game_summary(['A', 'B'], [5, 5]))
+        self.assertEqual([('A', 'New'), ('B', 'New')], sorted(ratings.propose_matchups(['A', 'B', 'New'], 2, 2)))
+        self.assertEqual([('A', 'B', 'New')], ratings.propose_matchups(['A', 'B', 'New'], 3, 5))
+
+    def test_update_from_journal(self):
+        with tempfile.TemporaryDirectory() as dir_path:
+            journal_file_path = os.path.join(dir_path, 'journal.jsonl')
+            ratings_file_path = os.path.join(dir_path, 'ratings.json')
+            game_summaries = [get_game_summary(['A', 'B'], [i_game % 3, 1]) for i_game in range(10)]
+            ratings = GlickoRatings()
+            for game_summary in game_summaries:
+                ratings.update(game_summary)
+            with ResultsJournal(journal_file_path) as journal:
+                for game_summary in game_summaries[:6]:
+                    journal.write(game_summary)
+            ratings_incremental = GlickoRatings.load(ratings_file_path)
+            self.assertEqual(6, ratings_incremental.update_from_journal(journal_file_path))
+            ratings_incremental.save(ratings_file_path)
+            with ResultsJournal(journal_file_path) as journal:
+                for game_summary in game_summaries[6:]:
+                    journal.write(game_summary)
+            ratings_incremental = GlickoRatings.load(ratings_file_path)
+            self.assertEqual(4, ratings_incremental.update_from_journal(journal_file_path))
+            self.assertEqual(0, ratings_incremental.update_from_journal(journal_file_path))
+        for ai_name in ['A', 'B']:
+            for value, value_incremental in zip(ratings.get_rating(ai_name), ratings_incremental.get_rating(ai_name)):
+                self.assertAlmostEqual(value, value_incremental)
+
+
+if __name__ == '__main__':
+    unittest.main()
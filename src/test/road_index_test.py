@@ -0,0 +1,82 @@
+import unittest
+from game_mod.road import Road
+
+
+
+class MockedBuilding():
+    def __init__(self, allows_to_place_a_worker, color_player=None):
+        self.allows_to_place_a_worker = allows_to_place_a_worker
+        self.color_player = color_player
+
+class MockedGameElement():
+    def __init__(self, buildings, color_players):
+        self.buildings = buildings
+        self.color_players = color_players
+
+
+
+class TestRoad_index(unittest.TestCase):
+    def setUp(self):
+        self.buildings = [MockedBuilding(True), MockedBuilding(False, 'red'), MockedBuilding(True, 'blue'),
+                          MockedBuilding(True), MockedBuilding(False, 'blue')]
+        self.game_element = MockedGameElement(self.buildings, ['red', 'blue'])
+        self.players = ['player red', 'player blue']
+
+    def test_free_slots_setup(self):
+        road = Road(self.game_element, self.players, self.buildings[:3])
+
+        self.assertEqual(road.get_i_free_slots(), [0, 2])
+        self.assertEqual(road.get_i_occupied_slots(), [])
+
+    def test_place_and_remove_worker(self):
+        road = Road(self.game_element, self.players, [self.buildings[0], self.buildings[2], self.buildings[3]])
+        road.place_worker(2, 'player red')
+        road.place_worker(0, 'player blue')
+
+        self.assertEqual(road.get_i_free_slots(), [1])
+        self.assertEqual(road.get_i_occupied_slots(), [0, 2])
+        self.assertEqual(road.get_i_occupied_slots(1), [0])
+        self.assertEqual(road.get_worker(0), 'player blue')
+        self.assertEqual(road.remove_worker(2), 'player red')
+        self.assertEqual(road.get_i_free_slots(), [1, 2])
+
+    def test_append_building(self):
+        road = Road(self.game_element, self.players, self.buildings[:1])
+        road.append_building(self.buildings[1])
+        road.append_building(self.buildings[2])
+
+        self.assertEqual(len(road), 3)
+        self.assertEqual(road.get_i_free_slots(), [0, 2])
+        self.assertEqual(road.get_i_road_buildings_of_color_player('blue'), [(2, self.buildings[2])])
+
+    def test_replace_building_with_worker(self):
+        road = Road(self.game_element, self.players, self.buildings[2:4])
+        road.place_worker(0, 'player red')
+        road.replace_building(0, self.buildings[4])
+
+        self.assertEqual(road.get_building(0), self.buildings[4])
+        self.assertEqual(road.get_effect_building(0), self.buildings[2])
+        road.remove_worker(0)
+        self.assertEqual(road.get_effect_building(0), self.buildings[4])
+        self.assertIsNone(road.get_replaced_building(0))
+        self.assertEqual(road.get_i_free_slots(), [1])
+
+    def test_replace_building_without_worker(self):
+        road = Road(self.game_element, self.players, self.buildings[:1])
+        road.replace_building(0, self.buildings[1])
+
+        self.assertIsNone(road.get_replaced_building(0))
+        self.assertEqual(road.get_i_road_buildings_of_color_player('red'), [(0, self.buildings[1])])
+        self.assertEqual(road.get_i_free_slots(), [])
+
+    def test_copy(self):
+        road = Road(self.game_element, self.players, self.buildings[:1])
+        road_copy = road.copy()
+        road_copy.place_worker(0, 'player red')
+
+        self.assertIsNone(road.get_worker(0))
+        self.assertEqual(road.get_i_free_slots(), [0])
+
+
+if __name__ == '__main__':
+    unittest.main()
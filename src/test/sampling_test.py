@@ -0,0 +1,27 @@
+import time
+import unittest
+
+from benchmark_mod.sampling import SamplingProfiler
+
+
+def spin(duration):
+    time_end = time.perf_counter() + duration
+    while time.perf_counter() < time_end:
+        pass
+
+
+class TestSampling(unittest.TestCase):
+    def test_collapsed_stacks(self):
+        with SamplingProfiler(0.001) as sampling_profiler:
+            spin(0.2)
+        self.assertGreater(sampling_profiler.get_n_samples(), 0)
+        lines = sampling_profiler.txt_collapsed_stacks().splitlines()
+        self.assertTrue(any('sampling_test.py:test_collapsed_stacks;sampling_test.py:spin ' in line for line in lines))
+        self.assertEqual(sampling_profiler.get_n_samples(), sum(int(line.rsplit(' ', 1)[1]) for line in lines))
+        self_count, tot_count = sampling_profiler.get_function_counts()['sampling_test.py:test_collapsed_stacks']
+        self.assertEqual(sampling_profiler.get_n_samples(), tot_count)
+        self.assertIn('sampling_test.py:spin', sampling_profiler.txt_hot_functions())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import asyncio
+import os
+import sys
+import tempfile
+import unittest
+
+from server_mod.server import GameServer
+from test.game_utils import XML_FILE
+
+
+async def play_client(open_connection, request):
+    reader, writer = await open_connection()
+    writer.write((request + '\n').encode('utf-8'))
+    await writer.drain()
+    text = (await reader.read()).decode('utf-8')
+    writer.close()
+    return text
+
+
+class TestServer(unittest.TestCase):
+    def setUp(self):
+        self.game_server = GameServer(XML_FILE, 'Beginner', move_timeout=0.02)
+
+    def tearDown(self):
+        self.game_server.close()
+
+    def test_concurrent_games(self):
+        async def play_clients():
+            server = await self.game_server.start_tcp()
+            port = server.sockets[0].getsockname()[1]
+            requests = ['red green=Basic seed=1', 'blue=Advanced orange seed=2'] * 3 + ['purple seed=3']
+            texts = await asyncio.gather(*[play_client(lambda: asyncio.open_connection('127.0.0.1', port), request)
+                                           for request in requests])
+            server.close()
+            await server.wait_closed()
+            return texts
+        texts = asyncio.run(play_clients())
+        self.assertTrue(texts[-1].startswith('Error:'))
+        # The games are interleaved without sharing their states: the games of the same seed are the same.
+        self.assertEqual(texts[0], texts[2])
+        self.assertEqual(texts[1], texts[3])
+        self.assertNotEqual(texts[0], texts[1])
+        for text in texts[:-1]:
+            self.assertIn('The game starts.', text)
+            self.assertIn('No answer in time: a random move is played.', text)
+        self.assertEqual(6, self.game_server.n_games_played)
+        self.assertEqual(0, self.game_server.n_open_games)
+
+    def test_standard_streams(self):
+        stdout, stdin = sys.stdout, sys.stdin
+        # The standard streams are only redirected while the server serves.
+        self.assertIs(stdout, sys.stdout)
+
+        async def start():
+            server = await self.game_server.start_tcp()
+            server.close()
+            await server.wait_closed()
+        asyncio.run(start())
+        self.assertIsNot(stdout, sys.stdout)
+        self.game_server.close()
+        self.assertIs(stdout, sys.stdout)
+        self.assertIs(stdin, sys.stdin)
+
+    def test_full_server(self):
+        self.game_server.close()
+        self.game_server = GameServer(XML_FILE, 'Beginner', move_timeout=0.02, max_n_games=1)
+
+        async def play_clients():
+            server = await self.game_server.start_tcp()
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            while self.game_server.n_open_games == 0:
+                await asyncio.sleep(0.001)
+            # The only game is open (its players not yet sent): another connection is refused.
+            refused_text = await play_client(lambda: asyncio.open_connection('127.0.0.1', port), 'red=Basic green=Basic')
+            writer.write(b'red=Basic green=Advanced seed=4\n')
+            text = (await reader.read()).decode('utf-8')
+            writer.close()
+            server.close()
+            await server.wait_closed()
+            return refused_text, text
+        refused_text, text = asyncio.run(play_clients())
+        self.assertEqual('Error: the server is full (1 games open).\n', refused_text)
+        self.assertIn('The game starts.', text)
+        self.assertEqual(1, self.game_server.n_connections_refused)
+        self.assertEqual(1, self.game_server.n_games_played)
+
+    @unittest.skipUnless(hasattr(asyncio, 'start_unix_server'), 'Unix sockets are not available.')
+    def test_unix_socket_game_of_ais(self):
+        with tempfile.TemporaryDirectory() as directory_path:
+            socket_file_path = os.path.join(directory_path, 'server.sock')
+
+            async def play_clients():
+                server = await self.game_server.start_unix(socket_file_path)
+                texts = await asyncio.gather(*[play_client(lambda: asyncio.open_unix_connection(socket_file_path),
+                                                           'red=Basic green=Advanced seed=4') for _i in range(2)])
+                server.close()
+                await server.wait_closed()
+                return texts
+            texts = asyncio.run(play_clients())
+        self.assertEqual(texts[0], texts[1])
+        self.assertIn('The game starts.', texts[0])
+        self.assertNotIn('No answer in time', texts[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
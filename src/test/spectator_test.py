@@ -0,0 +1,114 @@
+import threading
+import unittest
+
+from game_mod.listener import GameListener
+from game_mod.utils import no_display
+from spectator_mod.bus import DeltaBus
+from spectator_mod.bus import Subscription
+from spectator_mod.deltas import PROVOST
+from spectator_mod.deltas import SLOT
+from spectator_mod.deltas import StateDeltaPublisher
+from spectator_mod.deltas import get_state_view
+from test.game_utils import load_game_element
+
+
+class LateSubscriber(GameListener):
+    """Listener subscribing to a bus at the beginning of a turn."""
+
+    def __init__(self, bus, n_turns):
+        self.bus = bus
+        self.n_turns = n_turns
+        self.subscription = None
+        self.n_deltas_published = None
+
+    def turn_begin(self, game):
+        if game.n_turns == self.n_turns:
+            self.n_deltas_published = self.bus.n_deltas_published
+            self.subscription = self.bus.subscribe(1 << 20)
+
+
+class TestSpectator(unittest.TestCase):
+    def test_policies(self):
+        bus = DeltaBus()
+        coalescing_subscription = bus.subscribe(4, Subscription.COALESCE)
+        dropping_subscription = bus.subscribe(4, Subscription.DROP)
+        for i_delta in range(10):
+            bus.publish([(('a',), i_delta), (('b', i_delta % 2), i_delta)])
+        self.assertEqual([(('b', 0), 8), (('a',), 9), (('b', 1), 9)], coalescing_subscription.poll())
+        self.assertEqual(0, coalescing_subscription.n_dropped)
+        self.assertEqual([(('a',), 8), (('b', 0), 8), (('a',), 9), (('b', 1), 9)], dropping_subscription.poll())
+        self.assertEqual(16, dropping_subscription.n_dropped)
+        # A new subscriber gets the current state first; a closed one gets nothing more.
+        self.assertEqual({('a',): 9, ('b', 0): 8, ('b', 1): 9}, dict(bus.subscribe().poll()))
+        dropping_subscription.close()
+        bus.publish([(('a',), 10)])
+        self.assertEqual([], dropping_subscription.poll())
+        self.assertEqual([(('a',), 10)], coalescing_subscription.poll())
+        # Beyond the deltas kept by the bus, a coalescing subscriber gets the state and a dropping one the deltas kept.
+        small_bus = DeltaBus(2)
+        coalescing_subscription = small_bus.subscribe(4, Subscription.COALESCE)
+        dropping_subscription = small_bus.subscribe(4, Subscription.DROP)
+        for i_delta in range(10):
+            small_bus.publish([(('a', i_delta % 3), i_delta)])
+        self.assertEqual({('a', 0): 9, ('a', 1): 7, ('a', 2): 8}, dict(coalescing_subscription.poll()))
+        self.assertEqual([(('a', 0), 6), (('a', 1), 7), (('a', 2), 8), (('a', 0), 9)], dropping_subscription.poll())
+        self.assertEqual(6, dropping_subscription.n_dropped)
+
+    def test_spectators(self):
+        game = load_game_element('Standard', ['red=Basic', 'green=Advanced', 'blue=Basic']).game
+        state_delta_publisher = StateDeltaPublisher()
+        game.listeners.append(state_delta_publisher)
+        bus = state_delta_publisher.bus
+        slow_subscriptions = [bus.subscribe(256, Subscription.COALESCE) for _i_subscription in range(1000)]
+        dropping_subscription = bus.subscribe(16, Subscription.DROP)
+        reader_subscription = bus.subscribe(1 << 20)
+        reader_state, n_slots_occupied, n_provost_moves = dict(), [0], [0]
+
+        def read_deltas():
+            while not reader_subscription.is_closed():
+                for key, value in reader_subscription.get(1.0):
+                    n_slots_occupied[0] += key[0] == SLOT and value is not None
+                    n_provost_moves[0] += key == (PROVOST,) and reader_state.get(key) is not None
+                    reader_state[key] = value
+
+        reader_thread = threading.Thread(target=read_deltas)
+        reader_thread.start()
+        with no_display():
+            game.setup(3)
+            game.play()
+        reader_subscription.close()
+        reader_thread.join()
+        state_view = get_state_view(game)
+        # A subscriber reading along the game and a slow one rebuild the final state from the deltas.
+        self.assertEqual(state_view, {key: value for key, value in reader_state.items() if key in state_view})
+        self.assertEqual(0, reader_subscription.n_dropped)
+        self.assertGreater(n_provost_moves[0], 0)
+        self.assertGreater(n_slots_occupied[0], 0)
+        slow_state = dict(slow_subscriptions[0].get())
+        self.assertEqual(0, slow_subscriptions[0].n_dropped)
+        self.assertGreater(slow_subscriptions[0].n_coalesced, 0)
+        self.assertEqual(state_view, {key: value for key, value in slow_state.items() if key in state_view})
+        self.assertEqual(16, len(dropping_subscription.get()))
+        self.assertGreater(dropping_subscription.n_dropped, 0)
+
+    def test_late_spectator(self):
+        game = load_game_element('Standard', ['red=Basic', 'green=Advanced', 'blue=Basic']).game
+        state_delta_publisher = StateDeltaPublisher()
+        late_subscriber = LateSubscriber(state_delta_publisher.bus, 4)
+        game.listeners.extend([late_subscriber, state_delta_publisher])
+        with no_display():
+            game.setup(5)
+            game.play()
+        # Nothing is published before the first subscription; then the subscriber catches up with the state.
+        self.assertEqual(0, late_subscriber.n_deltas_published)
+        state_view = get_state_view(game)
+        late_state = dict(late_subscriber.subscription.get())
+        self.assertEqual(state_view, {key: value for key, value in late_state.items() if key in state_view})
+        self.assertEqual(1, state_delta_publisher.bus.n_open_subscriptions)
+        late_subscriber.subscription.close()
+        late_subscriber.subscription.close()
+        self.assertEqual(0, state_delta_publisher.bus.n_open_subscriptions)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+from unittest import mock
+
+from batch_mod import compare
+from batch_mod.batch import play_games
+from batch_mod.compare import get_score
+from batch_mod.compare import compare_ais
+from batch_mod.compare import Sprt
+from test.game_utils import XML_FILE
+
+
+
+class TestSprt(unittest.TestCase):
+    def run_sprt(self, scores):
+        sprt = Sprt(0.5, 0.6, 0.05, 0.05)
+        for n_games, score in enumerate(scores, 1):
+            sprt.add(score)
+            if sprt.get_decision() is not None:
+                return sprt.get_decision(), n_games
+        return None, len(scores)
+
+    def test_decisions(self):
+        self.assertEqual((Sprt.BETTER, 20), self.run_sprt([1] * 100))
+        self.assertEqual((Sprt.WORSE, 20), self.run_sprt([0] * 100))
+        self.assertEqual((None, 100), self.run_sprt([0.5] * 100))
+        self.assertEqual((Sprt.H0, 146), self.run_sprt([0.5] * 200))
+        self.assertEqual(Sprt.BETTER, self.run_sprt([1, 1, 0] * 100)[0])  # Score 2/3 > 0.6.
+        self.assertEqual(Sprt.WORSE, self.run_sprt([0, 0, 1] * 100)[0])  # Score 1/3 < 0.4.
+        with self.assertRaises(ValueError):
+            Sprt(0.5, 0.5)
+
+    def test_get_score(self):
+        game_summary = {'seats': [['red', 'Basic'], ['green', 'Basic']], 'winners': ['red']}
+        self.assertEqual((1.0, 0.0), (get_score(game_summary, 'red'), get_score(game_summary, 'green')))
+        game_summary['winners'] = ['red', 'green']
+        self.assertEqual(0.5, get_score(game_summary, 'green'))
+
+    def test_compare_ais(self):
+        result = compare_ais(XML_FILE, 'Beginner', 'Basic', 'Advanced', 6, n_processes=0)
+        self.assertEqual(6, result['n_games'])
+        self.assertIsNone(result['decision'])
+        self.assertTrue(0 <= result['score'] <= 1)
+        with self.assertRaises(ValueError):
+            compare_ais(XML_FILE, 'Beginner', 'Basic', 'Advanced', 0, n_processes=0)
+
+    def test_compare_ais_in_seed_order(self):
+        def play_games_reversed(game_tasks, n_processes=None):
+            return reversed(list(play_games(game_tasks, 0)))
+        sprt = Sprt(0.5, 0.9)
+        result = compare_ais(XML_FILE, 'Beginner', 'Basic', 'Advanced', 8, sprt=sprt, n_processes=0)
+        # The games finished in the reverse order of the seeds are added to the test in the order of the seeds.
+        with mock.patch.object(compare, 'play_games', play_games_reversed):
+            self.assertEqual(result, compare_ais(XML_FILE, 'Beginner', 'Basic', 'Advanced', 8, sprt=Sprt(0.5, 0.9),
+                                                 n_processes=0))
+
+
+if __name__ == '__main__':
+    unittest.main()
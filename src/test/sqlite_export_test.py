@@ -0,0 +1,42 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from batch_mod.batch import play_game
+from batch_mod.sqlite_export import SqliteExporter
+from test.game_utils import XML_FILE
+
+
+
+class TestSqlite_export(unittest.TestCase):
+    SEATS = [('red', 'Basic'), ('green', 'Advanced'), ('blue', 'Basic')]
+
+    def test_export(self):
+        game_summaries = [play_game((XML_FILE, version_name, TestSqlite_export.SEATS, seed, True))
+                          for version_name in ['Standard', 'Beginner'] for seed in range(3)]
+        with tempfile.TemporaryDirectory() as dir_path:
+            db_file_path = os.path.join(dir_path, 'results.db')
+            with SqliteExporter(db_file_path, 4) as exporter:
+                for game_summary in game_summaries[:4]:
+                    exporter.export(game_summary)
+            with SqliteExporter(db_file_path, 4) as exporter:
+                for game_summary in game_summaries[4:]:
+                    exporter.export(game_summary)
+            connection = sqlite3.connect(db_file_path)
+            self.assertEqual([(game_summary['seed'], game_summary['version'], 3, game_summary['n_turns'])
+                              for game_summary in game_summaries],
+                             connection.execute('SELECT seed, version, n_players, n_turns FROM games ORDER BY id')
+                             .fetchall())
+            self.assertEqual(sum(len(game_summary['winners']) for game_summary in game_summaries),
+                             connection.execute('SELECT SUM(is_winner) FROM seats').fetchone()[0])
+            self.assertEqual(sum(len(game_summary['events']) for game_summary in game_summaries),
+                             connection.execute('SELECT COUNT(*) FROM events').fetchone()[0])
+            self.assertGreater(connection.execute('SELECT COUNT(*) FROM events WHERE event = \'construct\'')
+                               .fetchone()[0], 0)
+            self.assertEqual('wal', connection.execute('PRAGMA journal_mode').fetchone()[0])
+            connection.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
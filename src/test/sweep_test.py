@@ -0,0 +1,58 @@
+import tempfile
+import unittest
+from unittest import mock
+
+from batch_mod import batch
+from batch_mod.sweep import compile_variant
+from batch_mod.sweep import get_grid_variants
+from batch_mod.sweep import run_sweep
+from game_mod.game import GameElement
+from game_mod.utils import no_display
+from test.game_utils import XML_FILE
+
+
+
+class TestSweep(unittest.TestCase):
+    SEATS = [('red', 'Basic'), ('green', 'Advanced')]
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_get_grid_variants(self):
+        self.assertEqual([{'a': '1', 'b': 'x'}, {'a': '1', 'b': 'y'}, {'a': '2', 'b': 'x'}, {'a': '2', 'b': 'y'}],
+                         get_grid_variants({'b': ['x', 'y'], 'a': ['1', '2']}))
+
+    def test_compile_variant(self):
+        overrides = {'setup/setup_player/n_cards_in_hand': '4', 'phase_income/gain/n_deniers': '3'}
+        xml_file_path = compile_variant(XML_FILE, overrides, self.tmp_dir.name)
+        self.assertEqual(xml_file_path, compile_variant(XML_FILE, overrides, self.tmp_dir.name))
+        self.assertNotEqual(xml_file_path, compile_variant(XML_FILE, {}, self.tmp_dir.name))
+        with no_display():
+            game_element = GameElement(['main.py', xml_file_path, 'Standard', 'red=Basic', 'green=Basic'])
+        self.assertEqual(4, game_element.n_cards_in_hand)
+        self.assertEqual(3, game_element.phases[1].n_deniers)
+        with self.assertRaises(Exception):
+            compile_variant(XML_FILE, {'setup/no_element': '1'}, self.tmp_dir.name)
+
+    def test_run_sweep_cache(self):
+        grid = {'setup/setup_player/n_cards_in_hand': ['3', '4']}
+        variant_stats = run_sweep(XML_FILE, grid, 'Standard', TestSweep.SEATS, 3, self.tmp_dir.name, n_processes=0)
+        self.assertEqual([{'setup/setup_player/n_cards_in_hand': '3'}, {'setup/setup_player/n_cards_in_hand': '4'}],
+                         [overrides for overrides, stats in variant_stats])
+        for overrides, stats in variant_stats:
+            self.assertEqual(3, stats['n_games'])
+            self.assertEqual(6, stats['scores']['n'])
+        grid['setup/setup_player/n_cards_in_hand'].append('5')
+        with mock.patch.object(batch, 'play_game', wraps=batch.play_game) as play_game:
+            variant_stats_rerun = run_sweep(XML_FILE, grid, 'Standard', TestSweep.SEATS, 3, self.tmp_dir.name,
+                                            n_processes=0)
+        self.assertEqual(3, play_game.call_count)  # Only the new variant is simulated.
+        self.assertEqual(variant_stats, variant_stats_rerun[:2])
+        self.assertEqual(3, variant_stats_rerun[2][1]['n_games'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import json
+import os
+import tempfile
+import unittest
+
+from batch_mod.batch import run_batch
+from batch_mod.journal import ResultsJournal
+from game_mod.timing import GameTimer
+from game_mod.timing import LatencyHistogram
+from game_mod.utils import no_display
+from test.game_utils import XML_FILE
+from test.game_utils import load_game_element
+
+
+class TestTiming(unittest.TestCase):
+    SEATS = [('red', 'Basic'), ('green', 'Advanced')]
+
+    def test_latency_histogram(self):
+        histogram = LatencyHistogram()
+        for duration in [0.5e-6, 3e-6, 3e-6, 100e-6]:
+            histogram.add(duration)
+        self.assertEqual([1, 0, 2, 0, 0, 0, 0, 1], histogram.ns)
+        self.assertAlmostEqual(4e-6, histogram.get_percentile(0.5))
+        self.assertAlmostEqual(100e-6, histogram.get_percentile(1.0))
+        other_histogram = LatencyHistogram.from_dict(json.loads(json.dumps(histogram.to_dict())))
+        other_histogram.add(1e-3)
+        histogram.merge(other_histogram)
+        self.assertEqual(9, histogram.get_n())
+        self.assertAlmostEqual(1e-3, histogram.max_time)
+
+    def test_batch_timings(self):
+        with tempfile.TemporaryDirectory() as directory_path:
+            journal_file_path = os.path.join(directory_path, 'journal.jsonl')
+            game_timer = GameTimer()
+            self.assertEqual(3, run_batch(journal_file_path, XML_FILE, 'Standard', TestTiming.SEATS, 0, 3, 0,
+                                          game_timer=game_timer))
+            game_summaries = list(ResultsJournal.read(journal_file_path))
+        self.assertNotIn('timings', game_summaries[0])
+        tot_n_turns = sum(game_summary['n_turns'] for game_summary in game_summaries)
+        self.assertEqual(list(range(1, 7)), sorted(game_timer.phase_histograms))
+        for histogram in game_timer.phase_histograms.values():
+            self.assertEqual(tot_n_turns, histogram.get_n())
+        self.assertEqual({'red', 'green'}, set(game_timer.player_histograms))
+        self.assertGreater(game_timer.player_histograms['red']['choose_action'].get_n(), 0)
+        self.assertIn('red choose_action', game_timer.txt_timings())
+
+    def test_setup_decisions(self):
+        game = load_game_element('Standard', ['red=Basic', 'green=Advanced']).game
+        game_timer = GameTimer()
+        game_timer.attach(game)
+        with no_display():
+            game.setup(0)
+        # The players are asked to discard their hands during the setup, before the game begins.
+        for color_player_name in ['red', 'green']:
+            self.assertGreater(game_timer.player_histograms[color_player_name]['choose_discard_hand_for_new'].get_n(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+import json
+import os
+import tempfile
+import unittest
+
+from game_mod.trace import ChromeTracer
+from game_mod.utils import no_display
+from test.game_utils import load_game_element
+
+
+class TestTrace(unittest.TestCase):
+    def test_nested_spans(self):
+        game = load_game_element('Standard', ['red=Basic', 'green=Advanced']).game
+        chrome_tracer = ChromeTracer()
+        chrome_tracer.attach(game)
+        with no_display():
+            game.setup(5)
+            game.play()
+        with tempfile.TemporaryDirectory() as directory_path:
+            trace_file_path = os.path.join(directory_path, 'trace.json')
+            chrome_tracer.write(trace_file_path)
+            with open(trace_file_path, encoding='utf-8') as trace_file:
+                events = json.load(trace_file)['traceEvents']
+        # The spans are well nested: game > turn > phase > effect or decision (or game > decision during the setup).
+        span_categories = list()
+        categories = {'game': set(), 'turn': {'game'}, 'phase': {'turn'}, 'effect': {'phase'},
+                      'decision': {'game', 'phase', 'effect'}}
+        for event in events:
+            if event['ph'] == 'B':
+                self.assertIn(span_categories[-1] if span_categories else 'game', categories[event['cat']] or {'game'})
+                span_categories.append(event['cat'])
+            else:
+                self.assertEqual(span_categories.pop(), event['cat'])
+        self.assertEqual([], span_categories)
+        self.assertEqual(game.n_turns, sum(event['cat'] == 'turn' and event['ph'] == 'B' for event in events))
+        self.assertTrue(any(event['cat'] == 'effect' for event in events))
+        self.assertTrue(any(event['name'] == 'choose_action' for event in events))
+        # The players are asked to discard their hands during the setup, before the first turn.
+        self.assertEqual('choose_discard_hand_for_new', events[1]['name'])
+        self.assertEqual(sorted(event['ts'] for event in events), [event['ts'] for event in events])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import concurrent.futures
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from batch_mod import batch
+from batch_mod.batch import play_game
+from batch_mod.batch import play_games
+from batch_mod.watchdog import MemoryWatchdog
+from batch_mod.watchdog import get_memory_usage
+from batch_mod.metrics_server import BatchMetrics
+from test.game_utils import XML_FILE
+
+
+def play_game_or_exit(game_task, with_timings=False, with_metrics=False):
+    # The process exits (as if killed) at the first game of seed 2 and at each game of seed 3.
+    seed = game_task[3]
+    if seed == 2 and not os.path.exists(TestWatchdog.exit_file_path):
+        open(TestWatchdog.exit_file_path, 'w').close()
+        os._exit(1)
+    if seed == 3:
+        os._exit(1)
+    return play_game(game_task, with_timings, with_metrics)
+
+
+class TestWatchdog(unittest.TestCase):
+    SEATS = [('red', 'Basic'), ('green', 'Advanced')]
+    exit_file_path = None
+
+    def test_growth_site(self):
+        registry = list()
+        with MemoryWatchdog(n_games_between_snapshots=2, n_top_sites=3) as memory_watchdog:
+            for _i_game in range(4):
+                registry.extend(bytearray(1000) for _i in range(100))  # Growing like a registry of a class.
+                memory_watchdog.game_done()
+        self.assertEqual([2, 4], [n_games for n_games, _traced_memory, _statistic_diffs in memory_watchdog.reports])
+        self.assertLess(memory_watchdog.reports[0][1], memory_watchdog.reports[1][1])
+        self.assertIn('watchdog_test.py', memory_watchdog.reports[1][2][0].traceback[0].filename)
+        self.assertIn('After 4 game(s)', memory_watchdog.txt_reports())
+
+    def test_recycled_pool(self):
+        self.assertGreaterEqual(get_memory_usage(), 0)
+        game_tasks = [(XML_FILE, 'Beginner', TestWatchdog.SEATS, seed, False) for seed in range(6)]
+        # Each process exceeds the memory ceiling: its pool is retired at its first game finished, once the games
+        # already submitted (4 per process) are finished; the next games go to a new pool and no game is lost.
+        batch_metrics = BatchMetrics()
+        seeds = sorted(game_summary['seed'] for _game_task, game_summary
+                       in play_games(game_tasks, 1, 1, batch_metrics))
+        self.assertEqual(list(range(6)), seeds)
+        self.assertEqual(2, len(batch_metrics.worker_busy_times))  # A process per pool.
+
+    def test_broken_pool(self):
+        game_tasks = [(XML_FILE, 'Beginner', TestWatchdog.SEATS, seed, False) for seed in [0, 1, 2, 4]]
+        with tempfile.TemporaryDirectory() as directory_path, \
+                mock.patch.object(batch, 'play_game', play_game_or_exit):
+            TestWatchdog.exit_file_path = os.path.join(directory_path, 'exited')
+            # The games lost with the pool broken by the exit are played again by a new pool.
+            batch_metrics = BatchMetrics()
+            seeds = sorted(game_summary['seed'] for _game_task, game_summary
+                           in play_games(game_tasks, 1, None, batch_metrics))
+            self.assertEqual([0, 1, 2, 4], seeds)
+            self.assertTrue(os.path.exists(TestWatchdog.exit_file_path))
+            self.assertEqual(2, len(batch_metrics.worker_busy_times))
+            self.assertEqual(0, batch_metrics.n_games_in_flight)
+            # A game breaking its pool each time is given up after two retries, but not the games lost with it:
+            # they are lost once then played alone, as the game breaking the pool (lost 3 more times).
+            game_tasks = [(XML_FILE, 'Beginner', TestWatchdog.SEATS, seed, False) for seed in [3, 0, 1, 4]]
+            batch_metrics = BatchMetrics()
+            seeds = list()
+            with self.assertRaises(concurrent.futures.process.BrokenProcessPool):
+                for _game_task, game_summary in play_games(game_tasks, 1, None, batch_metrics):
+                    seeds.append(game_summary['seed'])
+            self.assertEqual([0, 1, 4], sorted(seeds))
+            self.assertEqual(4 + 3, batch_metrics.n_games_lost)
+
+if __name__ == '__main__':
+    unittest.main()